@@ -2,20 +2,74 @@
 
 Maya 用の PySide テンプレートウィンドウプロジェクトです。
 WorkspaceControl を使用したドッキング可能かつ復元可能なウィンドウのテンプレートです。
+
+start, restart, restore, close, warm_up はモジュールレベルの __getattr__ により初回アクセス時に import されます。
+パッケージを import しただけでは Qt や window モジュールは読み込まれないため、
+Maya 起動時の userSetup などから import してもコストはほとんどかかりません。
 """
 
+import importlib
 import logging
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from ._metadata import __author__, __version__
-from .app.main import restart, restore, start
 
+if TYPE_CHECKING:
+    from .app.main import close, restart, restore, start
+    from .app.warm_pool import warm_up
+
+# 遅延 import する属性名とその属性を持つモジュール（パッケージからの相対名）
+_LAZY_ATTRIBUTES: Dict[str, str] = {
+    'start': '.app.main',
+    'restart': '.app.main',
+    'restore': '.app.main',
+    'close': '.app.main',
+    'warm_up': '.app.warm_pool',
+}
+
+
+def __getattr__(name: str) -> Any:
+    """遅延 import 対象の属性を初回アクセス時に解決する
+
+    解決した属性はモジュールの globals にキャッシュしません。
+    restart 時に app.main が reload されても、常に最新の関数を返すためです。
+
+    Args:
+        name (str): 属性名
+
+    Returns:
+        Any: 解決された属性
 
-def setup_logging(log_level: int = logging.INFO) -> logging.Logger:
+    Raises:
+        AttributeError: 遅延 import 対象でない属性の場合
+    """
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    module = importlib.import_module(module_name, __name__)
+    return getattr(module, name)
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
+def setup_logging(
+    log_level: int = logging.INFO,
+    log_panel: bool = False,
+    capacity: Optional[int] = None,
+    script_editor_level: Optional[int] = logging.WARNING,
+) -> logging.Logger:
     """パッケージ用のロギング設定を行う
 
     Args:
         log_level (int): ログレベル（logging.DEBUG, logging.INFO など）
                          Maya では通常 INFO レベルがデフォルトです
+        log_panel (bool): True の場合、ログをスクリプトエディタではなくウィンドウ内のログパネル（Dev > Log Panel）に送る
+                          キューハンドラーを追加します。False の場合は既存の設定を変更しません
+        capacity (Optional[int]): ログパネルのリングバッファの容量（レコード数）。None の場合は既定値
+        script_editor_level (Optional[int]): ログパネルを使う場合でもスクリプトエディタに送る最低のレベル。
+                                             None の場合はすべてログパネルだけに送ります
 
     Returns:
         logging.Logger: 設定されたパッケージロガー
@@ -26,17 +80,31 @@ def setup_logging(log_level: int = logging.INFO) -> logging.Logger:
         logger.addHandler(logging.NullHandler()) が推奨されますが、
         Maya専用ツールでは実質的に無意味です。
 
+        ログパネルのハンドラーはメッセージを整形せずにリングバッファに入れるだけなので、
+        デバッグログを大量に出してもメインスレッドの負荷はほとんど増えません（log_handler モジュールを参照）。
+
     Examples:
         >>> # 基本的な使用方法（INFO レベル）
         >>> logger = setup_logging()
 
         >>> # デバッグ情報も出力したい場合
         >>> logger = setup_logging(logging.DEBUG)
+
+        >>> # デバッグ情報をログパネルに出力し、スクリプトエディタには WARNING 以上だけを出す場合
+        >>> logger = setup_logging(logging.DEBUG, log_panel=True)
     """
     # パッケージロガーのレベルを設定
     logger = logging.getLogger(__name__)  # __init__.py では __name__ が直接パッケージ名
     logger.setLevel(log_level)
+    if log_panel:
+        from . import log_handler
+
+        log_handler.install(
+            logger,
+            capacity=log_handler.DEFAULT_CAPACITY if capacity is None else capacity,
+            script_editor_level=script_editor_level,
+        )
     return logger
 
 
-__all__ = ['start', 'restart', 'restore', 'setup_logging', '__version__', '__author__']
+__all__ = ['start', 'restart', 'restore', 'close', 'warm_up', 'setup_logging', '__version__', '__author__']
@@ -0,0 +1,110 @@
+"""Qt バインディングの遅延解決
+
+PySide6 / PySide2 のどちらを使うかを最初に必要になった時点で一度だけ判定します。
+パッケージの import 時に Qt や shiboken を読み込まないようにするためのモジュールです。
+
+Note:
+    QMainWindow の継承などクラス定義時に Qt が必要なモジュール（window.py など）は
+    従来どおりモジュール先頭で PySide6→PySide2 のフォールバック import を行ってください。
+    このモジュールは関数内でのみ Qt を使う箇所から利用することを想定しています。
+"""
+
+import importlib
+from importlib import util as importlib_util
+from types import ModuleType
+from typing import Optional, Type, TypeVar
+
+_BINDINGS = (('PySide6', 'shiboken6'), ('PySide2', 'shiboken2'))
+
+_binding: Optional[str] = None
+_shiboken: Optional[str] = None
+
+T = TypeVar('T')
+
+
+def binding_name() -> str:
+    """使用する Qt バインディング名を返す
+
+    モジュールの検索のみを行い、実際の import は行いません。
+
+    Returns:
+        str: 'PySide6' または 'PySide2'
+
+    Raises:
+        ImportError: どちらのバインディングも見つからない場合
+    """
+    global _binding, _shiboken
+    if _binding is None:
+        for qt_name, shiboken_name in _BINDINGS:
+            if importlib_util.find_spec(qt_name) is not None:
+                _binding, _shiboken = qt_name, shiboken_name
+                break
+        else:
+            raise ImportError('PySide6 / PySide2 のいずれも見つかりません')
+    return _binding
+
+
+def import_qt_module(name: str) -> ModuleType:
+    """Qt のサブモジュールを import する
+
+    Args:
+        name (str): サブモジュール名（'QtWidgets', 'QtCore' など）
+
+    Returns:
+        ModuleType: import されたモジュール
+    """
+    return importlib.import_module(f'{binding_name()}.{name}')
+
+
+def wrap_instance(ptr: int, widget_type: Type[T]) -> T:
+    """shiboken の wrapInstance を遅延 import して実行する
+
+    Args:
+        ptr (int): C++ オブジェクトのポインタ
+        widget_type (Type[T]): ラップするクラス
+
+    Returns:
+        T: ラップされたインスタンス
+    """
+    return _import_shiboken().wrapInstance(ptr, widget_type)
+
+
+def is_valid(obj: object) -> bool:
+    """Python ラッパーが指す C++ オブジェクトが生存しているかを返す
+
+    Args:
+        obj (object): Qt オブジェクト
+
+    Returns:
+        bool: C++ オブジェクトが削除されていない場合 True
+    """
+    return _import_shiboken().isValid(obj)
+
+
+def cpp_pointer(obj: object) -> int:
+    """Qt オブジェクトの C++ ポインタを返す
+
+    Args:
+        obj (object): Qt オブジェクト
+
+    Returns:
+        int: C++ オブジェクトのアドレス
+    """
+    return _import_shiboken().getCppPointer(obj)[0]
+
+
+def delete(obj: object) -> None:
+    """Qt オブジェクトの C++ オブジェクトを即座に削除する
+
+    deleteLater() と異なり、destroyed シグナルは呼び出し中に同期的に発行されます。
+
+    Args:
+        obj (object): Qt オブジェクト
+    """
+    _import_shiboken().delete(obj)
+
+
+def _import_shiboken() -> ModuleType:
+    """使用中の Qt バインディングに対応する shiboken を import する"""
+    binding_name()
+    return importlib.import_module(_shiboken)  # type: ignore[arg-type]
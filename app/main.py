@@ -1,76 +1,180 @@
+import functools
 import logging
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Optional, Type
 
-from maya import cmds
-
-try:
-    from PySide6.QtWidgets import QMainWindow  # type: ignore
-except ImportError:
-    from PySide2.QtWidgets import QMainWindow  # type: ignore
-
-from .. import utils
+from .. import _qt, profiling, utils, window_config
+from ..registry import window_registry
 from ..utils import MayaPointer
-from ..window import PySideTemplateWindow
+from ..workspace_control import command_counter, get_workspace_control
+from .warm_pool import warm_pool
+
+# app.main は restore の uiScript から import されるため、Qt のウィジェットを使う scheduler と window は使う時に import する
+if TYPE_CHECKING:
+    from ..window import PySideTemplateWindow
 
 logger = logging.getLogger(__name__)
 
 
-def start() -> None:
+def start(instance_id: Optional[str] = None) -> None:
     """
     起動します
 
     既存のウィンドウがある場合は再表示し、ない場合は新規作成します。
+    restore のウィンドウ構築が予約されたままの場合は、ここで構築を済ませてから再表示します。
+    warm_up() で事前構築したウィンドウがある場合は、それをアタッチして表示します。
+
+    Args:
+        instance_id: インスタンス ID（None の場合は既定のインスタンス）
+    """
+    from .scheduler import restore_scheduler
+
+    window_name, wsc_name = window_config.names_for(instance_id)
+    with profiling.profile_if_armed('start'), profiling.span('start'), command_counter.track('start'):
+        restore_scheduler.flush(wsc_name)
+        window: Any = warm_pool.claim(instance_id)
+        if window is None:
+            window = window_registry.get(instance_id)
+        if window is None:
+            # レジストリがリロードされた場合などに備えて Maya からも探す
+            window_ptr: Optional[MayaPointer] = utils.get_maya_control_pointer(window_name)
+            if window_ptr is not None:
+                window = utils.safe_wrap_instance(window_ptr, _qt.import_qt_module('QtWidgets').QMainWindow)
+
+        if window is None:
+            # 新規作成
+            logger.debug('%s(): 新規作成', start.__name__)
+            window = _create(instance_id)
+            window.show()
+        else:
+            # 既存ウィンドウの再表示
+            logger.debug('%s(): 既存ウィンドウの再表示', start.__name__)
+            # QMainWindow の show() ではあるが、PySideTemplateWindow の内部実装により PySideTemplateWindow.show() が呼ばれる
+            window.show()
+
+
+def restart(instance_id: Optional[str] = None) -> None:
     """
-    window_ptr: Optional[MayaPointer] = utils.get_maya_control_pointer(PySideTemplateWindow.NAME)
+    再起動します
 
-    if window_ptr is None:
-        # 新規作成
-        logger.debug(f'{start.__name__}(): 新規作成')
-        window = _create()
+    既存の WorkspaceControl を削除してから新しいウィンドウを作成します。
+    主に開発中に reload したい場合に使用します。
+
+    Args:
+        instance_id: インスタンス ID（None の場合は既定のインスタンス）
+    """
+    from .scheduler import restore_scheduler
+
+    wsc = get_workspace_control(window_config.names_for(instance_id)[1])
+    with profiling.profile_if_armed('restart'), profiling.span('restart'), command_counter.track('restart'):
+        restore_scheduler.cancel(wsc.name)
+        # 事前構築したウィンドウはリロード前のコードで作られているため使わない
+        warm_pool.discard(instance_id)
+        _shutdown(instance_id)
+        if wsc.exists():
+            logger.debug('%s(): 既存の WorkspaceControl を削除します', restart.__name__)
+            wsc.delete()
+
+        logger.debug('%s(): 新しいウィンドウを作成します', restart.__name__)
+        window = _create(instance_id)
         window.show()
-    else:
-        # 既存ウィンドウの再表示
-        logger.debug(f'{start.__name__}(): 既存ウィンドウの再表示')
-        window = utils.safe_wrap_instance(window_ptr, QMainWindow)
-        window.show()  # QMainWindow の show() ではあるが、PySideTemplateWindow の内部実装により PySideTemplateWindow.show() が呼ばれる
 
 
-def restart() -> None:
+def close(instance_id: Optional[str] = None) -> None:
     """
-    再起動します
+    ウィンドウを閉じて破棄します
 
-    既存の WorkspaceControl を削除してから新しいウィンドウを作成します。
-    主に開発中に reload したい場合に使用します。
+    WorkspaceControl ごと削除するため、レジストリの強参照も解放されます。
+    ☓ボタンで閉じた場合は WorkspaceControl が残るため、start() で再表示できます。
+    warm_up() されている場合は、次の start() に備えてアイドル時にウィンドウを事前構築し直します。
+
+    Args:
+        instance_id: インスタンス ID（None の場合は既定のインスタンス）
     """
-    wsc_name = PySideTemplateWindow.WORKSPACE_CONTROL_NAME
-    if cmds.workspaceControl(wsc_name, q=True, exists=True):
-        logger.debug(f'{restart.__name__}(): 既存の WorkspaceControl を削除します')
-        cmds.deleteUI(wsc_name, control=True)
+    from .scheduler import restore_scheduler
 
-    logger.debug(f'{restart.__name__}(): 新しいウィンドウを作成します')
-    window = _create()
-    window.show()
+    wsc = get_workspace_control(window_config.names_for(instance_id)[1])
+    restore_scheduler.cancel(wsc.name)
+    warm_pool.discard(instance_id)
+    _shutdown(instance_id)
+    if wsc.exists():
+        wsc.delete()
+    window_registry.release(instance_id)
+    warm_pool.schedule(instance_id)
 
 
-def restore() -> None:
+def restore(instance_id: Optional[str] = None) -> None:
     """
     WorkspaceControl の restore 処理です
 
     Maya の起動時やワークスペース切り替え時に呼び出される関数です。
     新しいウィンドウインスタンスを作成し、WorkspaceControl に追加します。
+
+    window_config.DEFERRED_RESTORE が True の場合は、プレースホルダーのみを追加して
+    ウィンドウの構築を restore_scheduler に予約します。window モジュールは構築する時に import されます。
+
+    Args:
+        instance_id: インスタンス ID（None の場合は既定のインスタンス）
+    """
+    logger.debug('%s(): Maya が自動で WorkspaceControl を生成しています', restore.__name__)
+    build = functools.partial(_restore_window, instance_id)
+    if window_config.DEFERRED_RESTORE:
+        from .scheduler import restore_scheduler
+
+        restore_scheduler.schedule(window_config.names_for(instance_id)[1], build)
+    else:
+        build()
+
+
+def on_workspace_control_closed(instance_id: Optional[str] = None) -> None:
+    """
+    WorkspaceControl が閉じられた時に呼ばれます（closeCommand から呼ばれます）
+
+    WorkspaceControl は残るため start() で再表示できますが、実行中の処理は停止します。
     """
-    logger.debug(f'{restore.__name__}(): Maya が自動で WorkspaceControl を生成しています')
-    window = _create()
+    logger.debug('%s(): WorkspaceControl が閉じられました', on_workspace_control_closed.__name__)
+    _shutdown(instance_id)
 
-    # restore() のコンテキストでは WorkspaceControl は Maya が自動で生成するため、
-    # utils.attach_window_to_workspace_control() を使ってウィジェットを追加します
-    # addWidgetToMayaLayout() は内部で show() を呼ぶため、それで表示されます
-    utils.attach_window_to_workspace_control(PySideTemplateWindow.NAME, PySideTemplateWindow.WORKSPACE_CONTROL_NAME)
+
+def _shutdown(instance_id: Optional[str]) -> None:
+    """
+    ウィンドウが存在すれば実行中の処理を停止します
+    """
+    window = window_registry.get(instance_id)
+    if window is not None:
+        window.shutdown()
 
 
-def _create() -> PySideTemplateWindow:
+def _restore_window(instance_id: Optional[str]) -> None:
+    """
+    restore 用のウィンドウを生成して WorkspaceControl にアタッチします
+    """
+    with profiling.span('restore'), command_counter.track('restore'):
+        window = warm_pool.claim(instance_id)
+        if window is None:
+            window = _create(instance_id)
+
+        # restore() のコンテキストでは WorkspaceControl は Maya が自動で生成するため、
+        # utils.attach_window_to_workspace_control() を使ってウィジェットを追加します
+        # addWidgetToMayaLayout() は内部で show() を呼ぶため、それで表示されます
+        utils.attach_window_to_workspace_control(window.name, window.workspace_control_name)
+
+
+def _create(instance_id: Optional[str] = None) -> 'PySideTemplateWindow':
     """
     新しいウィンドウインスタンスを生成します
     """
-    window = PySideTemplateWindow()
+    window_class = _window_class()
+    with profiling.span('window.__init__'):
+        window = window_class(instance_id=instance_id)
     return window
+
+
+def _window_class() -> Type['PySideTemplateWindow']:
+    """
+    ウィンドウクラスを返します
+
+    restore の uiScript が window モジュールを読み込まないよう、ウィンドウを生成する時に import します。
+    """
+    from ..window import PySideTemplateWindow
+
+    return PySideTemplateWindow
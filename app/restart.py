@@ -9,28 +9,36 @@
 実装を直接記述せず、main.restart() を呼び出すことで、開発中の変更の影響を受けないようにしています。
 """
 
+from typing import Optional
 
-def restart_pyside_template_window() -> None:
+
+def restart_pyside_template_window(instance_id: Optional[str] = None) -> None:
     """
     ウィンドウを再起動します
 
     既存の WorkspaceControl を削除してから新しいウィンドウを作成します。
-    モジュールを増やした場合は importlib.reload() する処理を適宜追加してください。
+    変更されたモジュールとそれに依存するモジュールは reloader が自動で検出してリロードするため、
+    モジュールを増やしても reload の処理を追加する必要はありません。
+
+    Args:
+        instance_id: 再起動するウィンドウのインスタンス ID（None の場合は既定のインスタンス）
     """
-    import importlib
     import logging
 
-    from pyside_template_window import window  # type: ignore
-    from pyside_template_window.app import main  # type: ignore
+    from pyside_template_window import leak_tracker, reloader  # type: ignore
 
     logger = logging.getLogger(__name__)
 
-    logger.debug('モジュールをリロードしています...')
-    importlib.reload(window)
-    importlib.reload(main)
+    # leak_tracker が有効な場合、リロードと再起動の後に生き残ったオブジェクトを報告する
+    with leak_tracker.track('restart'):
+        logger.debug('変更されたモジュールをリロードしています...')
+        reloader.reload_changed('pyside_template_window')
+
+        # リロード後のモジュールを使うため、リロードの後で import する
+        from pyside_template_window.app import main  # type: ignore
 
-    logger.debug('ウィンドウを再起動しています...')
-    main.restart()
+        logger.debug('ウィンドウを再起動しています...')
+        main.restart(instance_id)
 
 
 if __name__ == '__main__':
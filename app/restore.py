@@ -6,19 +6,29 @@ Maya の WorkspaceControl 機能による自動復元処理を行います。
 このモジュールは inspect.getsource() で取得して cmds.workspaceControl の uiScript に渡すことを想定しています。
 
 実装を直接記述せず、main.restore() を呼び出すことで、開発中の変更の影響を受けないようにしています。
+
+インスタンス ID を指定したウィンドウでは、PySideTemplateWindow が INSTANCE_ID の行を
+そのインスタンスの ID に書き換えてから uiScript に渡します。
 """
 
+from typing import Optional
+
+INSTANCE_ID: Optional[str] = None
 
-def restore_pyside_template_window() -> None:
+
+def restore_pyside_template_window(instance_id: Optional[str] = None) -> None:
     """
     ウィンドウを復元します
 
     新しいウィンドウインスタンスを作成し、WorkspaceControl に適切に配置します。
+
+    Args:
+        instance_id: 復元するウィンドウのインスタンス ID（None の場合は既定のインスタンス）
     """
     from pyside_template_window import restore  # type: ignore
 
-    restore()
+    restore(instance_id)
 
 
 if __name__ == '__main__':
-    restore_pyside_template_window()
+    restore_pyside_template_window(INSTANCE_ID)
@@ -0,0 +1,174 @@
+"""
+restore の遅延実行用モジュール
+
+Maya の起動時にドッキングされたウィンドウを段階的に構築するスケジューラーを提供します。
+
+restore() の時点では軽量なプレースホルダーだけを WorkspaceControl に追加し、
+実際のウィンドウはプレースホルダーが初めて表示された後、Qt のイベントループが
+空いたタイミングで 1 つずつ構築します。
+表示中のタブはすぐに構築され、背面のタブは初めて表示されるまで構築されません。
+"""
+
+import functools
+import logging
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, NamedTuple
+
+try:
+    from PySide6.QtCore import Qt, QTimer  # type: ignore
+    from PySide6.QtWidgets import QLabel  # type: ignore
+except ImportError:
+    from PySide2.QtCore import Qt, QTimer  # type: ignore
+    from PySide2.QtWidgets import QLabel  # type: ignore
+
+from .. import _qt, utils
+
+logger = logging.getLogger(__name__)
+
+
+class _Placeholder(QLabel):
+    """
+    実際のウィンドウが構築されるまで WorkspaceControl に表示するプレースホルダー
+    """
+
+    def __init__(self, name: str, on_shown: Callable[[], None]) -> None:
+        super().__init__('Loading...')
+        self.setObjectName(name)
+        self.setAlignment(Qt.AlignCenter)
+        self._on_shown = on_shown
+
+    def showEvent(self, event) -> None:
+        """
+        実際に表示されたことをスケジューラーに通知します
+
+        背面のタブに追加された場合は、タブが選択されるまで showEvent は呼ばれません。
+        """
+        super().showEvent(event)
+        self._on_shown()
+
+
+class _PendingRestore(NamedTuple):
+    build: Callable[[], None]
+    placeholder: _Placeholder
+    serial: int
+    scheduled_at: float
+
+
+class RestoreScheduler:
+    """
+    WorkspaceControl ごとの restore を遅延実行するスケジューラー
+
+    1 回のイベントループの周回で構築するウィンドウは 1 つだけです。
+    複数のウィンドウがドッキングされていても、構築の合間に Maya の UI が更新されます。
+    """
+
+    def __init__(self) -> None:
+        self._pending: Dict[str, _PendingRestore] = {}
+        self._ready: Deque[str] = deque()
+        self._tick_scheduled = False
+        self._serial = 0
+
+    def schedule(self, workspace_control_name: str, build: Callable[[], None]) -> None:
+        """
+        プレースホルダーを WorkspaceControl に追加し、ウィンドウの構築を予約します
+
+        Args:
+            workspace_control_name (str): WorkspaceControl の名前
+            build (Callable[[], None]): ウィンドウを構築して WorkspaceControl にアタッチする関数
+        """
+        self.cancel(workspace_control_name)
+
+        placeholder = _Placeholder(
+            f'{workspace_control_name}Placeholder', functools.partial(self._on_shown, workspace_control_name)
+        )
+        self._serial += 1
+        # ユーザーが WorkspaceControl を閉じて削除された場合などに予約を取り消す
+        placeholder.destroyed.connect(functools.partial(self._on_destroyed, workspace_control_name, self._serial))
+        self._pending[workspace_control_name] = _PendingRestore(build, placeholder, self._serial, time.perf_counter())
+        utils.attach_window_to_workspace_control(placeholder.objectName(), workspace_control_name)
+        logger.debug('%s(): %s のプレースホルダーを追加しました', self.schedule.__name__, workspace_control_name)
+
+    def is_pending(self, workspace_control_name: str) -> bool:
+        """
+        ウィンドウの構築が予約されたままかどうかを返します
+        """
+        return workspace_control_name in self._pending
+
+    def flush(self, workspace_control_name: str) -> bool:
+        """
+        予約されている構築をただちに実行します
+
+        start() のようにウィンドウがすぐに必要な場合に呼びます。
+
+        Returns:
+            bool: 予約されていた構築を実行した場合 True
+        """
+        pending = self._pending.pop(workspace_control_name, None)
+        if pending is None:
+            return False
+
+        start = time.perf_counter()
+        try:
+            pending.build()
+        finally:
+            self._discard_placeholder(pending.placeholder)
+        wait_ms = (start - pending.scheduled_at) * 1000
+        build_ms = (time.perf_counter() - start) * 1000
+        logger.debug(
+            '%s(): %s を構築しました（待機 %.1f ms / 構築 %.1f ms）',
+            self.flush.__name__,
+            workspace_control_name,
+            wait_ms,
+            build_ms,
+        )
+        return True
+
+    def cancel(self, workspace_control_name: str) -> None:
+        """
+        予約されている構築を取り消します
+
+        restart() で WorkspaceControl を削除する前などに呼びます。
+        """
+        pending = self._pending.pop(workspace_control_name, None)
+        if pending is not None:
+            self._discard_placeholder(pending.placeholder)
+
+    def _on_shown(self, workspace_control_name: str) -> None:
+        if workspace_control_name in self._pending and workspace_control_name not in self._ready:
+            self._ready.append(workspace_control_name)
+            self._schedule_tick()
+
+    def _on_destroyed(self, workspace_control_name: str, serial: int, *args) -> None:
+        pending = self._pending.get(workspace_control_name)
+        if pending is not None and pending.serial == serial:
+            del self._pending[workspace_control_name]
+
+    def _schedule_tick(self) -> None:
+        if self._tick_scheduled is False:
+            self._tick_scheduled = True
+            QTimer.singleShot(0, self._process_next)
+
+    def _process_next(self) -> None:
+        """
+        表示済みのプレースホルダーのうち 1 つだけウィンドウを構築します
+        """
+        self._tick_scheduled = False
+        while self._ready:
+            workspace_control_name = self._ready.popleft()
+            if self.flush(workspace_control_name):
+                break
+        if self._ready:
+            self._schedule_tick()
+
+    @staticmethod
+    def _discard_placeholder(placeholder: _Placeholder) -> None:
+        # restart() などで WorkspaceControl ごと削除済みの場合は何もしない
+        if _qt.is_valid(placeholder):
+            placeholder.hide()
+            placeholder.deleteLater()
+
+
+# reloader でこのモジュールがリロードされても予約済みの構築を引き継ぐ
+_previous_scheduler = globals().get('restore_scheduler')
+restore_scheduler: RestoreScheduler = _previous_scheduler if _previous_scheduler is not None else RestoreScheduler()
@@ -0,0 +1,255 @@
+"""
+事前構築したウィンドウを保持するプール（opt-in）
+
+warm_up() を呼ぶと、Maya がアイドル状態になった時にウィンドウを非表示のまま構築して保持します。
+start() はプールのウィンドウがあればそれを WorkspaceControl にアタッチして表示するだけで済むため、
+セッションで最初に開く時や、close() でウィンドウを破棄した後に開く時も待たされません。
+
+- 構築は host の execute_deferred()（Maya では maya.utils.executeDeferred()）でアイドル時に行います
+- 構築時に増えたプロセスのメモリ使用量を記録し、合計が予算（budget_bytes）を超えないように古いものから破棄します
+- idle_timeout_s の間開かれなかったウィンドウは破棄します（次に close() されるまで再構築しません）
+
+このモジュールは import 時に Qt や window を読み込まないため、userSetup から warm_up() を呼んでも
+Maya の起動を遅くしません。
+
+使用例（userSetup.py）:
+    import pyside_template_window
+    pyside_template_window.warm_up()
+"""
+
+import functools
+import logging
+import os
+import sys
+import time
+from typing import Any, Dict, NamedTuple, Optional, Set
+
+from .. import _qt, host
+from ..registry import DEFAULT_INSTANCE_ID, window_registry
+
+logger = logging.getLogger(__name__)
+
+# 既定のメモリ予算（バイト）
+DEFAULT_BUDGET_BYTES = 64 * 1024 * 1024
+# 既定で開かれないまま保持する時間（秒）
+DEFAULT_IDLE_TIMEOUT_S = 30 * 60
+# プロセスのメモリ使用量を取得できない環境で 1 ウィンドウあたりに見積もるサイズ（バイト）
+ESTIMATED_WINDOW_BYTES = 4 * 1024 * 1024
+
+
+class _WarmEntry(NamedTuple):
+    window: Any
+    cost_bytes: int
+    built_at: float
+    serial: int
+
+
+class WarmPool:
+    """
+    インスタンス ID ごとに非表示のウィンドウを 1 つずつ保持するプール
+
+    プールのウィンドウは通常のウィンドウと同様に registry.window_registry に登録されています。
+    """
+
+    def __init__(self) -> None:
+        self.budget_bytes = DEFAULT_BUDGET_BYTES
+        self.idle_timeout_s: float = DEFAULT_IDLE_TIMEOUT_S
+        self._enabled: Set[str] = set()
+        self._entries: Dict[str, _WarmEntry] = {}
+        self._serial = 0
+        self._stats: Dict[str, int] = {'builds': 0, 'hits': 0, 'misses': 0, 'evictions': 0}
+
+    def enable(self, instance_id: Optional[str] = None) -> None:
+        """
+        インスタンス ID のウィンドウを事前構築の対象にし、アイドル時の構築を予約します
+        """
+        key = _key(instance_id)
+        self._enabled.add(key)
+        self.schedule(instance_id)
+
+    def disable(self, instance_id: Optional[str] = None) -> None:
+        """
+        事前構築の対象から外し、保持しているウィンドウを破棄します
+        """
+        self._enabled.discard(_key(instance_id))
+        self.discard(instance_id)
+
+    def is_enabled(self, instance_id: Optional[str] = None) -> bool:
+        return _key(instance_id) in self._enabled
+
+    def schedule(self, instance_id: Optional[str] = None) -> None:
+        """
+        事前構築の対象であれば、アイドル時の構築を予約します
+
+        close() でウィンドウが破棄された後などに呼ばれます。
+        """
+        if self.is_enabled(instance_id):
+            host.get_host().execute_deferred(self._build, instance_id)
+
+    def claim(self, instance_id: Optional[str] = None) -> Optional[Any]:
+        """
+        保持しているウィンドウをプールから取り出します
+
+        取り出したウィンドウは通常のウィンドウとして扱われ、破棄の対象から外れます。
+
+        Returns:
+            Optional[PySideTemplateWindow]: 事前構築されたウィンドウ。無い場合は None
+        """
+        entry = self._entries.pop(_key(instance_id), None)
+        if entry is None or _qt.is_valid(entry.window) is False:
+            if self.is_enabled(instance_id):
+                self._stats['misses'] += 1
+            return None
+        self._stats['hits'] += 1
+        logger.debug('%s(): 事前構築したウィンドウを使用します', self.claim.__name__)
+        return entry.window
+
+    def discard(self, instance_id: Optional[str] = None) -> None:
+        """
+        保持しているウィンドウを破棄します
+        """
+        entry = self._entries.pop(_key(instance_id), None)
+        if entry is not None:
+            self._stats['evictions'] += 1
+            _destroy(entry.window)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        構築・使用・破棄の回数と、保持しているウィンドウの数・メモリ使用量を返します
+        """
+        stats = dict(self._stats)
+        stats['entries'] = len(self._entries)
+        stats['bytes'] = sum(entry.cost_bytes for entry in self._entries.values())
+        return stats
+
+    def _build(self, instance_id: Optional[str]) -> None:
+        key = _key(instance_id)
+        # アイドルになるまでの間に無効化された・開かれた場合は構築しない
+        if key not in self._enabled or key in self._entries or window_registry.get(instance_id) is not None:
+            return
+
+        # アイドル時に import する（userSetup の時点では window を読み込まないため）
+        from ..window import PySideTemplateWindow
+
+        before = _process_memory_bytes()
+        start = time.perf_counter()
+        window = PySideTemplateWindow(instance_id=instance_id)
+        window.build_content()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        after = _process_memory_bytes()
+        cost = after - before if before is not None and after is not None else ESTIMATED_WINDOW_BYTES
+        cost = max(cost, 0)
+
+        if cost > self.budget_bytes:
+            logger.warning(
+                '事前構築したウィンドウ（%.1f MiB）が予算（%.1f MiB）を超えるため破棄します',
+                cost / 1024 / 1024,
+                self.budget_bytes / 1024 / 1024,
+            )
+            _destroy(window)
+            return
+
+        self._serial += 1
+        self._entries[key] = _WarmEntry(window, cost, time.time(), self._serial)
+        self._stats['builds'] += 1
+        logger.debug(
+            '%s(): %s を事前構築しました（%.1f ms, %.1f KiB）',
+            self._build.__name__,
+            window.name,
+            elapsed_ms,
+            cost / 1024,
+        )
+        self._enforce_budget()
+
+        QTimer = _qt.import_qt_module('QtCore').QTimer
+        QTimer.singleShot(int(self.idle_timeout_s * 1000), functools.partial(self._evict_if_idle, key, self._serial))
+
+    def _enforce_budget(self) -> None:
+        """
+        合計が予算を超えている間、古いウィンドウから破棄します
+        """
+        while self._entries and sum(entry.cost_bytes for entry in self._entries.values()) > self.budget_bytes:
+            oldest = min(self._entries, key=lambda name: self._entries[name].built_at)
+            window = self._entries.pop(oldest).window
+            logger.debug('%s(): 予算を超えたため %s を破棄します', self._enforce_budget.__name__, window.name)
+            self._stats['evictions'] += 1
+            _destroy(window)
+
+    def _evict_if_idle(self, key: str, serial: int) -> None:
+        entry = self._entries.get(key)
+        if entry is None or entry.serial != serial:
+            return
+        window = self._entries.pop(key).window
+        logger.debug('%s(): %s は開かれなかったため破棄します', self._evict_if_idle.__name__, window.name)
+        self._stats['evictions'] += 1
+        _destroy(window)
+
+
+def warm_up(
+    instance_id: Optional[str] = None,
+    budget_bytes: Optional[int] = None,
+    idle_timeout_s: Optional[float] = None,
+) -> None:
+    """
+    アイドル時にウィンドウを事前構築して、start() をすぐに完了できるようにします
+
+    Args:
+        instance_id: 事前構築するウィンドウのインスタンス ID（None の場合は既定のインスタンス）
+        budget_bytes: プール全体のメモリ予算（バイト）。None の場合は変更しません
+        idle_timeout_s: 開かれないまま保持する時間（秒）。None の場合は変更しません
+    """
+    if budget_bytes is not None:
+        warm_pool.budget_bytes = budget_bytes
+    if idle_timeout_s is not None:
+        warm_pool.idle_timeout_s = idle_timeout_s
+    warm_pool.enable(instance_id)
+
+
+def _key(instance_id: Optional[str]) -> str:
+    return DEFAULT_INSTANCE_ID if instance_id is None else instance_id
+
+
+def _destroy(window: Any) -> None:
+    if _qt.is_valid(window):
+        window.deleteLater()
+
+
+def _process_memory_bytes() -> Optional[int]:
+    """
+    プロセスの現在のメモリ使用量（常駐セットサイズ）を返します。取得できない環境では None
+    """
+    if sys.platform.startswith('linux'):
+        try:
+            with open('/proc/self/statm') as f:
+                return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+        except (OSError, ValueError, IndexError):
+            return None
+    if sys.platform == 'win32':
+        import ctypes
+        from ctypes import wintypes
+
+        class _ProcessMemoryCounters(ctypes.Structure):
+            _fields_ = [
+                ('cb', wintypes.DWORD),
+                ('PageFaultCount', wintypes.DWORD),
+                ('PeakWorkingSetSize', ctypes.c_size_t),
+                ('WorkingSetSize', ctypes.c_size_t),
+                ('QuotaPeakPagedPoolUsage', ctypes.c_size_t),
+                ('QuotaPagedPoolUsage', ctypes.c_size_t),
+                ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t),
+                ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+                ('PagefileUsage', ctypes.c_size_t),
+                ('PeakPagefileUsage', ctypes.c_size_t),
+            ]
+
+        counters = _ProcessMemoryCounters()
+        counters.cb = ctypes.sizeof(counters)
+        process = ctypes.windll.kernel32.GetCurrentProcess()
+        if ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+            return int(counters.WorkingSetSize)
+    return None
+
+
+# reloader でこのモジュールがリロードされても保持しているウィンドウを引き継ぐ
+_previous_pool = globals().get('warm_pool')
+warm_pool: WarmPool = _previous_pool if _previous_pool is not None else WarmPool()
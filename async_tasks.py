@@ -0,0 +1,262 @@
+"""
+asyncio のコルーチンを Qt のイベントループで実行するモジュール
+
+アセットのデータベースやファイルサーバーとの通信など、待ち時間の長い I/O を async def で書けるようにします。
+コルーチンはメインスレッドで実行されるため、await の後でそのままウィジェットを操作できます。
+
+- プロセスで 1 つの asyncio のイベントループを、Qt のタイマーから少しずつ進めます。
+  1 回に進めるのは実行可能なコールバックだけで、I/O の待ちでは止まらないため、待っている間も描画は止まりません
+- タイマーは実行中のタスクがある間だけ動きます。1 回のタイマーで実行可能なコールバックを最大 STEP_BUDGET_MS まで
+  進め、残っている場合は 0 ms、I/O を待っている場合は POLL_INTERVAL_MS、asyncio.sleep() などの期限が
+  POLL_INTERVAL_MS 以内の場合は 1 ms ごとに進めます
+- 非同期に対応していないライブラリは loop.run_in_executor() でスレッドに逃がしてください
+- ウィンドウの restart() / close() / WorkspaceControl が閉じられた時・削除された時に、
+  AsyncRunner.cancel_all() で実行中のタスクがキャンセルされます
+
+使用例:
+    async def load_assets(self) -> None:
+        assets = await fetch_assets(self.project)
+        self.asset_list.set_items(assets)
+
+    button.clicked.connect(self.async_tasks.slot(self.load_assets))
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Union
+
+try:
+    from PySide6.QtCore import QTimer  # type: ignore
+except ImportError:
+    from PySide2.QtCore import QTimer  # type: ignore
+
+from . import profiling
+
+logger = logging.getLogger(__name__)
+
+# I/O やタイマーを待っている間にイベントループを進める最大の間隔（ミリ秒）
+POLL_INTERVAL_MS = 10
+# 1 回のタイマーで実行可能なコールバックを進め続ける最大の時間（ミリ秒）
+STEP_BUDGET_MS = 4
+
+
+class QtLoopDriver:
+    """
+    asyncio のイベントループを Qt のタイマーから進めるクラス
+
+    メインスレッドで使ってください。通常は get_driver() で取得します。
+    """
+
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self._timer: Optional[QTimer] = None
+        # タイマーの現在の間隔（止まっている場合は None）
+        self._interval: Optional[int] = None
+        self._stepping = False
+        self._steps = 0
+        self._timer_changes = 0
+
+    def wake(self) -> None:
+        """
+        タイマーが止まっていれば開始します（タスクを追加した時に呼ばれます）
+        """
+        if self._interval is None:
+            self._set_interval(0)
+
+    def close(self) -> None:
+        """
+        タイマーを止め、run_in_executor() の既定のスレッドプールを終了してからイベントループを閉じます
+        """
+        self._set_interval(None)
+        if not self.loop.is_closed():
+            self.loop.run_until_complete(self.loop.shutdown_default_executor())
+            self.loop.close()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        イベントループを進めた回数・タイマーの間隔を変えた回数と、終了していないタスクの数を返します
+        """
+        return {
+            'steps': self._steps,
+            'timer_changes': self._timer_changes,
+            'pending': len(asyncio.all_tasks(self.loop)),
+        }
+
+    def _step(self) -> None:
+        # コルーチンの中で processEvents() が呼ばれた場合など、進めている途中に呼ばれた場合は何もしない
+        if self._stepping:
+            return
+        self._stepping = True
+        deadline = time.perf_counter() + STEP_BUDGET_MS / 1000
+        try:
+            with profiling.span('async_tasks.step'):
+                while True:
+                    # stop() を予約してから run_forever() すると、実行可能なコールバックを 1 巡だけ実行して戻る
+                    self.loop.call_soon(self.loop.stop)
+                    self.loop.run_forever()
+                    self._steps += 1
+                    if not getattr(self.loop, '_ready', None) or time.perf_counter() >= deadline:
+                        break
+        except RuntimeError:
+            # 同じスレッドで別のイベントループが実行中の場合
+            logger.exception('asyncio のイベントループを進められませんでした')
+        finally:
+            self._stepping = False
+
+        if getattr(self.loop, '_ready', None):
+            self._set_interval(0)
+        elif asyncio.all_tasks(self.loop):
+            # タイマーを操作する回数を抑えるため、間隔は 0・1・POLL_INTERVAL_MS ミリ秒のいずれかに丸める
+            interval = self._next_interval_ms()
+            self._set_interval(interval if interval in (0, POLL_INTERVAL_MS) else 1)
+        else:
+            self._set_interval(None)
+
+    def _set_interval(self, interval: Optional[int]) -> None:
+        # PySide6 6.12（Python 3.11）では戻り値の無い Qt の呼び出しのたびに None の参照カウントが減るため、
+        # 1 巡ごとではなく間隔が変わる時だけタイマーを操作する
+        if interval == self._interval:
+            return
+        if self._timer is None:
+            self._timer = QTimer()
+            self._timer.timeout.connect(self._step)
+        if interval is None:
+            self._timer.stop()
+        else:
+            self._timer.start(interval)
+        self._interval = interval
+        self._timer_changes += 1
+
+    def _next_interval_ms(self) -> int:
+        scheduled = getattr(self.loop, '_scheduled', None)
+        if not scheduled:
+            return POLL_INTERVAL_MS
+        remaining_ms = (scheduled[0].when() - self.loop.time()) * 1000
+        return max(min(int(remaining_ms), POLL_INTERVAL_MS), 0)
+
+
+def get_driver() -> QtLoopDriver:
+    """
+    プロセスで共有する QtLoopDriver を返します
+    """
+    global _driver
+    if _driver is None or _driver.loop.is_closed():
+        _driver = QtLoopDriver()
+    return _driver
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """
+    コルーチンを実行する asyncio のイベントループを返します
+    """
+    return get_driver().loop
+
+
+class AsyncRunner:
+    """
+    ウィンドウごとのコルーチンの実行器
+
+    ウィンドウが起動したタスクだけを保持するため、あるウィンドウの cancel_all() が他のツールのタスクに
+    影響することはありません。Qt のオブジェクトではないため、ウィンドウの QObject の数は増えません。
+    """
+
+    def __init__(self) -> None:
+        self._tasks: Set['asyncio.Task[Any]'] = set()
+
+    def run(
+        self,
+        coro: Union[Awaitable[Any], Callable[..., Awaitable[Any]]],
+        *args: Any,
+        on_result: Optional[Callable[[Any], None]] = None,
+        on_error: Optional[Callable[[BaseException], None]] = None,
+        on_finished: Optional[Callable[[], None]] = None,
+        **kwargs: Any,
+    ) -> 'asyncio.Task[Any]':
+        """
+        コルーチンをタスクとして実行します
+
+        コールバックはすべてメインスレッドで呼ばれます。キャンセルされたタスクの結果・エラーは通知されません。
+
+        Args:
+            coro: コルーチン、またはコルーチンを返す関数（async def の関数）
+            *args: coro が関数の場合に渡す位置引数
+            on_result: 戻り値を受け取るコールバック
+            on_error: 送出された例外を受け取るコールバック（省略時はログに出力します）
+            on_finished: 成功・失敗・キャンセルにかかわらず最後に呼ばれるコールバック
+            **kwargs: coro が関数の場合に渡すキーワード引数
+
+        Returns:
+            asyncio.Task: 実行するタスク（cancel() でキャンセルできます）
+        """
+        if callable(coro):
+            coro = coro(*args, **kwargs)
+        driver = get_driver()
+        task = driver.loop.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(lambda done: self._on_done(done, on_result, on_error, on_finished))
+        driver.wake()
+        return task
+
+    def slot(self, func: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any) -> Callable[..., None]:
+        """
+        シグナルに接続できる、func のコルーチンを実行する関数を返します
+
+        シグナルの引数（clicked の checked など）は捨てます。
+
+        使用例:
+            button.clicked.connect(self.async_tasks.slot(self.load_assets))
+        """
+
+        def start(*signal_args: Any) -> None:
+            self.run(func, *args, **kwargs)
+
+        return start
+
+    def active_count(self) -> int:
+        """
+        終了していないタスクの数を返します
+        """
+        return len(self._tasks)
+
+    def cancel_all(self, *args: Any) -> None:
+        """
+        すべてのタスクをキャンセルします
+
+        タスクは次に await した時点で asyncio.CancelledError を受け取って終了します。
+        destroyed シグナルに接続できるよう、引数は無視します。
+        """
+        if not self._tasks:
+            return
+        logger.debug('%s(): %s 個のコルーチンをキャンセルします', self.cancel_all.__name__, len(self._tasks))
+        for task in list(self._tasks):
+            task.cancel()
+        # キャンセルを処理させるためにイベントループを進める
+        get_driver().wake()
+
+    def _on_done(
+        self,
+        task: 'asyncio.Task[Any]',
+        on_result: Optional[Callable[[Any], None]],
+        on_error: Optional[Callable[[BaseException], None]],
+        on_finished: Optional[Callable[[], None]],
+    ) -> None:
+        self._tasks.discard(task)
+        try:
+            if task.cancelled():
+                return
+            error = task.exception()
+            if error is not None:
+                if on_error is not None:
+                    on_error(error)
+                else:
+                    logger.error('コルーチンでエラーが発生しました', exc_info=error)
+            elif on_result is not None:
+                on_result(task.result())
+        finally:
+            if on_finished is not None:
+                on_finished()
+
+
+# reloader でこのモジュールがリロードされても実行中のタスクを持つイベントループを引き継ぐ
+_driver: Optional[QtLoopDriver] = globals().get('_driver')
@@ -0,0 +1,6 @@
+"""Benchmarks package
+
+パッケージの性能計測用スクリプトをまとめたパッケージです。
+mayapy などパッケージの親フォルダが sys.path に含まれる Python から
+python -m <パッケージ名>.benchmarks.<モジュール名> の形式で実行します。
+"""
@@ -0,0 +1,160 @@
+"""
+async_tasks のベンチマークスクリプト
+
+ローカルの TCP サーバーに対して I/O を行うコルーチンを --tasks 個同時に実行し、以下を計測します:
+    - latency_ms: すべてのコルーチンが終了するまでの時間
+    - max_stall_ms: 実行中にメインスレッドのイベントループが止まった最大時間
+    - steps: asyncio のイベントループを進めた回数
+    - timer_changes: イベントループを進めるタイマーを開始・停止・間隔変更した回数
+
+コルーチンはそれぞれサーバーに接続し、--requests 回の要求と応答（サーバーは --delay-ms 待ってから応答します）と、
+run_in_executor() でのブロッキング処理を行います。
+実行中は 5 ms 間隔のタイマーを動かし、その間隔の最大値を max_stall_ms とします。
+max_stall_ms が --max-stall-ms を超えた場合は終了コード 1 を返します。
+Maya は不要です（offscreen の QApplication で実行します）。
+
+使用方法:
+    python -m pyside_template_window.benchmarks.async_tasks --tasks 50
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+from typing import Dict, List, Optional
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+try:
+    from PySide6.QtCore import QEventLoop, QTimer  # type: ignore
+    from PySide6.QtWidgets import QApplication  # type: ignore
+except ImportError:
+    from PySide2.QtCore import QEventLoop, QTimer  # type: ignore
+    from PySide2.QtWidgets import QApplication  # type: ignore
+
+from ..async_tasks import AsyncRunner, get_driver, get_loop
+
+logger = logging.getLogger(__name__)
+
+# メインスレッドの応答性を確認するタイマーの間隔（ミリ秒）
+_HEARTBEAT_MS = 5
+
+
+async def _serve(delay_ms: int) -> asyncio.AbstractServer:
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            await asyncio.sleep(delay_ms / 1000)
+            writer.write(line)
+            await writer.drain()
+        writer.close()
+
+    return await asyncio.start_server(handle, '127.0.0.1', 0)
+
+
+async def _client(port: int, requests: int) -> int:
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    received = 0
+    for index in range(requests):
+        writer.write(f'{index}\n'.encode())
+        await writer.drain()
+        received += len(await reader.readline())
+    writer.close()
+    # 非同期に対応していない処理はスレッドに逃がす
+    await asyncio.get_running_loop().run_in_executor(None, time.sleep, 0.01)
+    return received
+
+
+def run(tasks: int, requests: int, delay_ms: int, timeout_ms: int = 60000) -> Dict[str, float]:
+    """
+    ベンチマークを実行します
+
+    Returns:
+        Dict[str, float]: 計測結果
+    """
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    runner = AsyncRunner()
+    server = get_loop().run_until_complete(_serve(delay_ms))
+    port = server.sockets[0].getsockname()[1]
+
+    loop = QEventLoop()
+    last_tick = [time.perf_counter()]
+    max_gap = [0.0]
+
+    def on_tick() -> None:
+        now = time.perf_counter()
+        max_gap[0] = max(max_gap[0], now - last_tick[0])
+        last_tick[0] = now
+
+    heartbeat = QTimer()
+    heartbeat.setInterval(_HEARTBEAT_MS)
+    heartbeat.timeout.connect(on_tick)
+    QTimer.singleShot(timeout_ms, loop.quit)
+
+    finished = [0]
+    errors: List[BaseException] = []
+
+    def on_finished() -> None:
+        finished[0] += 1
+        if finished[0] == tasks:
+            loop.quit()
+
+    before = get_driver().stats()
+    start = time.perf_counter()
+    heartbeat.start()
+    last_tick[0] = time.perf_counter()
+    for _ in range(tasks):
+        runner.run(_client, port, requests, on_error=errors.append, on_finished=on_finished)
+    # PySide2 には exec() が無い
+    (loop.exec if hasattr(loop, 'exec') else loop.exec_)()
+    elapsed = time.perf_counter() - start
+    heartbeat.stop()
+
+    server.close()
+    get_loop().run_until_complete(server.wait_closed())
+    app.processEvents()
+    after = get_driver().stats()
+    # 終了前に run_in_executor() のスレッドを終了させ、イベントループを閉じる
+    get_driver().close()
+    if errors:
+        logger.error('%d 個のコルーチンでエラーが発生しました: %s', len(errors), errors[0])
+    return {
+        'latency_ms': elapsed * 1000,
+        'max_stall_ms': max_gap[0] * 1000,
+        'steps': after['steps'] - before['steps'],
+        'timer_changes': after['timer_changes'] - before['timer_changes'],
+        'finished': finished[0],
+        'errors': len(errors),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Returns:
+        int: メインスレッドの停止時間が --max-stall-ms を超えた場合、またはエラーがあった場合は 1、それ以外は 0
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--tasks', type=int, default=50, help='同時に実行するコルーチンの数')
+    parser.add_argument('--requests', type=int, default=10, help='コルーチンごとの要求の数')
+    parser.add_argument('--delay-ms', type=int, default=20, help='サーバーが応答するまでの時間（ミリ秒）')
+    parser.add_argument('--max-stall-ms', type=float, default=50.0, help='許容するイベントループの停止時間（ミリ秒）')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
+    results = run(args.tasks, args.requests, args.delay_ms)
+    logger.info('  '.join(f'{key} {value:,.1f}' for key, value in results.items()))
+    # 逐次実行した場合の I/O の待ち時間の合計
+    logger.info('sequential_wait_ms %.1f', args.tasks * args.requests * args.delay_ms)
+    if results['max_stall_ms'] > args.max_stall_ms:
+        logger.error('メインスレッドが %.1f ms 停止しました', results['max_stall_ms'])
+        return 1
+    return 1 if results['errors'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,175 @@
+"""
+data_panel のベンチマークスクリプト
+
+百万件の項目を DataPanel に設定し、以下を計測します:
+    - set_items: 項目の設定にかかった時間
+    - first_paint: テーブルの最初の描画にかかった時間
+    - fetch_more: スクロールで fetchMore() が 1 回呼ばれた時の時間
+    - filter / sort / filter+sort: 要求してから結果が反映されるまでの時間（ワーカースレッドで実行）
+    - max_stall_ms: フィルター・ソートの実行中にメインスレッドのイベントループが止まった最大時間
+
+フィルター・ソートの実行中は 5 ms 間隔のタイマーを動かし、その間隔の最大値を max_stall_ms とします。
+いずれかの max_stall_ms が --max-stall-ms を超えた場合は終了コード 1 を返します。
+Maya は不要です（offscreen の QApplication で実行します）。
+
+使用方法:
+    python -m pyside_template_window.benchmarks.data_panel --rows 1000000
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+try:
+    from PySide6.QtCore import QEventLoop, Qt, QTimer  # type: ignore
+    from PySide6.QtWidgets import QApplication  # type: ignore
+except ImportError:
+    from PySide2.QtCore import QEventLoop, Qt, QTimer  # type: ignore
+    from PySide2.QtWidgets import QApplication  # type: ignore
+
+from ..data_panel import Column, DataPanel
+
+logger = logging.getLogger(__name__)
+
+# メインスレッドの応答性を確認するタイマーの間隔（ミリ秒）
+_HEARTBEAT_MS = 5
+
+
+def _make_items(rows: int) -> List[str]:
+    return [f'|group{i % 997}|sub{i % 13}|pCube{i}' for i in range(rows)]
+
+
+def _wait_for_update(panel: DataPanel, request: Callable[[], None], timeout_ms: int) -> Dict[str, float]:
+    """
+    request() を呼んでから view_updated が通知されるまでの時間と、その間のイベントループの最大停止時間を計測します
+    """
+    loop = QEventLoop()
+    last_tick = [time.perf_counter()]
+    max_gap = [0.0]
+
+    def on_tick() -> None:
+        now = time.perf_counter()
+        max_gap[0] = max(max_gap[0], now - last_tick[0])
+        last_tick[0] = now
+
+    heartbeat = QTimer()
+    heartbeat.setInterval(_HEARTBEAT_MS)
+    heartbeat.timeout.connect(on_tick)
+    panel.view_updated.connect(loop.quit)
+    QTimer.singleShot(timeout_ms, loop.quit)
+
+    start = time.perf_counter()
+    heartbeat.start()
+    last_tick[0] = time.perf_counter()
+    request()
+    # request() 自体がメインスレッドを止めた時間も含める
+    on_tick()
+    # PySide2 には exec() が無い
+    (loop.exec if hasattr(loop, 'exec') else loop.exec_)()
+    elapsed = time.perf_counter() - start
+    on_tick()
+    heartbeat.stop()
+    panel.view_updated.disconnect(loop.quit)
+    return {
+        'latency_ms': elapsed * 1000,
+        'max_stall_ms': max_gap[0] * 1000,
+        'visible_rows': panel.model.visible_count(),
+    }
+
+
+def run(rows: int, timeout_ms: int = 60000) -> Dict[str, Dict[str, float]]:
+    """
+    ベンチマークを実行します
+
+    Returns:
+        Dict[str, Dict[str, float]]: 計測項目ごとの結果
+    """
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    results: Dict[str, Dict[str, float]] = {}
+
+    items = _make_items(rows)
+    panel = DataPanel(
+        [
+            Column('Name', lambda path: path.rsplit('|', 1)[-1]),
+            Column('Path', str),
+            Column('Depth', lambda path: path.count('|')),
+        ]
+    )
+    panel.resize(800, 600)
+    panel.show()
+    app.processEvents()
+
+    start = time.perf_counter()
+    panel.set_items(items)
+    results['set_items'] = {'latency_ms': (time.perf_counter() - start) * 1000}
+
+    start = time.perf_counter()
+    panel.view.viewport().repaint()
+    app.processEvents()
+    results['first_paint'] = {'latency_ms': (time.perf_counter() - start) * 1000}
+
+    fetch_times = []
+    for _ in range(10):
+        start = time.perf_counter()
+        panel.view.scrollToBottom()
+        app.processEvents()
+        panel.view.viewport().repaint()
+        fetch_times.append((time.perf_counter() - start) * 1000)
+    results['fetch_more'] = {'latency_ms': max(fetch_times), 'loaded_rows': panel.model.rowCount()}
+
+    def apply_filter() -> None:
+        panel.filter_edit.setText('pCube12')
+        panel.refresh()
+
+    results['filter'] = _wait_for_update(panel, apply_filter, timeout_ms)
+    results['filter+sort'] = _wait_for_update(panel, lambda: panel.sort_by(0, Qt.DescendingOrder), timeout_ms)
+
+    def clear_filter() -> None:
+        panel.filter_edit.blockSignals(True)
+        panel.filter_edit.clear()
+        panel.filter_edit.blockSignals(False)
+        panel.sort_by(0, Qt.AscendingOrder)
+
+    results['sort'] = _wait_for_update(panel, clear_filter, timeout_ms)
+
+    start = time.perf_counter()
+    panel.view.viewport().repaint()
+    app.processEvents()
+    results['paint_after_sort'] = {'latency_ms': (time.perf_counter() - start) * 1000}
+
+    panel.close()
+    panel.deleteLater()
+    app.processEvents()
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Returns:
+        int: メインスレッドの停止時間が --max-stall-ms を超えた場合は 1、それ以外は 0
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1000000)
+    parser.add_argument('--max-stall-ms', type=float, default=100.0, help='許容するイベントループの停止時間（ミリ秒）')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
+    results = run(args.rows)
+    failed = False
+    for name, metrics in results.items():
+        details = '  '.join(f'{key} {value:,.1f}' for key, value in metrics.items())
+        logger.info('%-16s %s', name, details)
+        if metrics.get('max_stall_ms', 0.0) > args.max_stall_ms:
+            logger.error('%s: メインスレッドが %.1f ms 停止しました', name, metrics['max_stall_ms'])
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,200 @@
+"""
+パッケージの import 時間の計測スクリプト
+
+毎回新しい Python プロセスを起動して cold import の時間を計測します。
+パッケージ本体の import（遅延 import）と、すべての機能のモジュールまで読み込む import（即時 import）を比較します。
+
+restore シナリオは、Maya 起動時に WorkspaceControl の uiScript が実行する
+`from pyside_template_window import restore` の時間で、Qt と window モジュールが読み込まれないことを確認します。
+restore_placeholder シナリオは、FakeHost の WorkspaceControl に対して restore() を呼び、プレースホルダーを
+追加するまでの時間（QApplication の作成を含みます）で、window モジュールが読み込まれないことを確認します。
+どちらも async_tasks（asyncio）や data_panel などの機能のモジュールは、使われるまで読み込まれないことを確認します。
+
+使用方法:
+    mayapy -m pyside_template_window.benchmarks.import_time --repeat 20
+
+Note:
+    Maya の GUI から実行する場合 sys.executable は maya 本体を指すため、
+    --python で mayapy のパスを指定してください。
+    maya は host.get_host() の初回呼び出しまで import されないため、即時 import も Maya 外の Python で計測できます。
+"""
+
+import argparse
+import json
+import logging
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PACKAGE_NAME = (__package__ or '').rpartition('.')[0]
+PACKAGE_PARENT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# cold import で読み込まれていないことを期待する重いモジュールの接頭辞
+HEAVY_MODULE_PREFIXES = (
+    'PySide6',
+    'PySide2',
+    'shiboken6',
+    'shiboken2',
+    'maya.OpenMayaUI',
+    f'{PACKAGE_NAME}.window',
+    f'{PACKAGE_NAME}.app.main',
+)
+
+# restore の経路では使われるまで読み込まれないことを期待するモジュールの接頭辞
+DEFERRED_MODULE_PREFIXES = (
+    'asyncio',
+    'cProfile',
+    'pstats',
+    f'{PACKAGE_NAME}.async_tasks',
+    f'{PACKAGE_NAME}.data_panel',
+    f'{PACKAGE_NAME}.leak_tracker',
+    f'{PACKAGE_NAME}.log_handler',
+    f'{PACKAGE_NAME}.log_panel',
+    f'{PACKAGE_NAME}.tasks',
+    f'{PACKAGE_NAME}.ui_batch',
+    f'{PACKAGE_NAME}.ui_state',
+)
+
+SCENARIOS: Dict[str, str] = {
+    'package': f'import {PACKAGE_NAME}',
+    'setup_logging': f'from {PACKAGE_NAME} import setup_logging',
+    'restore': f'from {PACKAGE_NAME} import restore',
+    'restore_placeholder': '; '.join(
+        (
+            "import os",
+            "os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')",
+            f'from {PACKAGE_NAME} import host, restore, window_config',
+            f'from {PACKAGE_NAME}.host.fake_host import FakeHost',
+            'host.set_host(FakeHost())',
+            'host.get_host().workspace_control(window_config.WORKSPACE_CONTROL_NAME)',
+            'restore()',
+        )
+    ),
+    'eager': '; '.join(
+        f'import {name}'
+        for name in (f'{PACKAGE_NAME}.app.main', f'{PACKAGE_NAME}.window')
+        + tuple(prefix for prefix in DEFERRED_MODULE_PREFIXES if prefix.startswith(PACKAGE_NAME))
+    ),
+}
+# restore の経路のシナリオと、読み込まれてもよい重いモジュールの接頭辞
+RESTORE_SCENARIOS: Dict[str, Tuple[str, ...]] = {
+    'restore': (f'{PACKAGE_NAME}.app.main',),
+    'restore_placeholder': ('PySide6', 'PySide2', 'shiboken6', 'shiboken2', f'{PACKAGE_NAME}.app.main'),
+}
+
+_PROBE = '''
+import json, sys, time
+t = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - t
+def matches(name, prefixes):
+    return any(name == prefix or name.startswith(prefix + '.') for prefix in prefixes)
+heavy = sorted(m for m in sys.modules if matches(m, {prefixes!r}))
+deferred = sorted(m for m in sys.modules if matches(m, {deferred_prefixes!r}))
+print(json.dumps({{'seconds': elapsed, 'heavy': heavy, 'deferred': deferred}}))
+'''
+
+
+def _matches(name: str, prefixes: Tuple[str, ...]) -> bool:
+    # window_config が window に一致しないよう、モジュール名の区切りで比較する
+    return any(name == prefix or name.startswith(prefix + '.') for prefix in prefixes)
+
+
+def measure(statement: str, python: str, repeat: int) -> Dict[str, object]:
+    """新しいプロセスで statement を実行し import 時間を計測する
+
+    Args:
+        statement (str): 計測する import 文
+        python (str): 使用する Python 実行ファイル
+        repeat (int): 計測回数
+
+    Returns:
+        Dict[str, object]: 計測結果（seconds, heavy, deferred, error）
+    """
+    code = _PROBE.format(
+        statement=statement, prefixes=HEAVY_MODULE_PREFIXES, deferred_prefixes=DEFERRED_MODULE_PREFIXES
+    )
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(p for p in (PACKAGE_PARENT, env.get('PYTHONPATH')) if p)
+    env['PYTHONDONTWRITEBYTECODE'] = '1'
+
+    samples: List[float] = []
+    heavy: List[str] = []
+    deferred: List[str] = []
+    for _ in range(repeat):
+        proc = subprocess.run([python, '-c', code], env=env, capture_output=True, text=True)
+        if proc.returncode != 0:
+            error = proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else f'exit code {proc.returncode}'
+            return {'seconds': [], 'heavy': [], 'deferred': [], 'error': error}
+        result = json.loads(proc.stdout.strip().splitlines()[-1])
+        samples.append(result['seconds'])
+        heavy = result['heavy']
+        deferred = result['deferred']
+    return {'seconds': samples, 'heavy': heavy, 'deferred': deferred, 'error': None}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """import 時間を計測して結果を出力する
+
+    Returns:
+        int: パッケージの cold import で重いモジュールが読み込まれた場合、
+            または restore の経路で想定外の重いモジュールや機能のモジュールが読み込まれた場合は 1、それ以外は 0
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=10, help='各シナリオの計測回数')
+    parser.add_argument('--python', default=sys.executable, help='計測に使用する Python（mayapy など）')
+    parser.add_argument('--json', dest='json_path', help='結果を JSON で書き出すパス')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
+    results = {name: measure(statement, args.python, args.repeat) for name, statement in SCENARIOS.items()}
+
+    for name, result in results.items():
+        if result['error']:
+            logger.info('%-19s 失敗: %s', name, result['error'])
+            continue
+        samples = result['seconds']
+        logger.info(
+            '%-19s median %7.2f ms  min %7.2f ms  heavy modules: %d  deferred modules: %d',
+            name,
+            statistics.median(samples) * 1000,
+            min(samples) * 1000,
+            len(result['heavy']),
+            len(result['deferred']),
+        )
+
+    package, eager = results['package'], results['eager']
+    if not package['error'] and not eager['error']:
+        saved = statistics.median(eager['seconds']) - statistics.median(package['seconds'])
+        logger.info('遅延 import による短縮: %.2f ms', saved * 1000)
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+    failed = False
+    if package['heavy']:
+        logger.error('パッケージの import で重いモジュールが読み込まれています: %s', ', '.join(package['heavy']))
+        failed = True
+    for name, allowed in RESTORE_SCENARIOS.items():
+        result = results[name]
+        if result['error']:
+            logger.error('%s: 失敗しました: %s', name, result['error'])
+            failed = True
+            continue
+        unexpected = [module for module in result['heavy'] if not _matches(module, allowed)] + result['deferred']
+        if unexpected:
+            logger.error(
+                '%s: 使われるまで読み込まないはずのモジュールが読み込まれています: %s', name, ', '.join(unexpected)
+            )
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,311 @@
+"""
+ウィンドウのライフサイクルのベンチマークスクリプト
+
+start()（新規・事前構築済み・既存）/ restart() / restore / setVisible→show の各経路を繰り返し実行し、以下を計測します:
+    - median_ms: 1 回あたりの実行時間の中央値
+    - qt_objects: 1 回あたりに親へ追加された QObject の数（生成された Qt オブジェクトの目安）
+    - host_calls: 1 回あたりに発行された Maya の UI コマンドの数（workspaceControl, findControl など）
+    - peak_kib: 1 回の実行中に増えた Python のメモリ使用量のピーク
+
+結果はベースライン（既定は benchmarks/baselines/lifecycle.json）と比較し、
+ベースラインに記録された閾値を超えて悪化した項目があれば終了コード 1 を返します。
+既定では host.fake_host.FakeHost を使うため Maya は不要です。
+
+使用方法:
+    python -m pyside_template_window.benchmarks.lifecycle --iterations 50
+    python -m pyside_template_window.benchmarks.lifecycle --update-baseline
+
+Note:
+    実行時間はマシンに依存するため、ベースラインは CI と同じ環境で --update-baseline して更新してください。
+    qt_objects と host_calls は環境に依存しないため、閾値は 0（増えたら失敗）にしています。
+"""
+
+import argparse
+import gc
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+# FakeHost が QApplication を生成する前に設定する必要がある
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+try:
+    from PySide6.QtCore import QEvent, QObject  # type: ignore
+    from PySide6.QtWidgets import QApplication, QMainWindow  # type: ignore
+except ImportError:
+    from PySide2.QtCore import QEvent, QObject  # type: ignore
+    from PySide2.QtWidgets import QApplication, QMainWindow  # type: ignore
+
+from .. import host, utils
+from ..app import main as app_main
+from ..app.warm_pool import warm_pool
+from ..host.fake_host import FakeHost
+from ..window import PySideTemplateWindow
+
+logger = logging.getLogger(__name__)
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines', 'lifecycle.json')
+
+# ベースラインファイルに閾値が無い場合の既定値（上限 = ベースライン * (1 + relative) + absolute）
+DEFAULT_THRESHOLDS: Dict[str, Dict[str, float]] = {
+    'median_ms': {'relative': 0.5, 'absolute': 2.0},
+    'qt_objects': {'relative': 0.0, 'absolute': 0.0},
+    'host_calls': {'relative': 0.0, 'absolute': 0.0},
+    'peak_kib': {'relative': 0.25, 'absolute': 32.0},
+}
+
+
+class Scenario(NamedTuple):
+    """setup() は計測の対象外、run() が計測対象"""
+
+    setup: Callable[[], None]
+    run: Callable[[], None]
+    fake_only: bool = False
+
+
+class _ObjectCounter(QObject):
+    """QApplication に設置して、QObject が親に追加された回数を数えるイベントフィルター"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.count = 0
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if event.type() == QEvent.ChildAdded:
+            self.count += 1
+        return False
+
+
+def _process_events() -> None:
+    backend = host.get_host()
+    if isinstance(backend, FakeHost):
+        backend.process_events()
+
+
+def _ensure_shown() -> None:
+    app_main.start()
+    _process_events()
+
+
+def _ensure_closed() -> None:
+    # close() は warm_up() されていると事前構築を予約するため、start_warm 以外では無効にしておく
+    warm_pool.disable()
+    app_main.close()
+    _process_events()
+
+
+def _ensure_hidden() -> None:
+    """☓ボタンで閉じた状態（WorkspaceControl とウィンドウは残る）にします"""
+    _ensure_shown()
+    host.get_host().workspace_control(PySideTemplateWindow.WORKSPACE_CONTROL_NAME, e=True, close=True)
+    _process_events()
+
+
+def _ensure_warm() -> None:
+    """close() した後、warm_up() で事前構築されたウィンドウがある状態にします"""
+    _ensure_closed()
+    warm_pool.enable()
+    _process_events()
+
+
+def _show_wrapped() -> None:
+    """Maya 側から見つけたウィンドウを QMainWindow としてラップして show() します（setVisible → show）"""
+    ptr = utils.get_maya_control_pointer(PySideTemplateWindow.NAME)
+    utils.safe_wrap_instance(ptr, QMainWindow).show()
+
+
+def _simulate_restore() -> None:
+    backend = host.get_host()
+    assert isinstance(backend, FakeHost)
+    backend.simulate_restore(PySideTemplateWindow.WORKSPACE_CONTROL_NAME)
+    # DEFERRED_RESTORE の場合、ウィンドウの構築はイベントループで行われる
+    backend.process_events()
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    'start_new': Scenario(_ensure_closed, app_main.start),
+    'start_warm': Scenario(_ensure_warm, app_main.start),
+    'start_existing': Scenario(_ensure_hidden, app_main.start),
+    'setvisible_show': Scenario(_ensure_hidden, _show_wrapped),
+    'restart': Scenario(_ensure_shown, app_main.restart),
+    'restore': Scenario(_ensure_shown, _simulate_restore, fake_only=True),
+}
+
+
+def measure(scenario: Scenario, iterations: int, warmup: int = 3) -> Dict[str, float]:
+    """
+    シナリオを繰り返し実行して計測します
+
+    実行時間は計測用のフックを外した状態で計測し、Qt オブジェクト数・コマンド数・メモリは
+    別の 1 回で計測します（tracemalloc などのオーバーヘッドが実行時間に混ざらないようにするため）。
+
+    Args:
+        scenario (Scenario): 計測するシナリオ
+        iterations (int): 実行時間を計測する回数
+        warmup (int): 計測前に実行する回数
+
+    Returns:
+        Dict[str, float]: 計測結果
+    """
+    for _ in range(warmup):
+        scenario.setup()
+        scenario.run()
+
+    durations: List[float] = []
+    for _ in range(iterations):
+        scenario.setup()
+        gc.collect()
+        start = time.perf_counter()
+        scenario.run()
+        durations.append((time.perf_counter() - start) * 1000)
+
+    backend = host.get_host()
+    counter = _ObjectCounter()
+    qt_app = QApplication.instance()
+    # 初回の tracemalloc 下の実行は一度だけ確保されるキャッシュなどを含むため、2 回目の結果を使う
+    for _ in range(2):
+        scenario.setup()
+        gc.collect()
+        backend.reset_call_counts()
+        counter.count = 0
+        qt_app.installEventFilter(counter)
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            scenario.run()
+            peak = tracemalloc.get_traced_memory()[1] - before
+        finally:
+            tracemalloc.stop()
+            qt_app.removeEventFilter(counter)
+
+    return {
+        'median_ms': statistics.median(durations),
+        'min_ms': min(durations),
+        'qt_objects': counter.count,
+        'host_calls': backend.total_calls(),
+        'peak_kib': peak / 1024,
+    }
+
+
+def run(names: Optional[List[str]] = None, iterations: int = 30) -> Dict[str, Dict[str, float]]:
+    """
+    シナリオを実行して結果を返します
+
+    Maya のスクリプトエディタから host.set_host() 済みの状態で呼ぶこともできます。
+    FakeHost 以外では restore のシナリオはスキップされます。
+
+    Args:
+        names (Optional[List[str]]): 実行するシナリオ名。None の場合はすべて
+        iterations (int): 実行時間を計測する回数
+
+    Returns:
+        Dict[str, Dict[str, float]]: シナリオ名 → 計測結果
+    """
+    is_fake = isinstance(host.get_host(), FakeHost)
+    results: Dict[str, Dict[str, float]] = {}
+    for name in names or list(SCENARIOS):
+        scenario = SCENARIOS[name]
+        if scenario.fake_only and is_fake is False:
+            logger.info('%s: FakeHost 以外では実行できないためスキップします', name)
+            continue
+        results[name] = measure(scenario, iterations)
+    _ensure_closed()
+    return results
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Any]) -> List[str]:
+    """
+    結果をベースラインと比較し、閾値を超えて悪化した項目を返します
+
+    Args:
+        results: run() の結果
+        baseline: ベースラインファイルの内容（'results' と任意の 'thresholds'）
+
+    Returns:
+        List[str]: 悪化した項目の説明
+    """
+    thresholds = dict(DEFAULT_THRESHOLDS)
+    thresholds.update(baseline.get('thresholds', {}))
+    regressions: List[str] = []
+    for name, metrics in results.items():
+        expected = baseline.get('results', {}).get(name)
+        if expected is None:
+            continue
+        for metric, threshold in thresholds.items():
+            if metric not in expected:
+                continue
+            limit = expected[metric] * (1 + threshold['relative']) + threshold['absolute']
+            if metrics[metric] > limit:
+                regressions.append(
+                    f'{name}.{metric}: {metrics[metric]:.2f} > {limit:.2f} (baseline {expected[metric]:.2f})'
+                )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Returns:
+        int: ベースラインから悪化した項目がある場合は 1、それ以外は 0
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--iterations', type=int, default=30)
+    parser.add_argument('--scenario', action='append', choices=sorted(SCENARIOS), help='実行するシナリオ（複数指定可）')
+    parser.add_argument('--baseline', default=BASELINE_PATH, help='ベースラインファイルのパス')
+    parser.add_argument('--update-baseline', action='store_true', help='結果でベースラインを更新する')
+    parser.add_argument('--output', help='結果を JSON で書き出すパス')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
+    if os.environ.get('PYSIDE_TEMPLATE_HOST') is None:
+        host.set_host(FakeHost())
+
+    results = run(args.scenario, args.iterations)
+    for name, metrics in results.items():
+        logger.info(
+            '%-16s median %8.2f ms  min %8.2f ms  qt_objects %4d  host_calls %3d  peak %8.1f KiB',
+            name,
+            metrics['median_ms'],
+            metrics['min_ms'],
+            metrics['qt_objects'],
+            metrics['host_calls'],
+            metrics['peak_kib'],
+        )
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+    baseline: Dict[str, Any] = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    if args.update_baseline:
+        merged = dict(baseline.get('results', {}))
+        merged.update(results)
+        baseline = {'thresholds': baseline.get('thresholds', DEFAULT_THRESHOLDS), 'results': merged}
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(baseline, f, indent=2)
+            f.write('\n')
+        logger.info('ベースラインを更新しました: %s', args.baseline)
+        return 0
+
+    if not baseline:
+        logger.warning('ベースラインが見つかりません: %s（--update-baseline で作成してください）', args.baseline)
+        return 0
+
+    regressions = compare(results, baseline)
+    for regression in regressions:
+        logger.error('悪化: %s', regression)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,172 @@
+"""
+ウィンドウレジストリの restart サイクルでのメモリ計測スクリプト
+
+--instances 個のインスタンスを start() し、app.main.restart() を繰り返して以下を確認します:
+    - restart のたびに、古いウィンドウが destroyed → _release_instance でレジストリから解放され、GC されること
+    - レジストリ（WindowRegistry._docked / _known）が最新のウィンドウだけを指していること
+    - すべてのインスタンスを close() した後、レジストリが空になり、QObject 数が start() 前と同じに戻ること
+    - restart を繰り返してもメモリ使用量が増え続けないこと
+
+既定では host.fake_host.FakeHost を使うため Maya は不要です。
+いずれかを満たさない場合は終了コード 1 を返します。
+
+使用方法:
+    python -m pyside_template_window.benchmarks.registry_cycles --cycles 100 --instances 4
+"""
+
+import argparse
+import gc
+import logging
+import os
+import sys
+import tracemalloc
+import weakref
+from typing import Any, Dict, List, Optional
+
+# FakeHost が QApplication を生成する前に設定する必要がある
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from .. import host, leak_tracker
+from ..app import main as app_main
+from ..host.fake_host import FakeHost
+from ..registry import window_registry
+
+logger = logging.getLogger(__name__)
+
+
+def _process_events() -> None:
+    backend = host.get_host()
+    if isinstance(backend, FakeHost):
+        backend.process_events()
+
+
+def _qt_object_count() -> int:
+    return sum(leak_tracker.snapshot().qt.values())
+
+
+def _registry_holds_latest(instance_id: str) -> bool:
+    window = window_registry.get(instance_id)
+    return window is not None and window_registry.find(instance_id) is window
+
+
+def _close_all(instance_ids: List[str]) -> None:
+    for instance_id in instance_ids:
+        app_main.close(instance_id)
+    _process_events()
+
+
+def run(cycles: int, instances: int, samples: int = 20) -> Dict[str, Any]:
+    """
+    restart サイクルを繰り返し、レジストリ・QObject 数・メモリ使用量を記録します
+
+    Args:
+        cycles (int): restart の回数（インスタンスごと）
+        instances (int): 同時に開くインスタンス数
+        samples (int): メモリ使用量の計測点の数
+
+    Returns:
+        Dict[str, Any]: 計測結果
+    """
+    instance_ids = [f'shot{index:03d}' for index in range(instances)]
+
+    # 1 回目の start() で作られるキャッシュなどを除くため、一度開いて閉じてから基準を取る
+    for instance_id in instance_ids:
+        app_main.start(instance_id)
+    _process_events()
+    _close_all(instance_ids)
+    baseline_qt = _qt_object_count()
+
+    for instance_id in instance_ids:
+        app_main.start(instance_id)
+    _process_events()
+
+    interval = max(cycles // samples, 1)
+    traced: List[int] = []
+    stale = 0
+    mismatched = 0
+    tracemalloc.start()
+    try:
+        for cycle in range(cycles):
+            replaced = [weakref.ref(window_registry.get(instance_id)) for instance_id in instance_ids]
+            for instance_id in instance_ids:
+                app_main.restart(instance_id)
+            _process_events()
+            gc.collect()
+            # 古いウィンドウは解放されて GC されている
+            stale += sum(1 for ref in replaced if ref() is not None)
+            mismatched += sum(1 for instance_id in instance_ids if not _registry_holds_latest(instance_id))
+            if cycle % interval == 0 or cycle == cycles - 1:
+                traced.append(tracemalloc.get_traced_memory()[0])
+    finally:
+        tracemalloc.stop()
+
+    docked_after_cycles = len(window_registry)
+    _close_all(instance_ids)
+    gc.collect()
+    return {
+        'baseline_qt': baseline_qt,
+        'final_qt': _qt_object_count(),
+        'docked_after_cycles': docked_after_cycles,
+        'docked_after_close': len(window_registry._docked),
+        'known_after_close': len(window_registry._known),
+        'stale_windows': stale,
+        'mismatched': mismatched,
+        'traced': traced,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Returns:
+        int: レジストリまたは QObject 数が基準に戻らない、またはメモリ増加が許容量を超えた場合は 1、それ以外は 0
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--cycles', type=int, default=100)
+    parser.add_argument('--instances', type=int, default=4)
+    parser.add_argument('--tolerance', type=int, default=128 * 1024, help='許容するメモリ増加量（バイト）')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
+    if os.environ.get('PYSIDE_TEMPLATE_HOST') is None:
+        host.set_host(FakeHost())
+
+    results = run(args.cycles, args.instances)
+    # 最初の数点はキャッシュの確保などを含むためウォームアップとして除外する
+    steady = results['traced'][len(results['traced']) // 4 :]
+    growth = steady[-1] - steady[0]
+    logger.info(
+        'cycles=%d instances=%d  QObject %d → %d  docked %d → %d  known %d  stale %d  mismatched %d  メモリ %+.1f KiB',
+        args.cycles,
+        args.instances,
+        results['baseline_qt'],
+        results['final_qt'],
+        results['docked_after_cycles'],
+        results['docked_after_close'],
+        results['known_after_close'],
+        results['stale_windows'],
+        results['mismatched'],
+        growth / 1024,
+    )
+
+    failed = False
+    if results['docked_after_cycles'] != args.instances or results['mismatched']:
+        logger.error('レジストリが最新のウィンドウを保持していません')
+        failed = True
+    if results['stale_windows']:
+        logger.error('restart 後も古いウィンドウが %d 個残っています', results['stale_windows'])
+        failed = True
+    if results['docked_after_close'] or results['known_after_close']:
+        logger.error('close() 後もレジストリにウィンドウが残っています')
+        failed = True
+    if results['final_qt'] != results['baseline_qt']:
+        logger.error('QObject 数が基準に戻りません: %+d', results['final_qt'] - results['baseline_qt'])
+        failed = True
+    if growth > args.tolerance:
+        logger.error('メモリ使用量が増え続けています')
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,145 @@
+"""
+resources のベンチマークスクリプト
+
+--icons 個の PNG を一時フォルダに作り、アイコンを使うウィンドウを --windows 回作る（restore で複数のツールを
+復元する場合や、restart を繰り返す場合）のと同じ読み込みを、以下の方法で比較します:
+    - disk: ウィンドウごとに QPixmap(パス) でファイルから読み込みます（キャッシュなし）
+    - cache: ResourceCache で検索パスのフォルダから読み込みます
+    - bundle: ResourceCache で build_bundle() したバンドルファイルから読み込みます
+
+計測値:
+    - first_ms: 1 つ目のウィンドウのアイコンの読み込み時間
+    - rest_ms: 2 つ目以降のウィンドウのアイコンの読み込み時間の中央値
+    - total_ms: すべてのウィンドウのアイコンの読み込み時間の合計（bundle はバンドルの読み込みを含みます）
+    - file_opens: ファイルを参照した回数（disk では QPixmap(パス) の呼び出しごとにファイルの情報を取得します）
+    - images: メモリ上の画像の数（QPixmap.cacheKey() の種類）。disk でも Qt の QPixmapCache（既定 10 MB）に
+      収まる間は共有されますが、超えると読み込み直します
+
+cache / bundle の images が --icons を超えた場合（画像が共有されていない場合）は終了コード 1 を返します。
+Maya は不要です（offscreen の QApplication で実行します）。
+
+使用方法:
+    python -m pyside_template_window.benchmarks.resources --icons 200 --windows 10
+"""
+
+import argparse
+import logging
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+try:
+    from PySide6.QtGui import QColor, QImage, QPixmap  # type: ignore
+    from PySide6.QtWidgets import QApplication  # type: ignore
+except ImportError:
+    from PySide2.QtGui import QColor, QImage, QPixmap  # type: ignore
+    from PySide2.QtWidgets import QApplication  # type: ignore
+
+from ..resources import ResourceCache, build_bundle
+
+logger = logging.getLogger(__name__)
+
+METHODS = ('disk', 'cache', 'bundle')
+
+
+def _make_icons(directory: str, icons: int, size: int) -> List[str]:
+    keys = []
+    for index in range(icons):
+        key = f'icons/icon_{index:04d}.png'
+        image = QImage(size, size, QImage.Format_ARGB32)
+        image.fill(QColor((index * 37) % 256, (index * 91) % 256, (index * 53) % 256, 200))
+        path = os.path.join(directory, *key.split('/'))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        image.save(path)
+        keys.append(key)
+    return keys
+
+
+def _measure(method: str, directory: str, bundle_path: str, keys: List[str], windows: int) -> Dict[str, float]:
+    cache = ResourceCache()
+    durations: List[float] = []
+    images = set()
+    file_opens = 0
+    start = time.perf_counter()
+    if method == 'cache':
+        cache.add_search_path(directory)
+    elif method == 'bundle':
+        cache.load_bundle(bundle_path)
+        file_opens += 1
+    setup = time.perf_counter() - start
+
+    for _ in range(windows):
+        window_start = time.perf_counter()
+        for key in keys:
+            if method == 'disk':
+                pixmap = QPixmap(os.path.join(directory, *key.split('/')))
+                file_opens += 1
+            else:
+                pixmap = cache.pixmap(key)
+            images.add(pixmap.cacheKey())
+        durations.append(time.perf_counter() - window_start)
+
+    file_opens += cache.stats()['file_reads']
+    return {
+        'first_ms': durations[0] * 1000,
+        'rest_ms': statistics.median(durations[1:]) * 1000 if len(durations) > 1 else 0.0,
+        'total_ms': (setup + sum(durations)) * 1000,
+        'file_opens': file_opens,
+        'images': len(images),
+    }
+
+
+def run(icons: int, windows: int, size: int = 32) -> Dict[str, Dict[str, float]]:
+    """
+    ベンチマークを実行します
+
+    Returns:
+        Dict[str, Dict[str, float]]: 方法ごとの結果
+    """
+    QApplication.instance() or QApplication(sys.argv[:1])
+    directory = tempfile.mkdtemp(prefix='pyside_template_resources_')
+    try:
+        keys = _make_icons(directory, icons, size)
+        bundle_path = os.path.join(directory, 'icons.bundle')
+        build_bundle(directory, bundle_path)
+        return {method: _measure(method, directory, bundle_path, keys, windows) for method in METHODS}
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Returns:
+        int: キャッシュで画像が共有されていない場合は 1、それ以外は 0
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--icons', type=int, default=200, help='ウィンドウごとに使うアイコンの数')
+    parser.add_argument('--windows', type=int, default=10, help='アイコンを読み込むウィンドウの数')
+    parser.add_argument('--size', type=int, default=32, help='アイコンの幅と高さ（ピクセル）')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
+    results = run(args.icons, args.windows, args.size)
+    for name, metrics in results.items():
+        details = '  '.join(f'{key} {value:,.1f}' for key, value in metrics.items())
+        logger.info('%-8s %s', name, details)
+
+    failed = False
+    for method in ('cache', 'bundle'):
+        if results[method]['images'] > args.icons:
+            logger.error(
+                '%s: %d 個のアイコンが %d 個の画像として読み込まれました', method, args.icons, results[method]['images']
+            )
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
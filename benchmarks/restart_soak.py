@@ -0,0 +1,129 @@
+"""
+restart の耐久テストスクリプト
+
+restart() を繰り返し実行し、生存している QObject 数と Python のメモリ使用量が
+一定（定常状態）に収まることを確認します。増え続けている場合は、最初の定常状態の計測点から
+増えた型を leak_tracker で報告して終了コード 1 を返します。
+
+既定では host.fake_host.FakeHost を使うため Maya は不要です。
+
+使用方法:
+    python -m pyside_template_window.benchmarks.restart_soak --cycles 500
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tracemalloc
+from typing import List, NamedTuple, Optional, Tuple
+
+# FakeHost が QApplication を生成する前に設定する必要がある
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from .. import host, leak_tracker
+from ..app import main as app_main
+from ..host.fake_host import FakeHost
+
+logger = logging.getLogger(__name__)
+
+
+class Sample(NamedTuple):
+    cycle: int
+    qt_objects: int
+    python_objects: int
+    traced_bytes: int
+
+
+def _process_events() -> None:
+    backend = host.get_host()
+    if isinstance(backend, FakeHost):
+        backend.process_events()
+
+
+def run(cycles: int, warmup: int, samples: int = 20) -> Tuple[List[Sample], leak_tracker.Snapshot]:
+    """
+    restart を繰り返し、一定間隔で生存オブジェクト数とメモリ使用量を記録します
+
+    Args:
+        cycles (int): ウォームアップ後の restart の回数
+        warmup (int): 計測前の restart の回数
+        samples (int): 計測点の数
+
+    Returns:
+        Tuple[List[Sample], leak_tracker.Snapshot]: 計測点ごとの記録（最初の要素はウォームアップ直後）と、
+            ウォームアップ直後のスナップショット
+    """
+    app_main.start()
+    _process_events()
+    for _ in range(warmup):
+        app_main.restart()
+        _process_events()
+
+    interval = max(cycles // samples, 1)
+    results: List[Sample] = []
+    steady = leak_tracker.snapshot()
+    tracemalloc.start()
+    try:
+        for cycle in range(cycles + 1):
+            if cycle % interval == 0 or cycle == cycles:
+                snapshot = leak_tracker.snapshot()
+                results.append(
+                    Sample(
+                        cycle,
+                        sum(snapshot.qt.values()),
+                        sum(snapshot.python.values()),
+                        tracemalloc.get_traced_memory()[0],
+                    )
+                )
+            if cycle < cycles:
+                app_main.restart()
+                _process_events()
+    finally:
+        tracemalloc.stop()
+    return results, steady
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Returns:
+        int: QObject 数が増えた、またはメモリ増加が許容量を超えた場合は 1、それ以外は 0
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--cycles', type=int, default=200)
+    parser.add_argument('--warmup', type=int, default=5)
+    parser.add_argument('--tolerance', type=int, default=128 * 1024, help='許容するメモリ増加量（バイト）')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
+    if os.environ.get('PYSIDE_TEMPLATE_HOST') is None:
+        host.set_host(FakeHost())
+
+    samples, steady = run(args.cycles, args.warmup)
+    for sample in samples:
+        logger.info(
+            'cycle %5d  QObject %5d  Python objects %7d  traced %8.1f KiB',
+            sample.cycle,
+            sample.qt_objects,
+            sample.python_objects,
+            sample.traced_bytes / 1024,
+        )
+
+    first, last = samples[0], samples[-1]
+    qt_growth = last.qt_objects - first.qt_objects
+    memory_growth = last.traced_bytes - first.traced_bytes
+    logger.info('restart %d 回: QObject %+d 個  メモリ %+.1f KiB', args.cycles, qt_growth, memory_growth / 1024)
+
+    failed = qt_growth > 0 or memory_growth > args.tolerance
+    if failed:
+        report = leak_tracker.diff(steady, leak_tracker.snapshot(), 'restart_soak')
+        logger.error('定常状態になっていません\n%s', report.format())
+
+    app_main.close()
+    _process_events()
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,176 @@
+"""
+ui_batch のベンチマークスクリプト
+
+表示中のウィジェットにウィジェットを大量に追加・更新し、UpdateBatch を使った場合と使わない場合で以下を比較します:
+    - median_ms: 更新と、その後の描画が終わるまでの時間の中央値
+    - paints: 処理された再描画イベント（QEvent.Paint）の数
+    - layout_requests: 処理されたレイアウト要求（QEvent.LayoutRequest）の数
+
+シナリオ:
+    - chunked: --chunks 回に分けて追加し、チャンクごとにイベントループを回します（タスクの結果を少しずつ反映する場合など）
+    - bulk: すべてを一度に追加・更新してから、イベントループを 1 回回します
+
+UpdateBatch を使った場合の paints または layout_requests が使わない場合より多い場合は終了コード 1 を返します。
+Maya は不要です（offscreen の QApplication で実行します）。
+
+使用方法:
+    python -m pyside_template_window.benchmarks.ui_batch --widgets 500 --chunks 20
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import sys
+import time
+from typing import Dict, List, Optional
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+try:
+    from PySide6.QtCore import QEvent, QObject  # type: ignore
+    from PySide6.QtWidgets import (  # type: ignore
+        QApplication,
+        QGroupBox,
+        QLabel,
+        QLineEdit,
+        QVBoxLayout,
+        QWidget,
+    )
+except ImportError:
+    from PySide2.QtCore import QEvent, QObject  # type: ignore
+    from PySide2.QtWidgets import (  # type: ignore
+        QApplication,
+        QGroupBox,
+        QLabel,
+        QLineEdit,
+        QVBoxLayout,
+        QWidget,
+    )
+
+from ..ui_batch import UpdateBatch
+
+logger = logging.getLogger(__name__)
+
+SCENARIOS = ('chunked', 'bulk')
+
+
+class _EventCounter(QObject):
+    """QApplication に設置して、再描画とレイアウト要求の数を数えるイベントフィルター"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.paints = 0
+        self.layout_requests = 0
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        event_type = event.type()
+        if event_type == QEvent.Paint:
+            self.paints += 1
+        elif event_type == QEvent.LayoutRequest:
+            self.layout_requests += 1
+        return False
+
+
+def _update(app: QApplication, root: QWidget, status: QLineEdit, widgets: int, chunks: int) -> None:
+    """グループボックスとラベルを追加し、ステータスの入力欄を更新します"""
+    per_chunk = max(widgets // chunks, 1)
+    for chunk in range(chunks):
+        box = QGroupBox(f'group {chunk}')
+        box_layout = QVBoxLayout(box)
+        for index in range(per_chunk):
+            box_layout.addWidget(QLabel(f'label {chunk}-{index}'))
+        root.layout().addWidget(box)
+        status.setText(f'{(chunk + 1) * per_chunk} / {widgets}')
+        if chunks > 1:
+            app.processEvents()
+
+
+def _measure(
+    app: QApplication, scenario: str, batched: bool, widgets: int, chunks: int, iterations: int
+) -> Dict[str, float]:
+    counter = _EventCounter()
+    durations: List[float] = []
+    frames = 0.0
+    for _ in range(iterations):
+        root = QWidget()
+        root.resize(600, 800)
+        status = QLineEdit(root)
+        QVBoxLayout(root).addWidget(status)
+        root.show()
+        app.processEvents()
+
+        counter.paints = counter.layout_requests = 0
+        app.installEventFilter(counter)
+        start = time.perf_counter()
+        if batched:
+            with UpdateBatch(root) as batch:
+                _update(app, root, status, widgets, chunks if scenario == 'chunked' else 1)
+            frames = batch.stats()['frames']
+        else:
+            _update(app, root, status, widgets, chunks if scenario == 'chunked' else 1)
+        app.processEvents()
+        durations.append((time.perf_counter() - start) * 1000)
+        app.removeEventFilter(counter)
+
+        root.close()
+        root.deleteLater()
+        app.processEvents()
+
+    result = {
+        'median_ms': statistics.median(durations),
+        'paints': counter.paints,
+        'layout_requests': counter.layout_requests,
+    }
+    if batched:
+        result['frames'] = frames
+    return result
+
+
+def run(widgets: int, chunks: int, iterations: int = 5) -> Dict[str, Dict[str, float]]:
+    """
+    ベンチマークを実行します
+
+    Returns:
+        Dict[str, Dict[str, float]]: '<シナリオ>' と '<シナリオ>+batch' ごとの結果
+    """
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    results: Dict[str, Dict[str, float]] = {}
+    for scenario in SCENARIOS:
+        results[scenario] = _measure(app, scenario, False, widgets, chunks, iterations)
+        results[f'{scenario}+batch'] = _measure(app, scenario, True, widgets, chunks, iterations)
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Returns:
+        int: UpdateBatch を使った場合に再描画またはレイアウト要求が増えた場合は 1、それ以外は 0
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--widgets', type=int, default=500, help='追加するラベルの数')
+    parser.add_argument('--chunks', type=int, default=20, help='chunked シナリオの分割数')
+    parser.add_argument('--iterations', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
+    results = run(args.widgets, args.chunks, args.iterations)
+    for name, metrics in results.items():
+        details = '  '.join(f'{key} {value:,.1f}' for key, value in metrics.items())
+        logger.info('%-16s %s', name, details)
+
+    failed = False
+    for scenario in SCENARIOS:
+        plain, batched = results[scenario], results[f'{scenario}+batch']
+        for metric in ('paints', 'layout_requests'):
+            if batched[metric] > plain[metric]:
+                logger.error(
+                    '%s: UpdateBatch で %s が %d から %d に増えました', scenario, metric, plain[metric], batched[metric]
+                )
+                failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
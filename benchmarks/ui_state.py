@@ -0,0 +1,268 @@
+"""
+ui_state のベンチマークスクリプト
+
+列の多いテーブル・スプリッター・多数の入力欄を持つウィジェットの状態を保存し、以下を計測します:
+    - change: 変更のシグナル 1 回あたりにかかった時間（マイクロ秒）
+    - flush: 状態の取得と書き込みにかかった時間と、ファイルのサイズ
+    - build / restore_memory / restore_file: 状態なし・メモリ上の状態・ファイルの状態でウィジェットを構築して
+      bind() し、表示して最初のレイアウトを終えるまでの時間
+    - layout_requests: 表示までに処理されたレイアウト要求（QEvent.LayoutRequest）の数
+
+状態を適用してもレイアウトのやり直しが発生しないことを確認するため、restore_memory / restore_file の
+layout_requests が build より多い場合は終了コード 1 を返します。
+Maya は不要です（offscreen の QApplication で実行し、状態は一時フォルダに保存します）。
+
+使用方法:
+    python -m pyside_template_window.benchmarks.ui_state --tables 4 --columns 2000 --fields 200
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+try:
+    from PySide6.QtCore import (  # type: ignore
+        QAbstractTableModel,
+        QEvent,
+        QModelIndex,
+        QObject,
+        Qt,
+    )
+    from PySide6.QtWidgets import (  # type: ignore
+        QApplication,
+        QCheckBox,
+        QLineEdit,
+        QSplitter,
+        QTableView,
+        QVBoxLayout,
+        QWidget,
+    )
+except ImportError:
+    from PySide2.QtCore import (  # type: ignore
+        QAbstractTableModel,
+        QEvent,
+        QModelIndex,
+        QObject,
+        Qt,
+    )
+    from PySide2.QtWidgets import (  # type: ignore
+        QApplication,
+        QCheckBox,
+        QLineEdit,
+        QSplitter,
+        QTableView,
+        QVBoxLayout,
+        QWidget,
+    )
+
+from ..ui_state import StateStore, UIState
+
+logger = logging.getLogger(__name__)
+
+_NAME = 'UIStateBenchmark'
+
+
+class _ColumnsModel(QAbstractTableModel):
+    """列だけを持つ空のモデル（ヘッダーの状態の大きさだけを見るため）"""
+
+    def __init__(self, columns: int, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._columns = columns
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return self._columns
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        return None
+
+
+class _LayoutCounter(QObject):
+    """QApplication に設置して、レイアウト要求の数を数えるイベントフィルター"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.count = 0
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if event.type() == QEvent.LayoutRequest:
+            self.count += 1
+        return False
+
+
+def _build(store: StateStore, tables: int, columns: int, fields: int) -> QWidget:
+    """
+    ベンチマーク用のウィジェットを構築して bind() します（ウィンドウの _init_content() に相当します）
+    """
+    root = QWidget()
+    root.resize(1200, 800)
+    root.ui_state = UIState(_NAME, root, store)
+    layout = QVBoxLayout(root)
+    splitter = QSplitter(Qt.Vertical, root)
+    layout.addWidget(splitter)
+    for table_index in range(tables):
+        view = QTableView(splitter)
+        view.setModel(_ColumnsModel(columns, view))
+        splitter.addWidget(view)
+        root.ui_state.bind(f'table{table_index}', view.horizontalHeader())
+    form = QWidget(splitter)
+    form_layout = QVBoxLayout(form)
+    for field_index in range(fields):
+        if field_index % 2:
+            widget: QWidget = QLineEdit(form)
+        else:
+            widget = QCheckBox(f'option{field_index}', form)
+        form_layout.addWidget(widget)
+        root.ui_state.bind(f'field{field_index}', widget)
+    splitter.addWidget(form)
+    root.ui_state.bind('splitter', splitter)
+    return root
+
+
+def _modify(root: QWidget) -> None:
+    """保存する状態を作るため、すべての列の幅・順序と入力欄を変更します"""
+    for view in root.findChildren(QTableView):
+        header = view.horizontalHeader()
+        for column in range(header.count()):
+            header.resizeSection(column, 40 + column % 97)
+        header.moveSection(0, header.count() - 1)
+        header.setSortIndicator(1, Qt.DescendingOrder)
+    for index, edit in enumerate(root.findChildren(QLineEdit)):
+        edit.setText(f'value {index}')
+    for check_box in root.findChildren(QCheckBox):
+        check_box.setChecked(True)
+    splitter = root.findChild(QSplitter)
+    splitter.setSizes([100] * (splitter.count() - 1) + [400])
+
+
+def _measure_build(
+    app: QApplication, store: StateStore, tables: int, columns: int, fields: int, forget: bool, iterations: int
+) -> Dict[str, float]:
+    counter = _LayoutCounter()
+    durations: List[float] = []
+    for _ in range(iterations):
+        if forget:
+            store.forget()
+        app.processEvents()
+        counter.count = 0
+        app.installEventFilter(counter)
+        start = time.perf_counter()
+        root = _build(store, tables, columns, fields)
+        root.show()
+        app.processEvents()
+        durations.append((time.perf_counter() - start) * 1000)
+        app.removeEventFilter(counter)
+        root.close()
+        root.deleteLater()
+        app.processEvents()
+    return {'median_ms': statistics.median(durations), 'layout_requests': counter.count}
+
+
+def run(tables: int, columns: int, fields: int, iterations: int = 10) -> Dict[str, Dict[str, float]]:
+    """
+    ベンチマークを実行します
+
+    Returns:
+        Dict[str, Dict[str, float]]: 計測項目ごとの結果
+    """
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    results: Dict[str, Dict[str, float]] = {}
+
+    with tempfile.TemporaryDirectory() as state_dir:
+        empty_store = StateStore()
+        empty_store.state_dir = os.path.join(state_dir, 'empty')
+        results['build'] = _measure_build(app, empty_store, tables, columns, fields, False, iterations)
+
+        store = StateStore()
+        store.state_dir = state_dir
+        root = _build(store, tables, columns, fields)
+        root.show()
+        app.processEvents()
+
+        edit = root.findChild(QLineEdit)
+        count = 10000
+        start = time.perf_counter()
+        for index in range(count):
+            edit.setText(str(index))
+        setter_only = time.perf_counter() - start
+        root.ui_state.unbind('field1')
+        start = time.perf_counter()
+        for index in range(count):
+            edit.setText(str(-index))
+        unbound = time.perf_counter() - start
+        # 登録していない場合との差を変更の通知のコストとする
+        results['change'] = {'us_per_call': max(setter_only - unbound, 0.0) / count * 1e6}
+        root.ui_state.bind('field1', edit)
+
+        _modify(root)
+        start = time.perf_counter()
+        root.ui_state.flush()
+        flush_ms = (time.perf_counter() - start) * 1000
+        results['flush'] = {
+            'latency_ms': flush_ms,
+            'keys': len(root.ui_state.keys()),
+            'file_bytes': os.path.getsize(store.path_for(_NAME)),
+        }
+        root.close()
+        root.deleteLater()
+        app.processEvents()
+
+        results['restore_memory'] = _measure_build(app, store, tables, columns, fields, False, iterations)
+        results['restore_file'] = _measure_build(app, store, tables, columns, fields, True, iterations)
+
+        # 復元されていることを確認する
+        root = _build(store, tables, columns, fields)
+        header = root.findChild(QTableView).horizontalHeader()
+        restored = header.sectionSize(5) == 40 + 5 % 97 and header.visualIndex(0) == header.count() - 1
+        results['restore_file']['restored'] = float(restored)
+        root.deleteLater()
+        app.processEvents()
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Returns:
+        int: 状態の適用でレイアウト要求が増えた場合、または状態が復元されなかった場合は 1、それ以外は 0
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--tables', type=int, default=4)
+    parser.add_argument('--columns', type=int, default=2000, help='テーブルごとの列数')
+    parser.add_argument('--fields', type=int, default=200, help='入力欄の数')
+    parser.add_argument('--iterations', type=int, default=10)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
+    results = run(args.tables, args.columns, args.fields, args.iterations)
+    for name, metrics in results.items():
+        details = '  '.join(f'{key} {value:,.2f}' for key, value in metrics.items())
+        logger.info('%-16s %s', name, details)
+
+    failed = False
+    for name in ('restore_memory', 'restore_file'):
+        if results[name]['layout_requests'] > results['build']['layout_requests']:
+            logger.error(
+                '%s: レイアウト要求が %d 回から %d 回に増えました',
+                name,
+                results['build']['layout_requests'],
+                results[name]['layout_requests'],
+            )
+            failed = True
+    if not results['restore_file']['restored']:
+        logger.error('状態が復元されませんでした')
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
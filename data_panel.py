@@ -0,0 +1,407 @@
+"""
+大量のデータを表示するための model/view パネル
+
+シーンのノード一覧など数十万〜百万件のデータを、ウィジェットを 1 件ずつ作らずに表示します。
+
+- LazyTableModel は QAbstractItemModel（QAbstractTableModel）の実装で、fetchMore() により
+  batch_size 件ずつ行を公開します。スクロールするまで残りの行は view に見えません
+- 列の値は表示された時に初めて Column.getter で計算され、キャッシュされます
+- フィルターとソートは TaskRunner のワーカースレッドで行い、結果の並び（元の行番号の列）だけを
+  メインスレッドで model に反映します。フィルター入力はデバウンスされ、古い計算はキャンセルされます
+- ソートはチャンクごとにソートしてから heapq.merge() でマージします。1 回の list.sort() は GIL を
+  手放さないため、百万件を一度にソートするとその間 Maya の UI が止まってしまうためです
+
+Note:
+    フィルターとソートでは Column.getter がワーカースレッドから呼ばれます。
+    maya.cmds などメインスレッドでしか呼べない処理を含む列は thread_safe=False にしてください
+    （その列ではソート・フィルターが行われません）。
+
+使用例:
+    panel = DataPanel([Column('Name', str), Column('Type', node_type, thread_safe=False)], parent=self)
+    panel.set_items(cmds.ls(long=True))
+"""
+
+import array
+import heapq
+import itertools
+import logging
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence
+
+try:
+    from PySide6.QtCore import (  # type: ignore
+        QAbstractTableModel,
+        QModelIndex,
+        Qt,
+        QTimer,
+        Signal,
+    )
+    from PySide6.QtWidgets import (  # type: ignore
+        QHeaderView,
+        QLineEdit,
+        QTableView,
+        QVBoxLayout,
+        QWidget,
+    )
+except ImportError:
+    from PySide2.QtCore import (  # type: ignore
+        QAbstractTableModel,
+        QModelIndex,
+        Qt,
+        QTimer,
+        Signal,
+    )
+    from PySide2.QtWidgets import (  # type: ignore
+        QHeaderView,
+        QLineEdit,
+        QTableView,
+        QVBoxLayout,
+        QWidget,
+    )
+
+from .tasks import TaskContext, TaskHandle, TaskRunner
+
+logger = logging.getLogger(__name__)
+
+# fetchMore() で一度に公開する行数
+DEFAULT_BATCH_SIZE = 1000
+# 列ごとにキャッシュする値の最大数（超えたらその列のキャッシュを破棄します）
+CACHE_LIMIT = 200000
+# ソートで一度に list.sort() する件数（GIL を保持し続ける時間の上限になります）
+SORT_CHUNK_SIZE = 20000
+# キャンセルを確認する間隔（件数）
+_CANCEL_CHECK_INTERVAL = 10000
+
+
+class Column(NamedTuple):
+    """
+    表示する列の定義
+
+    Attributes:
+        title: ヘッダーに表示する名前
+        getter: 項目から表示する値を求める関数
+        thread_safe: getter をワーカースレッドから呼べるか（False の列はソート・フィルターしません）
+    """
+
+    title: str
+    getter: Callable[[Any], Any]
+    thread_safe: bool = True
+
+
+class LazyTableModel(QAbstractTableModel):
+    """
+    項目の列を遅延評価で表示するテーブルモデル
+
+    項目（items）は元の順序のまま保持し、フィルター・ソートの結果は元の行番号の列（order）として保持します。
+    """
+
+    def __init__(self, columns: Sequence[Column], batch_size: int = DEFAULT_BATCH_SIZE, parent=None) -> None:
+        super().__init__(parent)
+        self._columns = list(columns)
+        self._batch_size = batch_size
+        self._items: Sequence[Any] = ()
+        self._order: Sequence[int] = range(0)
+        self._loaded = 0
+        self._cache: List[Dict[int, Any]] = [{} for _ in self._columns]
+
+    @property
+    def columns(self) -> List[Column]:
+        return list(self._columns)
+
+    @property
+    def items(self) -> Sequence[Any]:
+        return self._items
+
+    def set_items(self, items: Sequence[Any]) -> None:
+        """
+        表示する項目を設定します
+
+        項目はコピーされないため、設定後に変更しないでください。
+        """
+        self.beginResetModel()
+        self._items = items
+        self._order = range(len(items))
+        self._loaded = min(self._batch_size, len(items))
+        for cache in self._cache:
+            cache.clear()
+        self.endResetModel()
+
+    def set_order(self, order: Sequence[int]) -> None:
+        """
+        表示する行（元の行番号）とその順序を設定します（フィルター・ソートの結果）
+        """
+        self.beginResetModel()
+        self._order = order
+        self._loaded = min(self._batch_size, len(order))
+        self.endResetModel()
+
+    def visible_count(self) -> int:
+        """
+        フィルター後の行数を返します（fetchMore() で未公開の行も含みます）
+        """
+        return len(self._order)
+
+    def item_at(self, row: int) -> Any:
+        return self._items[self._order[row]]
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._loaded
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._columns)
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        return parent.isValid() is False and self._loaded < len(self._order)
+
+    def fetchMore(self, parent: QModelIndex) -> None:
+        if parent.isValid():
+            return
+        count = min(self._batch_size, len(self._order) - self._loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if role != Qt.DisplayRole or index.isValid() is False:
+            return None
+        source_row = self._order[index.row()]
+        cache = self._cache[index.column()]
+        value = cache.get(source_row, _MISSING)
+        if value is _MISSING:
+            value = self._columns[index.column()].getter(self._items[source_row])
+            if len(cache) >= CACHE_LIMIT:
+                cache.clear()
+            cache[source_row] = value
+        return value
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self._columns[section].title
+        return section + 1
+
+
+class DataPanel(QWidget):
+    """
+    フィルター入力欄とテーブルビューを持つパネル
+
+    ヘッダーのクリックでソート、入力欄でフィルター（大文字小文字を区別しない部分一致）を行います。
+    フィルターの対象は filter_column の列です。
+    """
+
+    # フィルター・ソートの結果が反映された時に (表示行数, 全体の行数) で通知します
+    view_updated = Signal(int, int)
+
+    # フィルター入力のデバウンス時間（ミリ秒）
+    FILTER_DELAY_MS = 150
+
+    def __init__(
+        self,
+        columns: Sequence[Column],
+        parent: Optional[QWidget] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        filter_column: int = 0,
+        tasks: Optional[TaskRunner] = None,
+    ) -> None:
+        """
+        Args:
+            columns: 列の定義
+            parent: 親ウィジェット
+            batch_size: fetchMore() で一度に公開する行数
+            filter_column: フィルターの対象にする列
+            tasks: フィルター・ソートを実行する TaskRunner（None の場合はパネル専用のものを作ります）
+        """
+        super().__init__(parent)
+        self.model = LazyTableModel(columns, batch_size, self)
+        self._filter_column = filter_column
+        self._tasks = tasks if tasks is not None else TaskRunner(self)
+        self._pending: Optional[TaskHandle] = None
+        self._sort_column: Optional[int] = None
+        self._sort_order = Qt.AscendingOrder
+
+        self.filter_edit = QLineEdit(self)
+        self.filter_edit.setPlaceholderText('Filter')
+        self.filter_edit.setClearButtonEnabled(True)
+
+        self.view = QTableView(self)
+        self.view.setModel(self.model)
+        # 行の高さを固定にして、行ごとのサイズ計算をさせない
+        # 行番号のヘッダーは幅を求めるために全行を走査するため表示しない
+        vertical_header = self.view.verticalHeader()
+        vertical_header.setSectionResizeMode(QHeaderView.Fixed)
+        vertical_header.setDefaultSectionSize(self.view.fontMetrics().height() + 4)
+        vertical_header.hide()
+        horizontal_header = self.view.horizontalHeader()
+        horizontal_header.setSectionsClickable(True)
+        horizontal_header.setSortIndicatorShown(True)
+        horizontal_header.setSortIndicator(-1, Qt.AscendingOrder)
+        horizontal_header.sectionClicked.connect(self._on_header_clicked)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.filter_edit)
+        layout.addWidget(self.view)
+
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(self.FILTER_DELAY_MS)
+        self._filter_timer.timeout.connect(self.refresh)
+        self.filter_edit.textChanged.connect(lambda *args: self._filter_timer.start())
+
+    def set_items(self, items: Sequence[Any]) -> None:
+        """
+        表示する項目を設定します
+
+        フィルターまたはソートが設定されている場合は、バックグラウンドで適用し直します。
+        """
+        self._cancel_pending()
+        self.model.set_items(items)
+        if self.filter_edit.text() or self._sort_column is not None:
+            self.refresh()
+        else:
+            self.view_updated.emit(len(items), len(items))
+
+    def sort_by(self, column: Optional[int], order: Qt.SortOrder = Qt.AscendingOrder) -> None:
+        """
+        列でソートします（None の場合は元の順序に戻します）
+        """
+        if column is not None and self.model.columns[column].thread_safe is False:
+            logger.debug('%s(): %s 列はワーカースレッドで扱えないためソートしません', self.sort_by.__name__, column)
+            return
+        self._sort_column = column
+        self._sort_order = order
+        self.view.horizontalHeader().setSortIndicator(-1 if column is None else column, order)
+        self.refresh()
+
+    def refresh(self) -> None:
+        """
+        現在のフィルターとソートをバックグラウンドで適用します
+
+        実行中の計算はキャンセルされ、最後に要求した結果だけが反映されます。
+        """
+        self._filter_timer.stop()
+        self._cancel_pending()
+        columns = self.model.columns
+        needle = self.filter_edit.text().strip().lower()
+        filter_getter = columns[self._filter_column].getter if columns[self._filter_column].thread_safe else None
+        if filter_getter is None:
+            needle = ''
+        sort_getter = None if self._sort_column is None else columns[self._sort_column].getter
+        items = self.model.items
+
+        if not needle and sort_getter is None:
+            self._apply_order(range(len(items)))
+            return
+
+        self._pending = self._tasks.submit(
+            compute_order,
+            items,
+            needle,
+            filter_getter,
+            sort_getter,
+            self._sort_order == Qt.DescendingOrder,
+            on_result=self._apply_order,
+        )
+
+    def _apply_order(self, order: Sequence[int]) -> None:
+        self._pending = None
+        self.model.set_order(order)
+        self.view_updated.emit(len(order), len(self.model.items))
+
+    def _cancel_pending(self) -> None:
+        if self._pending is not None:
+            self._pending.cancel()
+            self._pending = None
+
+    def _on_header_clicked(self, column: int) -> None:
+        if self._sort_column == column:
+            if self._sort_order == Qt.AscendingOrder:
+                self.sort_by(column, Qt.DescendingOrder)
+            else:
+                self.sort_by(None)
+        else:
+            self.sort_by(column, Qt.AscendingOrder)
+
+
+def compute_order(
+    context: TaskContext,
+    items: Sequence[Any],
+    needle: str,
+    filter_getter: Optional[Callable[[Any], Any]],
+    sort_getter: Optional[Callable[[Any], Any]],
+    reverse: bool,
+) -> Sequence[int]:
+    """
+    フィルターとソートを適用した元の行番号の列を求めます（ワーカースレッドで実行されます）
+
+    Args:
+        context: タスクのコンテキスト
+        items: 項目
+        needle: 小文字にしたフィルター文字列（空の場合はフィルターしません）
+        filter_getter: フィルターの対象の値を求める関数
+        sort_getter: ソートのキーを求める関数（None の場合はソートしません）
+        reverse: 降順にするか
+
+    Returns:
+        Sequence[int]: 表示する行の元の行番号
+    """
+    rows: Sequence[int] = range(len(items))
+    if needle and filter_getter is not None:
+        matched = array.array('q')
+        for start in range(0, len(items), _CANCEL_CHECK_INTERVAL):
+            context.raise_if_cancelled()
+            end = min(start + _CANCEL_CHECK_INTERVAL, len(items))
+            matched.extend(row for row in range(start, end) if needle in str(filter_getter(items[row])).lower())
+        rows = matched
+
+    if sort_getter is None:
+        return rows
+
+    # タプルを作ると百万個のオブジェクトが GC の対象になり、GC の間 GIL を保持し続けるため、
+    # キーは rows と同じ並びのリストに持ち、位置（整数）だけを並べ替える
+    keys: List[Any] = []
+    for start in range(0, len(rows), _CANCEL_CHECK_INTERVAL):
+        context.raise_if_cancelled()
+        keys.extend(sort_getter(items[row]) for row in rows[start : start + _CANCEL_CHECK_INTERVAL])
+    key_types = {type(key) for key in keys}
+    if len(key_types) > 1 or type(None) in key_types:
+        keys = [_sort_key(key) for key in keys]
+
+    chunks = []
+    for start in range(0, len(rows), SORT_CHUNK_SIZE):
+        context.raise_if_cancelled()
+        positions = range(start, min(start + SORT_CHUNK_SIZE, len(rows)))
+        chunks.append(sorted(positions, key=keys.__getitem__, reverse=reverse))
+
+    order = array.array('q')
+    merged = heapq.merge(*chunks, key=keys.__getitem__, reverse=reverse)
+    while True:
+        context.raise_if_cancelled()
+        batch = [rows[position] for position in itertools.islice(merged, _CANCEL_CHECK_INTERVAL)]
+        if not batch:
+            break
+        order.extend(batch)
+
+    # 百万個のオブジェクトを一度に解放すると、その間 GIL を保持し続けるため少しずつ解放する
+    del merged
+    while chunks:
+        chunks.pop()
+    while keys:
+        del keys[-_CANCEL_CHECK_INTERVAL:]
+    return order
+
+
+def _sort_key(value: Any) -> Any:
+    """
+    None や型の異なる値が混ざっていても比較できるキーにします
+    """
+    if value is None:
+        return (0, '')
+    if isinstance(value, (int, float)):
+        return (1, value)
+    return (2, str(value))
+
+
+_MISSING = object()
@@ -0,0 +1,73 @@
+"""Host backend package
+
+Maya への依存（maya.cmds / OpenMayaUI / maya.utils / OpenMaya のコールバック）をまとめたホストバックエンドを提供します。
+パッケージ内のコードは maya を直接 import せず、get_host() が返すバックエンドを経由して呼び出します。
+
+バックエンド:
+    - MayaHost: 実際の Maya を使います（既定）
+    - FakeHost: offscreen の Qt 上で workspaceControl / deleteUI / findControl /
+      addWidgetToMayaLayout を再現する Maya の代役です。Maya の無い環境で
+      start / restart / restore を実行し、ベンチマークやテストを行うために使います
+
+どちらのバックエンドもコマンドの呼び出し回数を記録します（call_counts()）。
+
+使用するバックエンドは初めて get_host() が呼ばれた時に環境変数 PYSIDE_TEMPLATE_HOST で決まります
+（'maya' または 'fake'、未設定の場合は 'maya'）。set_host() で明示的に切り替えることもできます。
+
+使用例:
+    from pyside_template_window import host
+    from pyside_template_window.host.fake_host import FakeHost
+
+    host.set_host(FakeHost())
+"""
+
+import importlib
+import os
+from typing import Optional
+
+from ._base import HostBackend
+
+__all__ = ['HostBackend', 'get_host', 'set_host']
+
+# 環境変数の値 → (モジュール名, クラス名)
+_BACKENDS = {
+    'maya': ('.maya_host', 'MayaHost'),
+    'fake': ('.fake_host', 'FakeHost'),
+}
+
+# reloader でこのモジュールがリロードされても使用中のバックエンドを引き継ぐ
+_current: Optional[HostBackend] = globals().get('_current')
+
+
+def get_host() -> HostBackend:
+    """使用中のホストバックエンドを返す
+
+    初回呼び出し時に環境変数 PYSIDE_TEMPLATE_HOST に従ってバックエンドを生成します。
+
+    Returns:
+        HostBackend: ホストバックエンド
+
+    Raises:
+        ValueError: PYSIDE_TEMPLATE_HOST に未知の値が設定されている場合
+    """
+    global _current
+    if _current is None:
+        backend_name = os.environ.get('PYSIDE_TEMPLATE_HOST', 'maya').lower()
+        if backend_name not in _BACKENDS:
+            raise ValueError(
+                f'PYSIDE_TEMPLATE_HOST には {sorted(_BACKENDS)} のいずれかを指定してください: {backend_name!r}'
+            )
+        module_name, class_name = _BACKENDS[backend_name]
+        module = importlib.import_module(module_name, __name__)
+        _current = getattr(module, class_name)()
+    return _current
+
+
+def set_host(backend: Optional[HostBackend]) -> None:
+    """ホストバックエンドを切り替える
+
+    Args:
+        backend (Optional[HostBackend]): 使用するバックエンド。None の場合は次の get_host() で再び環境変数から決定します
+    """
+    global _current
+    _current = backend
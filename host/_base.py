@@ -0,0 +1,113 @@
+"""ホストバックエンドの基底クラス"""
+
+import collections
+from typing import Any, Callable, Dict, Optional
+
+# add_scene_callback() で購読できるシーンのイベント
+SELECTION_CHANGED = 'selection_changed'
+DAG_CHANGED = 'dag_changed'
+SCENE_OPENED = 'scene_opened'
+SCENE_EVENTS = (SELECTION_CHANGED, DAG_CHANGED, SCENE_OPENED)
+
+
+class HostBackend:
+    """
+    Maya の UI コマンドを抽象化したホストバックエンド
+
+    公開メソッドは呼び出し回数を記録してから、サブクラスが実装する _ で始まるメソッドを呼びます。
+    """
+
+    name = ''
+
+    def __init__(self) -> None:
+        self._calls: 'collections.Counter[str]' = collections.Counter()
+
+    def workspace_control(self, name: str, **flags: Any) -> Any:
+        """cmds.workspaceControl に相当します"""
+        self._calls['workspaceControl'] += 1
+        return self._workspace_control(name, **flags)
+
+    def delete_ui(self, name: str, **flags: Any) -> None:
+        """cmds.deleteUI に相当します"""
+        self._calls['deleteUI'] += 1
+        self._delete_ui(name, **flags)
+
+    def find_control(self, name: str) -> Optional[int]:
+        """OpenMayaUI.MQtUtil.findControl に相当します
+
+        Returns:
+            Optional[int]: コントロールのポインタ。見つからない場合は None
+        """
+        self._calls['findControl'] += 1
+        return self._find_control(name)
+
+    def add_widget_to_maya_layout(self, widget_ptr: int, layout_ptr: int) -> None:
+        """OpenMayaUI.MQtUtil.addWidgetToMayaLayout に相当します"""
+        self._calls['addWidgetToMayaLayout'] += 1
+        self._add_widget_to_maya_layout(widget_ptr, layout_ptr)
+
+    def execute_deferred(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        """maya.utils.executeDeferred に相当します"""
+        self._calls['executeDeferred'] += 1
+        self._execute_deferred(func, *args, **kwargs)
+
+    def execute_in_main_thread_with_result(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """maya.utils.executeInMainThreadWithResult に相当します"""
+        self._calls['executeInMainThreadWithResult'] += 1
+        return self._execute_in_main_thread_with_result(func, *args, **kwargs)
+
+    def add_scene_callback(self, event: str, func: Callable[[], None]) -> Any:
+        """OpenMaya.MMessage のコールバックの登録に相当します
+
+        Args:
+            event: SCENE_EVENTS のいずれか
+            func: イベントごとに引数なしで呼ばれる関数
+
+        Returns:
+            Any: remove_scene_callback() に渡す ID
+        """
+        if event not in SCENE_EVENTS:
+            raise ValueError(f'未対応のイベントです: {event!r}')
+        self._calls['addCallback'] += 1
+        return self._add_scene_callback(event, func)
+
+    def remove_scene_callback(self, callback_id: Any) -> None:
+        """OpenMaya.MMessage.removeCallback に相当します"""
+        self._calls['removeCallback'] += 1
+        self._remove_scene_callback(callback_id)
+
+    def call_counts(self) -> Dict[str, int]:
+        """
+        コマンドごとの呼び出し回数を返します
+        """
+        return dict(self._calls)
+
+    def total_calls(self) -> int:
+        return sum(self._calls.values())
+
+    def reset_call_counts(self) -> None:
+        self._calls.clear()
+
+    def _workspace_control(self, name: str, **flags: Any) -> Any:
+        raise NotImplementedError
+
+    def _delete_ui(self, name: str, **flags: Any) -> None:
+        raise NotImplementedError
+
+    def _find_control(self, name: str) -> Optional[int]:
+        raise NotImplementedError
+
+    def _add_widget_to_maya_layout(self, widget_ptr: int, layout_ptr: int) -> None:
+        raise NotImplementedError
+
+    def _execute_deferred(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        raise NotImplementedError
+
+    def _execute_in_main_thread_with_result(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        raise NotImplementedError
+
+    def _add_scene_callback(self, event: str, func: Callable[[], None]) -> Any:
+        raise NotImplementedError
+
+    def _remove_scene_callback(self, callback_id: Any) -> None:
+        raise NotImplementedError
@@ -0,0 +1,259 @@
+"""Maya の代役となるホストバックエンド
+
+offscreen の Qt プラットフォーム上で WorkspaceControl を QWidget として再現し、
+Maya の無い環境（CI など）で start / restart / restore の全体を実行できるようにします。
+
+再現している Maya の挙動:
+    - workspaceControl: 作成時にウィジェットを表示し、uiScript が空でなければ実行します。
+      e=True の restore / visible / close / label などと、q=True の exists などの問い合わせに対応します。
+      同名での作成や存在しないコントロールの編集は RuntimeError になります
+    - deleteUI: コントロールを即座に破棄し（子のウィンドウも破棄され destroyed が発行されます）、
+      uiScript などの状態を restore 用に保存します
+    - findControl: WorkspaceControl と、objectName が一致するウィジェットのポインタを返します
+    - addWidgetToMayaLayout: ウィジェットを WorkspaceControl のレイアウトに追加して show() を呼びます
+    - executeDeferred / executeInMainThreadWithResult: Qt のイベントループ経由でメインスレッドで実行します
+    - シーンのイベントのコールバック: 登録のみ行い、emit_scene_event() で呼び出します
+
+Maya の起動時の restore は simulate_restore() で再現できます。
+"""
+
+import functools
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .. import _qt
+from ._base import HostBackend
+
+# Maya の workspaceControl で状態ではなく動作を表すフラグ
+_ACTION_FLAGS = frozenset(['restore', 'r', 'close', 'cl'])
+
+
+class FakeHost(HostBackend):
+    """
+    offscreen の Qt 上で Maya の UI コマンドを再現するバックエンド
+
+    QApplication が無い場合は offscreen プラットフォームで作成します。
+    """
+
+    name = 'fake'
+
+    def __init__(self) -> None:
+        super().__init__()
+        QtCore = _qt.import_qt_module('QtCore')
+        QtWidgets = _qt.import_qt_module('QtWidgets')
+        self._QWidget = QtWidgets.QWidget
+        self._QVBoxLayout = QtWidgets.QVBoxLayout
+        self._QApplication = QtWidgets.QApplication
+
+        self._app = QtWidgets.QApplication.instance()
+        if self._app is None:
+            os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+            self._app = QtWidgets.QApplication([])
+
+        # WorkspaceControl 名 → ウィジェット / フラグの状態
+        self._controls: Dict[str, Any] = {}
+        self._states: Dict[str, Dict[str, Any]] = {}
+        # deleteUI された WorkspaceControl の状態（simulate_restore() で使う）
+        self._saved_states: Dict[str, Dict[str, Any]] = {}
+        # コールバック ID → (イベント, 関数)
+        self._scene_callbacks: Dict[int, Tuple[str, Callable[[], None]]] = {}
+        self._next_callback_id = 1
+
+        class _Invoker(QtCore.QObject):
+            invoke = QtCore.Signal(object)
+
+        self._invoker = _Invoker()
+        self._invoker.invoke.connect(lambda func: func(), QtCore.Qt.QueuedConnection)
+
+    @property
+    def app(self) -> Any:
+        return self._app
+
+    def control_names(self) -> List[str]:
+        """
+        存在する WorkspaceControl の名前を返します
+        """
+        return list(self._controls)
+
+    def process_events(self) -> None:
+        """
+        保留中のイベント（QTimer.singleShot(0) や deleteLater など）を処理します
+        """
+        self._app.processEvents()
+        self._app.sendPostedEvents(None, 0)
+
+    def scene_callback_count(self, event: Optional[str] = None) -> int:
+        """
+        登録されているシーンのイベントのコールバックの数を返します（event が None の場合はすべて）
+        """
+        return sum(1 for registered, _ in self._scene_callbacks.values() if event is None or registered == event)
+
+    def emit_scene_event(self, event: str, count: int = 1) -> None:
+        """
+        シーンのイベントを count 回発生させ、登録されているコールバックを呼びます
+
+        大量のオブジェクトを選択した時のように、同じイベントが連続して発生する状況を再現できます。
+        """
+        for _ in range(count):
+            for registered, func in list(self._scene_callbacks.values()):
+                if registered == event:
+                    func()
+
+    def simulate_restore(self, name: str) -> None:
+        """
+        Maya の起動時などに行われる WorkspaceControl の restore を再現します
+
+        WorkspaceControl を作成し直してから、保存されている uiScript を __main__ として実行します。
+        既に存在する場合は先に破棄します（Maya を再起動した状況を再現します）。
+
+        Args:
+            name (str): WorkspaceControl の名前
+
+        Raises:
+            RuntimeError: restore できる状態が保存されていない場合
+        """
+        if name in self._controls:
+            self._destroy(name)
+        state = self._saved_states.get(name)
+        if state is None:
+            raise RuntimeError(f'{name} の restore 用の状態が保存されていません')
+        ui_script = state.get('uiScript', '')
+        self._build(name, {flag: value for flag, value in state.items() if flag != 'uiScript'})
+        self._states[name]['uiScript'] = ui_script
+        if ui_script:
+            exec(compile(ui_script, f'<{name} uiScript>', 'exec'), {'__name__': '__main__'})
+
+    def _workspace_control(self, name: str, **flags: Any) -> Any:
+        if flags.pop('q', False) or flags.pop('query', False):
+            return self._query(name, flags)
+        if flags.pop('e', False) or flags.pop('edit', False):
+            self._edit(name, flags)
+            return name
+
+        if name in self._controls:
+            raise RuntimeError(f"Object's name '{name}' is not unique.")
+        ui_script = flags.get('uiScript', '')
+        self._build(name, flags)
+        if ui_script:
+            exec(compile(ui_script, f'<{name} uiScript>', 'exec'), {'__name__': '__main__'})
+        return name
+
+    def _query(self, name: str, flags: Dict[str, Any]) -> Any:
+        if flags.get('exists') or flags.get('ex'):
+            return name in self._controls
+        state = self._require(name)
+        widget = self._controls[name]
+        if flags.get('visible') or flags.get('vis'):
+            return widget.isVisible()
+        for flag in flags:
+            return state.get(flag)
+        return None
+
+    def _edit(self, name: str, flags: Dict[str, Any]) -> None:
+        state = self._require(name)
+        widget = self._controls[name]
+        for flag, value in flags.items():
+            if flag not in _ACTION_FLAGS:
+                state[flag] = value
+        if 'label' in flags:
+            widget.setWindowTitle(flags['label'])
+        if flags.get('restore') or flags.get('r'):
+            widget.show()
+        if 'visible' in flags:
+            widget.setVisible(bool(flags['visible']))
+        if flags.get('close') or flags.get('cl'):
+            widget.hide()
+            close_command = state.get('closeCommand')
+            if close_command:
+                exec(compile(close_command, f'<{name} closeCommand>', 'exec'), {'__name__': '__main__'})
+
+    def _delete_ui(self, name: str, **flags: Any) -> None:
+        if name not in self._controls:
+            raise RuntimeError(f"Object '{name}' not found.")
+        self._destroy(name)
+
+    def _find_control(self, name: str) -> Optional[int]:
+        widget = self._controls.get(name)
+        if widget is None:
+            for candidate in self._QApplication.allWidgets():
+                if candidate.objectName() == name:
+                    widget = candidate
+                    break
+            else:
+                return None
+        return _qt.cpp_pointer(widget)
+
+    def _add_widget_to_maya_layout(self, widget_ptr: int, layout_ptr: int) -> None:
+        widget = _qt.wrap_instance(widget_ptr, self._QWidget)
+        control = _qt.wrap_instance(layout_ptr, self._QWidget)
+        layout = control.layout()
+        if layout is None:
+            raise RuntimeError(f'{control.objectName()} はレイアウトを持っていません')
+        layout.addWidget(widget)
+        widget.show()
+
+    def _execute_deferred(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        # キュー接続のため、どのスレッドから emit してもイベントループ経由でメインスレッドで実行される
+        self._invoker.invoke.emit(functools.partial(func, *args, **kwargs))
+
+    def _execute_in_main_thread_with_result(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        if threading.current_thread() is threading.main_thread():
+            return func(*args, **kwargs)
+
+        done = threading.Event()
+        outcome: Dict[str, Any] = {}
+
+        def run() -> None:
+            try:
+                outcome['result'] = func(*args, **kwargs)
+            except Exception as e:
+                outcome['error'] = e
+            finally:
+                done.set()
+
+        self._invoker.invoke.emit(run)
+        done.wait()
+        if 'error' in outcome:
+            raise outcome['error']
+        return outcome.get('result')
+
+    def _add_scene_callback(self, event: str, func: Callable[[], None]) -> Any:
+        callback_id = self._next_callback_id
+        self._next_callback_id += 1
+        self._scene_callbacks[callback_id] = (event, func)
+        return callback_id
+
+    def _remove_scene_callback(self, callback_id: Any) -> None:
+        if self._scene_callbacks.pop(callback_id, None) is None:
+            raise RuntimeError(f'コールバック {callback_id} は登録されていません')
+
+    def _build(self, name: str, flags: Dict[str, Any]) -> None:
+        widget = self._QWidget()
+        widget.setObjectName(name)
+        layout = self._QVBoxLayout(widget)
+        layout.setContentsMargins(0, 0, 0, 0)
+        if 'label' in flags:
+            widget.setWindowTitle(flags['label'])
+        widget.destroyed.connect(functools.partial(self._forget, name, id(widget)))
+        self._controls[name] = widget
+        self._states[name] = {flag: value for flag, value in flags.items() if flag not in _ACTION_FLAGS}
+        widget.show()
+
+    def _destroy(self, name: str) -> None:
+        widget = self._controls.pop(name)
+        self._saved_states[name] = self._states.pop(name)
+        # Maya の deleteUI と同様に即座に破棄する（子のウィンドウの destroyed も同期的に発行される）
+        _qt.delete(widget)
+
+    def _forget(self, name: str, widget_id: int, *args: Any) -> None:
+        widget = self._controls.get(name)
+        if widget is not None and id(widget) == widget_id:
+            self._controls.pop(name)
+            self._saved_states[name] = self._states.pop(name)
+
+    def _require(self, name: str) -> Dict[str, Any]:
+        state = self._states.get(name)
+        if state is None:
+            raise RuntimeError(f"Object '{name}' not found.")
+        return state
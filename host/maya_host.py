@@ -0,0 +1,62 @@
+"""Maya のホストバックエンド"""
+
+from typing import Any, Callable, Optional
+
+from ._base import DAG_CHANGED, SCENE_OPENED, SELECTION_CHANGED, HostBackend
+
+
+class MayaHost(HostBackend):
+    """
+    実際の Maya のコマンドを呼び出すバックエンド
+
+    maya モジュールはインスタンス生成時（初めて get_host() が呼ばれた時）に import します。
+    """
+
+    name = 'maya'
+
+    def __init__(self) -> None:
+        super().__init__()
+        from maya import OpenMayaUI as omui
+        from maya import cmds
+        from maya import utils as maya_utils
+        from maya.api import OpenMaya as om
+
+        self._cmds = cmds
+        self._om = om
+        self._omui = omui
+        self._maya_utils = maya_utils
+
+    def _workspace_control(self, name: str, **flags: Any) -> Any:
+        return self._cmds.workspaceControl(name, **flags)
+
+    def _delete_ui(self, name: str, **flags: Any) -> None:
+        self._cmds.deleteUI(name, **flags)
+
+    def _find_control(self, name: str) -> Optional[int]:
+        ptr = self._omui.MQtUtil.findControl(name)
+        return None if ptr is None else int(ptr)
+
+    def _add_widget_to_maya_layout(self, widget_ptr: int, layout_ptr: int) -> None:
+        self._omui.MQtUtil.addWidgetToMayaLayout(widget_ptr, layout_ptr)
+
+    def _execute_deferred(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        self._maya_utils.executeDeferred(func, *args, **kwargs)
+
+    def _execute_in_main_thread_with_result(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        return self._maya_utils.executeInMainThreadWithResult(func, *args, **kwargs)
+
+    def _add_scene_callback(self, event: str, func: Callable[[], None]) -> Any:
+        # MMessage のコールバックはイベントごとに引数が異なるため捨てる
+        def handler(*args: Any) -> None:
+            func()
+
+        if event == SELECTION_CHANGED:
+            return self._om.MEventMessage.addEventCallback('SelectionChanged', handler)
+        if event == DAG_CHANGED:
+            return self._om.MDagMessage.addAllDagChangesCallback(handler)
+        if event == SCENE_OPENED:
+            return self._om.MSceneMessage.addCallback(self._om.MSceneMessage.kAfterOpen, handler)
+        raise ValueError(f'未対応のイベントです: {event!r}')
+
+    def _remove_scene_callback(self, callback_id: Any) -> None:
+        self._om.MMessage.removeCallback(callback_id)
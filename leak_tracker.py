@@ -0,0 +1,173 @@
+"""
+restart 時のオブジェクトリーク追跡モジュール
+
+restart() の前後で生存している QObject と Python オブジェクトの数を型ごとに数え、
+restart 後に増えた（古いウィンドウから生き残った）型を報告します。
+
+- 追跡が無効な場合、track() は何もしません（Dev メニューの Track Leaks on Restart で切り替えられます）
+- 報告は WARNING レベルでログに出力され、last_report() でも取得できます
+- 数え上げは gc.get_objects() と QObject の子の走査を行うため、開発時のみ有効にしてください
+
+使用例:
+    from pyside_template_window import leak_tracker
+
+    leak_tracker.set_enabled(True)
+    # Dev > Restart を数回実行すると、生き残ったオブジェクトがログに出力されます
+"""
+
+import collections
+import contextlib
+import gc
+import logging
+from typing import Counter, Dict, Iterator, List, NamedTuple, Optional
+
+from . import _qt
+
+logger = logging.getLogger(__name__)
+
+# reloader でこのモジュールがリロードされても追跡の設定を引き継ぐ
+_enabled: bool = globals().get('_enabled', False)
+_last_report: Optional['LeakReport'] = None
+
+
+class Snapshot(NamedTuple):
+    """型名ごとの生存オブジェクト数"""
+
+    qt: Counter[str]
+    python: Counter[str]
+
+
+class LeakReport(NamedTuple):
+    """2 つのスナップショット間で増えたオブジェクト数（増えた型のみ）"""
+
+    label: str
+    qt: Dict[str, int]
+    python: Dict[str, int]
+
+    @property
+    def leaked(self) -> bool:
+        return bool(self.qt) or bool(self.python)
+
+    def format(self, limit: int = 20) -> str:
+        """
+        報告を人が読める形式に整形します
+
+        Args:
+            limit (int): Python オブジェクトの型を表示する最大数
+        """
+        lines = [
+            f'{self.label}: 増えた QObject {sum(self.qt.values())} 個 / Python オブジェクト {sum(self.python.values())} 個'
+        ]
+        for name, count in sorted(self.qt.items(), key=lambda item: -item[1]):
+            lines.append(f'  Qt     {count:+6d}  {name}')
+        for name, count in sorted(self.python.items(), key=lambda item: -item[1])[:limit]:
+            lines.append(f'  Python {count:+6d}  {name}')
+        return '\n'.join(lines)
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def set_enabled(enabled: bool) -> None:
+    """
+    restart() でのリーク追跡を有効・無効にします
+    """
+    global _enabled
+    _enabled = enabled
+
+
+def last_report() -> Optional[LeakReport]:
+    """
+    直近の track() の報告を返します
+    """
+    return _last_report
+
+
+def snapshot() -> Snapshot:
+    """
+    生存している QObject と Python オブジェクトを型ごとに数えます
+
+    QObject は QApplication とトップレベルウィジェット、およびそれらの子孫を数えます。
+    deleteLater() 済みのオブジェクトはリークではないため、数える前に削除を済ませます。
+    Python オブジェクトは gc が追跡しているもの（コンテナ型など）を数えます。
+    """
+    QtCore = _qt.import_qt_module('QtCore')
+    QtCore.QCoreApplication.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+    gc.collect()
+    return Snapshot(_count_qt_objects(), _count_python_objects())
+
+
+def diff(before: Snapshot, after: Snapshot, label: str = '') -> LeakReport:
+    """
+    2 つのスナップショットを比較して、増えた型とその数を返します
+    """
+    return LeakReport(label, _growth(before.qt, after.qt), _growth(before.python, after.python))
+
+
+@contextlib.contextmanager
+def track(label: str) -> Iterator[None]:
+    """
+    追跡が有効な場合、ブロックの前後のスナップショットを比較して報告します
+
+    Args:
+        label (str): 報告に表示する名前（'restart' など）
+    """
+    global _last_report
+    if _enabled is False:
+        yield
+        return
+
+    before = snapshot()
+    yield
+    after = snapshot()
+    # 比較のために保持している before 自身を差し引く
+    after.python.subtract(_self_counts(before))
+    report = diff(before, after, label)
+    _last_report = report
+    if report.leaked:
+        logger.warning('%s', report.format())
+    else:
+        logger.info('%s: 生き残ったオブジェクトはありません', label)
+
+
+def _count_qt_objects() -> Counter[str]:
+    counts: Counter[str] = collections.Counter()
+    QtWidgets = _qt.import_qt_module('QtWidgets')
+    QObject = _qt.import_qt_module('QtCore').QObject
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        return counts
+
+    roots: List[object] = [app]
+    roots.extend(QtWidgets.QApplication.topLevelWidgets())
+    seen = set()
+    for root in roots:
+        for obj in [root] + root.findChildren(QObject):
+            ptr = _qt.cpp_pointer(obj)
+            if ptr in seen:
+                continue
+            seen.add(ptr)
+            counts[obj.metaObject().className()] += 1
+    return counts
+
+
+def _count_python_objects() -> Counter[str]:
+    counts: Counter[str] = collections.Counter()
+    for obj in gc.get_objects():
+        obj_type = type(obj)
+        counts[f'{obj_type.__module__}.{obj_type.__qualname__}'] += 1
+    return counts
+
+
+def _self_counts(value: Snapshot) -> Counter[str]:
+    """スナップショット自身が gc に追跡されているオブジェクトの数"""
+    counts: Counter[str] = collections.Counter()
+    for obj in (value, value.qt, value.python):
+        obj_type = type(obj)
+        counts[f'{obj_type.__module__}.{obj_type.__qualname__}'] += 1
+    return counts
+
+
+def _growth(before: Counter[str], after: Counter[str]) -> Dict[str, int]:
+    return {name: count - before.get(name, 0) for name, count in after.items() if count > before.get(name, 0)}
@@ -0,0 +1,266 @@
+"""
+ログパネル用のキューハンドラー
+
+パッケージのログを Maya のスクリプトエディタではなく、ウィンドウ内のログパネル（log_panel.LogView）に送ります。
+スクリプトエディタは数万行を超えると非常に重くなるため、デバッグログを大量に出しても Maya が遅くならないようにします。
+
+- QueueLogHandler はレコードをリングバッファ（LogBuffer）に入れるだけで、メッセージの整形は行いません。
+  整形はログパネルが表示する時に、表示する分だけ行います
+- LogBuffer は容量を超えると古いレコードから捨てます
+- 同じ場所から出力された同じメッセージは interval_s の間に burst 件までに制限し、
+  残りは件数だけを記録します（「N 件省略」としてログパネルに表示されます）
+
+このモジュールは Qt を import しないため、userSetup から setup_logging(log_panel=True) を呼んでも
+Maya の起動を遅くしません。
+
+使用例:
+    import pyside_template_window
+    pyside_template_window.setup_logging(logging.DEBUG, log_panel=True)
+"""
+
+import collections
+import copy
+import logging
+import logging.handlers
+import threading
+import time
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+# 既定のリングバッファの容量（レコード数）
+DEFAULT_CAPACITY = 10000
+# 既定の繰り返しの制限（interval_s 秒の間に同じメッセージを burst 件まで）
+DEFAULT_RATE_LIMIT_INTERVAL_S = 1.0
+DEFAULT_RATE_LIMIT_BURST = 20
+
+# 遅延整形しても安全な（後から変更されない）引数の型
+_IMMUTABLE_ARG_TYPES = (str, int, float, bool, type(None), bytes)
+
+
+class LogBuffer:
+    """
+    スレッドセーフな固定長のリングバッファ
+
+    読み手は since() に前回の位置を渡して、新しく追加されたレコードだけを取り出します。
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        self._records: Deque[logging.LogRecord] = collections.deque(maxlen=capacity)
+        self._total = 0
+        self._lock = threading.Lock()
+
+    @property
+    def capacity(self) -> int:
+        return self._records.maxlen or 0
+
+    @property
+    def position(self) -> int:
+        """
+        これまでに追加されたレコードの総数（since() に渡す位置）
+        """
+        return self._total
+
+    def put_nowait(self, record: logging.LogRecord) -> None:
+        """
+        レコードを追加します（logging.handlers.QueueHandler から呼ばれます）
+        """
+        with self._lock:
+            self._records.append(record)
+            self._total += 1
+
+    def since(self, position: int) -> Tuple[List[logging.LogRecord], int, int]:
+        """
+        position 以降に追加されたレコードを返します
+
+        Returns:
+            Tuple[List[logging.LogRecord], int, int]: (レコード, 次に渡す位置, 容量を超えて失われたレコードの数)
+        """
+        with self._lock:
+            total = self._total
+            new_count = total - position
+            if new_count <= 0:
+                return [], total, 0
+            available = min(new_count, len(self._records))
+            if available == len(self._records):
+                records = list(self._records)
+            else:
+                records = [self._records[index] for index in range(len(self._records) - available, len(self._records))]
+        return records, total, new_count - available
+
+    def clear(self) -> None:
+        with self._lock:
+            self._records.clear()
+
+
+class QueueLogHandler(logging.handlers.QueueHandler):
+    """
+    レコードを整形せずに LogBuffer に入れるハンドラー
+
+    logging.handlers.QueueHandler は prepare() でメッセージを整形しますが、このハンドラーは整形を
+    ログパネルが表示する時まで遅らせます。後から変更される可能性のある引数や例外情報を持つレコードだけは、
+    その時点で整形します。
+    """
+
+    def __init__(
+        self,
+        buffer: LogBuffer,
+        interval_s: float = DEFAULT_RATE_LIMIT_INTERVAL_S,
+        burst: int = DEFAULT_RATE_LIMIT_BURST,
+    ) -> None:
+        super().__init__(buffer)  # type: ignore[arg-type]
+        self.buffer = buffer
+        self.interval_s = interval_s
+        self.burst = burst
+        # (ロガー名, パス, 行番号, メッセージ) → [期間の開始時刻, 期間内の件数, 省略した件数, 最後のレコード]
+        self._rates: Dict[Tuple[str, str, int, str], List[Any]] = {}
+        self._stats: Dict[str, int] = {'emitted': 0, 'suppressed': 0}
+
+    def emit(self, record: logging.LogRecord) -> None:
+        msg = record.msg if isinstance(record.msg, str) else repr(record.msg)
+        key = (record.name, record.pathname, record.lineno, msg)
+        now = record.created
+        rate = self._rates.get(key)
+        if rate is None:
+            if len(self._rates) > 1024:
+                self._flush_rates(now, force=True)
+            self._rates[key] = [now, 1, 0, None]
+        elif now - rate[0] >= self.interval_s:
+            self._enqueue_suppressed(rate)
+            rate[0], rate[1], rate[2] = now, 1, 0
+        else:
+            rate[1] += 1
+            if rate[1] > self.burst:
+                rate[2] += 1
+                rate[3] = record
+                self._stats['suppressed'] += 1
+                return
+        self._stats['emitted'] += 1
+        super().emit(record)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 同じレコードは後に続くハンドラー（スクリプトエディタへの転送など）にも渡されるため、
+        # logging.handlers.QueueHandler と同じく変更する場合はコピーに対して行う
+        if record.exc_info or record.stack_info:
+            record = copy.copy(record)
+            # トレースバックはフレームを保持し続けるため、この時点で文字列にする
+            formatter = self.formatter or logging.Formatter()
+            if record.exc_info:
+                record.exc_text = formatter.formatException(record.exc_info)
+                record.exc_info = None
+            record.msg = record.getMessage()
+            record.args = None
+        elif record.args and not _has_only_immutable_args(record.args):
+            record = copy.copy(record)
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+    def flush_suppressed(self) -> None:
+        """
+        省略の期間が終わったメッセージの「N 件省略」のレコードをバッファに追加します
+
+        ログパネルが表示を更新する前に呼びます。
+        """
+        self.acquire()
+        try:
+            self._flush_rates(time.time(), force=False)
+        finally:
+            self.release()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        バッファに入れたレコードの数と、繰り返しの制限で省略したレコードの数を返します
+        """
+        return dict(self._stats)
+
+    def _flush_rates(self, now: float, force: bool) -> None:
+        for key, rate in list(self._rates.items()):
+            if force or now - rate[0] >= self.interval_s:
+                self._enqueue_suppressed(rate)
+                del self._rates[key]
+
+    def _enqueue_suppressed(self, rate: List[Any]) -> None:
+        count, last = rate[2], rate[3]
+        if count == 0 or last is None:
+            return
+        summary = logging.makeLogRecord(last.__dict__)
+        summary.msg = '%s（同じメッセージを %d 件省略しました）'
+        summary.args = (last.getMessage(), count)
+        rate[2], rate[3] = 0, None
+        self.enqueue(summary)
+
+
+def _has_only_immutable_args(args: Any) -> bool:
+    if isinstance(args, dict):
+        return all(isinstance(value, _IMMUTABLE_ARG_TYPES) for value in args.values())
+    return all(isinstance(arg, _IMMUTABLE_ARG_TYPES) for arg in args)
+
+
+class _ScriptEditorForwarder(logging.Handler):
+    """
+    ログパネルを使う場合でも、一定以上のレベルのレコードはルートロガー（スクリプトエディタ）に送るハンドラー
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        logging.getLogger().handle(record)
+
+
+def install(
+    logger: logging.Logger,
+    capacity: int = DEFAULT_CAPACITY,
+    script_editor_level: Optional[int] = logging.WARNING,
+) -> QueueLogHandler:
+    """
+    ロガーに QueueLogHandler を追加します（追加済みの場合は設定を更新して同じハンドラーを返します）
+
+    ログはロガーの親（スクリプトエディタ）に伝播しなくなり、script_editor_level 以上のレコードだけが送られます。
+
+    Args:
+        logger: パッケージのロガー
+        capacity: リングバッファの容量
+        script_editor_level: スクリプトエディタにも送る最低のレベル。None の場合は送りません
+
+    Returns:
+        QueueLogHandler: 追加したハンドラー
+    """
+    global _handler, _forwarder
+    if _handler is None or _handler.buffer.capacity != capacity:
+        if _handler is not None:
+            logger.removeHandler(_handler)
+        _handler = QueueLogHandler(LogBuffer(capacity))
+    if _handler not in logger.handlers:
+        logger.addHandler(_handler)
+
+    if _forwarder is not None:
+        logger.removeHandler(_forwarder)
+        _forwarder = None
+    if script_editor_level is not None:
+        _forwarder = _ScriptEditorForwarder(script_editor_level)
+        logger.addHandler(_forwarder)
+    logger.propagate = False
+    return _handler
+
+
+def uninstall(logger: logging.Logger) -> None:
+    """
+    install() で追加したハンドラーを取り除き、ログをスクリプトエディタに戻します
+    """
+    global _handler, _forwarder
+    if _handler is not None:
+        logger.removeHandler(_handler)
+        _handler = None
+    if _forwarder is not None:
+        logger.removeHandler(_forwarder)
+        _forwarder = None
+    logger.propagate = True
+
+
+def get_handler() -> Optional[QueueLogHandler]:
+    """
+    install() で追加したハンドラーを返します。追加されていない場合は None
+    """
+    return _handler
+
+
+# reloader でこのモジュールがリロードされてもバッファとハンドラーを引き継ぐ
+_handler: Optional[QueueLogHandler] = globals().get('_handler')
+_forwarder: Optional[logging.Handler] = globals().get('_forwarder')
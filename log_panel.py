@@ -0,0 +1,168 @@
+"""
+ウィンドウ内のログパネル
+
+log_handler.QueueLogHandler がリングバッファに入れたレコードを、一定間隔（UI の 1 tick）ごとにまとめて表示します。
+
+- 1 tick に追加されたレコードは 1 回の appendPlainText() でまとめて追加します
+- 整形するのは表示できる行数（max_lines）の分だけです。1 tick の間に max_lines を超えるレコードが
+  追加された場合、古いものは整形せずに件数だけを表示します
+- パネルが表示されていない間はタイマーを止め、何もしません
+
+使用例:
+    dock = LogDock(window)
+    window.addDockWidget(Qt.BottomDockWidgetArea, dock)
+"""
+
+import logging
+from typing import List, Optional
+
+try:
+    from PySide6.QtCore import Qt, QTimer  # type: ignore
+    from PySide6.QtGui import QTextCursor  # type: ignore
+    from PySide6.QtWidgets import (  # type: ignore
+        QDockWidget,
+        QHBoxLayout,
+        QPlainTextEdit,
+        QPushButton,
+        QVBoxLayout,
+        QWidget,
+    )
+except ImportError:
+    from PySide2.QtCore import Qt, QTimer  # type: ignore
+    from PySide2.QtGui import QTextCursor  # type: ignore
+    from PySide2.QtWidgets import (  # type: ignore
+        QDockWidget,
+        QHBoxLayout,
+        QPlainTextEdit,
+        QPushButton,
+        QVBoxLayout,
+        QWidget,
+    )
+
+from . import log_handler
+
+# 表示を更新する間隔（ミリ秒）
+TICK_MS = 100
+# 表示する最大の行数
+DEFAULT_MAX_LINES = 5000
+
+_FORMATTER = logging.Formatter('%(asctime)s %(levelname)-8s %(name)s: %(message)s', '%H:%M:%S')
+
+
+class LogView(QWidget):
+    """
+    QueueLogHandler のリングバッファを表示するウィジェット
+    """
+
+    def __init__(
+        self,
+        parent: Optional[QWidget] = None,
+        handler: Optional[log_handler.QueueLogHandler] = None,
+        max_lines: int = DEFAULT_MAX_LINES,
+    ) -> None:
+        """
+        Args:
+            parent: 親ウィジェット
+            handler: 表示するハンドラー（None の場合は log_handler.get_handler()）
+            max_lines: 表示する最大の行数
+        """
+        super().__init__(parent)
+        self._handler = handler
+        # _position は _buffer の位置（install() で容量が変わるとバッファが作り直される）
+        self._buffer: Optional[log_handler.LogBuffer] = None
+        self._position = 0
+        self._max_lines = max_lines
+
+        self.text_edit = QPlainTextEdit(self)
+        self.text_edit.setReadOnly(True)
+        self.text_edit.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self.text_edit.setMaximumBlockCount(max_lines)
+        self.text_edit.setUndoRedoEnabled(False)
+
+        clear_button = QPushButton('Clear', self)
+        clear_button.clicked.connect(lambda *args: self.clear())
+
+        buttons = QHBoxLayout()
+        buttons.addStretch()
+        buttons.addWidget(clear_button)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.text_edit)
+        layout.addLayout(buttons)
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(TICK_MS)
+        self._timer.timeout.connect(self.update_view)
+
+    @property
+    def handler(self) -> Optional[log_handler.QueueLogHandler]:
+        return self._handler if self._handler is not None else log_handler.get_handler()
+
+    def update_view(self) -> None:
+        """
+        前回の更新以降に追加されたレコードを表示します
+        """
+        handler = self.handler
+        if handler is None:
+            return
+        handler.flush_suppressed()
+        if handler.buffer is not self._buffer:
+            self._buffer = handler.buffer
+            self._position = 0
+        records, self._position, dropped = handler.buffer.since(self._position)
+        if not records:
+            return
+
+        # 表示しきれないレコードは整形しない
+        skipped = dropped + max(len(records) - self._max_lines, 0)
+        lines: List[str] = []
+        if skipped:
+            lines.append(f'...（{skipped} 件のログを省略しました）')
+        lines.extend(_format(record) for record in records[-self._max_lines :])
+
+        scroll_bar = self.text_edit.verticalScrollBar()
+        at_bottom = scroll_bar.value() >= scroll_bar.maximum() - 2
+        self.text_edit.appendPlainText('\n'.join(lines))
+        if at_bottom:
+            self.text_edit.moveCursor(QTextCursor.End)
+            scroll_bar.setValue(scroll_bar.maximum())
+
+    def clear(self) -> None:
+        """
+        表示を消去します（リングバッファのレコードも捨てます）
+        """
+        handler = self.handler
+        if handler is not None:
+            handler.buffer.clear()
+            self._buffer = handler.buffer
+            self._position = handler.buffer.position
+        self.text_edit.clear()
+
+    def showEvent(self, event) -> None:
+        self.update_view()
+        self._timer.start()
+        super().showEvent(event)
+
+    def hideEvent(self, event) -> None:
+        self._timer.stop()
+        super().hideEvent(event)
+
+
+class LogDock(QDockWidget):
+    """
+    LogView を持つドックウィジェット
+    """
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        super().__init__('Log', parent)
+        self.setObjectName(f'{parent.objectName()}LogDock' if parent is not None else 'LogDock')
+        self.setAllowedAreas(Qt.BottomDockWidgetArea | Qt.TopDockWidgetArea | Qt.RightDockWidgetArea)
+        self.view = LogView(self)
+        self.setWidget(self.view)
+
+
+def _format(record: logging.LogRecord) -> str:
+    try:
+        return _FORMATTER.format(record)
+    except Exception as e:
+        return f'{record.name}: {record.msg!r} の整形に失敗しました: {e}'
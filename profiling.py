@@ -0,0 +1,243 @@
+"""
+ホットパスの計測・プロファイリング用モジュール
+
+start / restart / restore / show などの入口に埋め込まれたタイミングスパンを記録します。
+
+- 計測が無効な場合、span() は共有の何もしないコンテキストマネージャーを返すだけなので、
+  入口に埋め込んだままでもコストはほぼありません
+- arm_profiler() を呼ぶ（Dev メニューの Profile Next Start/Restart）と、次の start() または
+  restart() の全体を cProfile で計測し、統計をファイルに書き出してログに上位を出力します
+- export_json() で記録したスパンと集計を JSON で書き出せます。アーティストの環境で集める場合は
+  userSetup などで set_enabled(True) を呼び、任意のタイミングで export_json() を呼んでください
+
+span() は restore などの起動経路から import されるため、cProfile・pstats・json などは使う時に import します。
+
+使用例:
+    with profiling.span('my_tool.load_assets'):
+        ...
+"""
+
+import contextlib
+import logging
+import os
+import sys
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any, Deque, Dict, Iterator, List, Optional
+
+from ._metadata import __version__
+
+if TYPE_CHECKING:
+    import cProfile
+
+logger = logging.getLogger(__name__)
+
+# 保持するスパンの最大数（古いものから捨てられます）
+MAX_RECORDS = 10000
+
+# reloader でこのモジュールがリロードされても設定と記録を引き継ぐ
+_enabled: bool = globals().get('_enabled', os.environ.get('PYSIDE_TEMPLATE_PROFILE', '') not in ('', '0'))
+_records: Deque[Dict[str, Any]] = globals().get('_records', deque(maxlen=MAX_RECORDS))
+_depth = 0
+_origin: float = globals().get('_origin', time.perf_counter())
+
+_profiler_armed: bool = globals().get('_profiler_armed', False)
+_profile_output_dir: Optional[str] = globals().get('_profile_output_dir')
+
+
+class _NullSpan:
+    """計測が無効な時に返す何もしないコンテキストマネージャー"""
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info: Any) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ('name', 'start')
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self) -> None:
+        global _depth
+        _depth += 1
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        global _depth
+        end = time.perf_counter()
+        _depth -= 1
+        _records.append(
+            {
+                'name': self.name,
+                'start_ms': (self.start - _origin) * 1000,
+                'duration_ms': (end - self.start) * 1000,
+                'depth': _depth,
+                'error': exc_info[0] is not None,
+            }
+        )
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def set_enabled(enabled: bool) -> None:
+    """
+    タイミングスパンの記録を有効・無効にします
+
+    環境変数 PYSIDE_TEMPLATE_PROFILE=1 でも起動時から有効にできます。
+    """
+    global _enabled
+    _enabled = enabled
+
+
+def span(name: str) -> Any:
+    """
+    ブロックの実行時間を記録するコンテキストマネージャーを返します
+
+    Args:
+        name (str): スパン名（'start', 'window.show' など）
+    """
+    if _enabled is False:
+        return _NULL_SPAN
+    return _Span(name)
+
+
+def records() -> List[Dict[str, Any]]:
+    """
+    記録されたスパンを古い順に返します
+    """
+    return list(_records)
+
+
+def summary() -> Dict[str, Dict[str, float]]:
+    """
+    スパン名ごとの回数・合計・平均・最大（ミリ秒）を返します
+    """
+    result: Dict[str, Dict[str, float]] = {}
+    for record in _records:
+        stats = result.setdefault(record['name'], {'count': 0, 'total_ms': 0.0, 'max_ms': 0.0})
+        stats['count'] += 1
+        stats['total_ms'] += record['duration_ms']
+        stats['max_ms'] = max(stats['max_ms'], record['duration_ms'])
+    for stats in result.values():
+        stats['mean_ms'] = stats['total_ms'] / stats['count']
+    return result
+
+
+def clear() -> None:
+    _records.clear()
+
+
+def export_json(path: Optional[str] = None) -> str:
+    """
+    記録したスパンと集計を JSON で書き出します
+
+    Args:
+        path (Optional[str]): 出力先。None の場合は一時フォルダに書き出します
+
+    Returns:
+        str: 書き出したファイルのパス
+    """
+    import json
+    import platform
+    import tempfile
+
+    if path is None:
+        path = os.path.join(tempfile.gettempdir(), f'pyside_template_timings_{os.getpid()}.json')
+
+    data = {
+        'version': __version__,
+        'maya_version': _maya_version(),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'hostname': platform.node(),
+        'exported_at': time.time(),
+        'summary': summary(),
+        'records': records(),
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=1)
+    logger.info('タイミングを書き出しました: %s', path)
+    return path
+
+
+def arm_profiler(armed: bool = True, output_dir: Optional[str] = None) -> None:
+    """
+    次の start() または restart() を cProfile で計測するように設定します
+
+    計測は 1 回で自動的に解除されます。
+
+    Args:
+        armed (bool): False の場合は設定を解除します
+        output_dir (Optional[str]): 統計ファイルの出力先。None の場合は一時フォルダ
+    """
+    global _profiler_armed, _profile_output_dir
+    _profiler_armed = armed
+    _profile_output_dir = output_dir
+
+
+def is_profiler_armed() -> bool:
+    return _profiler_armed
+
+
+@contextlib.contextmanager
+def profile_if_armed(label: str) -> Iterator[None]:
+    """
+    arm_profiler() で設定されている場合のみ、ブロックを cProfile で計測します
+
+    統計は <出力先>/pyside_template_<label>_<時刻>.prof に書き出され、
+    累積時間の上位がログに出力されます。
+
+    Args:
+        label (str): 計測対象の名前（'start', 'restart' など）
+    """
+    global _profiler_armed
+    if _profiler_armed is False:
+        yield
+        return
+
+    import cProfile
+
+    _profiler_armed = False
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        _dump_profile(profiler, label)
+
+
+def _dump_profile(profiler: 'cProfile.Profile', label: str) -> None:
+    import io
+    import pstats
+    import tempfile
+
+    output_dir = _profile_output_dir or tempfile.gettempdir()
+    path = os.path.join(output_dir, f'pyside_template_{label}_{time.strftime("%Y%m%d_%H%M%S")}.prof')
+    profiler.dump_stats(path)
+
+    stream = io.StringIO()
+    pstats.Stats(profiler, stream=stream).sort_stats('cumulative').print_stats(20)
+    logger.info('%s のプロファイルを書き出しました: %s\n%s', label, path, stream.getvalue())
+
+
+def _maya_version() -> Optional[str]:
+    maya_module = sys.modules.get('maya.cmds')
+    if maya_module is None:
+        return None
+    try:
+        return str(maya_module.about(version=True))
+    except Exception:
+        return None
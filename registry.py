@@ -0,0 +1,78 @@
+"""
+ウィンドウインスタンスのレジストリ
+
+インスタンス ID ごとにウィンドウを保持し、start() や restore() から O(1) で取得できるようにします。
+
+参照の寿命:
+    - ウィンドウの C++ オブジェクトが生存している間（WorkspaceControl にドッキングされている間）は
+      強参照で保持し、GC から保護します
+    - WorkspaceControl の削除などで C++ オブジェクトが破棄されたら強参照を解放します
+      （PySideTemplateWindow が destroyed シグナルで release() を呼びます）
+    - 解放後は弱参照のみを保持するため、レジストリが古いウィンドウを延命させることはありません
+"""
+
+import weakref
+from typing import Dict, Generic, List, Optional, TypeVar
+
+W = TypeVar('W')
+
+# 既定のインスタンス（インスタンス ID を指定しない場合）のキー
+DEFAULT_INSTANCE_ID = ''
+
+
+class WindowRegistry(Generic[W]):
+    """
+    インスタンス ID をキーにウィンドウを保持するレジストリ
+    """
+
+    def __init__(self) -> None:
+        self._docked: Dict[str, W] = {}
+        self._known: 'weakref.WeakValueDictionary[str, W]' = weakref.WeakValueDictionary()
+
+    def register(self, instance_id: Optional[str], window: W) -> None:
+        """
+        ウィンドウを登録して強参照で保持します
+
+        同じインスタンス ID のウィンドウが登録済みの場合は置き換えます。
+        """
+        key = _key(instance_id)
+        self._docked[key] = window
+        self._known[key] = window
+
+    def release(self, instance_id: Optional[str]) -> None:
+        """
+        強参照を解放します
+
+        弱参照は残るため、他に参照が残っていれば find() で取得できます。
+        """
+        self._docked.pop(_key(instance_id), None)
+
+    def get(self, instance_id: Optional[str]) -> Optional[W]:
+        """
+        強参照で保持しているウィンドウを返します
+        """
+        return self._docked.get(_key(instance_id))
+
+    def find(self, instance_id: Optional[str]) -> Optional[W]:
+        """
+        解放済みでもまだ GC されていないウィンドウを含めて返します
+        """
+        return self._known.get(_key(instance_id))
+
+    def instance_ids(self) -> List[str]:
+        """
+        強参照で保持しているウィンドウのインスタンス ID を返します
+        """
+        return list(self._docked)
+
+    def __len__(self) -> int:
+        return len(self._docked)
+
+
+def _key(instance_id: Optional[str]) -> str:
+    return DEFAULT_INSTANCE_ID if instance_id is None else instance_id
+
+
+# reloader でこのモジュールがリロードされても登録済みのウィンドウを保持し続けるよう、既存のインスタンスを引き継ぐ
+_previous_registry = globals().get('window_registry')
+window_registry: WindowRegistry = _previous_registry if _previous_registry is not None else WindowRegistry()
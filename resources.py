@@ -0,0 +1,317 @@
+"""
+アイコン・画像のリソースキャッシュ
+
+start / restart / restore でウィンドウを作るたびにアイコンをディスクから読み込むと、アイコンの多いツールを
+いくつもドッキングしている場合に Maya 起動時の restore の時間の大半を占め、同じ画像がウィンドウの数だけメモリに載ります。
+
+- resource_cache はプロセスで 1 つで、キーごとに 1 つの QPixmap / QIcon を共有します
+- 合計のバイト数が budget_bytes を超えると、最も長く使われていないものから破棄します（LRU）
+- build_bundle() で画像をまとめた 1 つのバンドルファイルを作っておくと、load_bundle() の 1 回の読み込みで
+  すべての画像のデータがメモリに載り、以降はファイルを開かずにデコードだけで取得できます
+- reloader でこのモジュールがリロードされてもキャッシュを引き継ぐため、restart() では読み込み直しません
+
+このモジュールは import 時に Qt を読み込まないため、userSetup から load_bundle() を呼んでも Maya の起動を遅くしません。
+QPixmap と QIcon はメインスレッドでのみ生成できるため、pixmap() と icon() はメインスレッドから呼んでください。
+
+使用例:
+    from pyside_template_window import resources
+
+    resources.resource_cache.add_search_path(os.path.join(os.path.dirname(__file__), 'icons'))
+    action.setIcon(resources.icon('save.png'))
+"""
+
+import collections
+import json
+import logging
+import os
+import struct
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from . import _qt, profiling
+
+logger = logging.getLogger(__name__)
+
+# 既定のキャッシュの予算（バイト）
+DEFAULT_BUDGET_BYTES = 32 * 1024 * 1024
+# build_bundle() が既定で含めるファイルの拡張子
+DEFAULT_EXTENSIONS = ('.png', '.svg', '.jpg', '.jpeg', '.bmp', '.gif', '.ico')
+
+# バンドルファイルの形式: マジック + インデックスの長さ（uint32 LE）+ インデックス（JSON）+ データ
+_BUNDLE_MAGIC = b'PTWRES1\n'
+_INDEX_LENGTH = struct.Struct('<I')
+
+
+class ResourceCache:
+    """
+    キーごとに QPixmap / QIcon を 1 つだけ保持する LRU キャッシュ
+
+    キーはリソースの相対パス（'icons/save.png' など、区切りは /）です。
+    データは読み込んだバンドル（後に読み込んだものが優先）、検索パスのフォルダの順に探します。
+    ':' で始まるキーは Qt のリソースシステムから読み込みます。
+    """
+
+    def __init__(self, budget_bytes: int = DEFAULT_BUDGET_BYTES) -> None:
+        self.budget_bytes = budget_bytes
+        self._search_paths: List[str] = []
+        self._bundles: List[Tuple[str, memoryview, Dict[str, List[int]]]] = []
+        # (種類, キー, サイズ) → (QPixmap または QIcon, バイト数)
+        self._entries: 'collections.OrderedDict[Tuple[str, str, Optional[Tuple[int, int]]], Tuple[Any, int]]' = (
+            collections.OrderedDict()
+        )
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats: Dict[str, int] = {'hits': 0, 'misses': 0, 'evictions': 0, 'file_reads': 0, 'bundle_reads': 0}
+
+    @property
+    def search_paths(self) -> List[str]:
+        return list(self._search_paths)
+
+    def add_search_path(self, path: str) -> None:
+        """
+        リソースを探すフォルダを追加します（追加済みの場合は何もしません）
+        """
+        path = os.path.abspath(path)
+        if path not in self._search_paths:
+            self._search_paths.append(path)
+
+    def load_bundle(self, path: str) -> int:
+        """
+        build_bundle() で作ったバンドルファイルを 1 回の読み込みでメモリに載せます
+
+        同じパスのバンドルを読み込み済みの場合は読み込み直します。画像のデコードは pixmap() / icon() で
+        初めて使われた時に行います。
+
+        Returns:
+            int: バンドルに含まれるリソースの数
+
+        Raises:
+            ValueError: バンドルファイルの形式が正しくない場合
+        """
+        path = os.path.abspath(path)
+        with profiling.span('resources.load_bundle'):
+            with open(path, 'rb') as f:
+                data = f.read()
+            if not data.startswith(_BUNDLE_MAGIC):
+                raise ValueError(f'バンドルファイルではありません: {path}')
+            start = len(_BUNDLE_MAGIC)
+            (index_length,) = _INDEX_LENGTH.unpack_from(data, start)
+            start += _INDEX_LENGTH.size
+            index = json.loads(data[start : start + index_length].decode('utf-8'))
+            payload = memoryview(data)[start + index_length :]
+        with self._lock:
+            self._bundles = [bundle for bundle in self._bundles if bundle[0] != path]
+            self._bundles.append((path, payload, index))
+        self._stats['bundle_reads'] += 1
+        logger.debug('%s(): %s から %d 件のリソースを読み込みました', self.load_bundle.__name__, path, len(index))
+        return len(index)
+
+    def unload_bundles(self) -> None:
+        """
+        読み込んだバンドルを破棄します（キャッシュ済みの QPixmap / QIcon は残ります）
+        """
+        with self._lock:
+            self._bundles = []
+
+    def read(self, key: str) -> Optional[bytes]:
+        """
+        リソースのデータを返します。見つからない場合は None
+        """
+        with self._lock:
+            bundles = list(self._bundles)
+        for _, payload, index in reversed(bundles):
+            entry = index.get(key)
+            if entry is not None:
+                offset, length = entry
+                return bytes(payload[offset : offset + length])
+
+        if key.startswith(':'):
+            qt_core = _qt.import_qt_module('QtCore')
+            resource_file = qt_core.QFile(key)
+            if not resource_file.open(qt_core.QIODevice.ReadOnly):
+                return None
+            try:
+                return bytes(resource_file.readAll())
+            finally:
+                resource_file.close()
+
+        for search_path in self._search_paths:
+            path = os.path.join(search_path, *key.split('/'))
+            if os.path.isfile(path):
+                self._stats['file_reads'] += 1
+                with open(path, 'rb') as f:
+                    return f.read()
+        return None
+
+    def pixmap(self, key: str, size: Optional[Tuple[int, int]] = None) -> Any:
+        """
+        リソースの QPixmap を返します
+
+        Args:
+            key: リソースのキー
+            size: (幅, 高さ)。指定した場合は縦横比を保って縮小・拡大したものを返します（サイズごとにキャッシュされます）
+
+        Returns:
+            QPixmap: 見つからない場合は null の QPixmap（isNull() が True）。null の結果はキャッシュしません
+        """
+        cache_key = ('pixmap', key, size)
+        cached = self._get(cache_key)
+        if cached is not None:
+            return cached
+
+        qt_gui = _qt.import_qt_module('QtGui')
+        if size is not None:
+            source = self.pixmap(key)
+            if source.isNull():
+                return source
+            qt_core = _qt.import_qt_module('QtCore')
+            pixmap = source.scaled(size[0], size[1], qt_core.Qt.KeepAspectRatio, qt_core.Qt.SmoothTransformation)
+        else:
+            data = self.read(key)
+            pixmap = qt_gui.QPixmap()
+            if data is None:
+                logger.warning('リソースが見つかりません: %s', key)
+                return pixmap
+            with profiling.span('resources.decode'):
+                if not pixmap.loadFromData(data, _format_of(key)):
+                    logger.warning('リソースを画像として読み込めませんでした: %s', key)
+                    return pixmap
+        self._put(cache_key, pixmap, _pixmap_bytes(pixmap))
+        return pixmap
+
+    def icon(self, key: str) -> Any:
+        """
+        リソースの QIcon を返します
+
+        キャッシュした QPixmap から作ります。QIcon は QPixmap のデータを共有するため、バイト数は QPixmap の分だけ数えます。
+
+        Returns:
+            QIcon: 見つからない場合は null の QIcon。null の結果はキャッシュしません
+        """
+        cache_key = ('icon', key, None)
+        cached = self._get(cache_key)
+        if cached is not None:
+            return cached
+
+        qt_gui = _qt.import_qt_module('QtGui')
+        pixmap = self.pixmap(key)
+        if pixmap.isNull():
+            return qt_gui.QIcon()
+        icon = qt_gui.QIcon(pixmap)
+        # データは pixmap のエントリで数えているため、二重に数えない
+        self._put(cache_key, icon, 0)
+        return icon
+
+    def clear(self) -> None:
+        """
+        キャッシュした QPixmap / QIcon をすべて破棄します
+        """
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        ヒット・ミス・破棄の回数と、現在のエントリ数・バイト数を返します
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._entries)
+            stats['bytes'] = self._bytes
+            stats['bundle_bytes'] = sum(len(payload) for _, payload, _ in self._bundles)
+        return stats
+
+    def _get(self, cache_key: Tuple[str, str, Optional[Tuple[int, int]]]) -> Any:
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is None:
+                self._stats['misses'] += 1
+                return None
+            self._entries.move_to_end(cache_key)
+            self._stats['hits'] += 1
+            return entry[0]
+
+    def _put(self, cache_key: Tuple[str, str, Optional[Tuple[int, int]]], value: Any, cost: int) -> None:
+        with self._lock:
+            previous = self._entries.pop(cache_key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[cache_key] = (value, cost)
+            self._bytes += cost
+            # 追加したエントリは予算を超えていても残す
+            while self._bytes > self.budget_bytes and len(self._entries) > 1:
+                _, (_, evicted_cost) = self._entries.popitem(last=False)
+                self._bytes -= evicted_cost
+                self._stats['evictions'] += 1
+
+
+def build_bundle(source_dir: str, output_path: str, extensions: Iterable[str] = DEFAULT_EXTENSIONS) -> int:
+    """
+    フォルダ以下の画像を 1 つのバンドルファイルにまとめます
+
+    キーは source_dir からの相対パス（区切りは /）です。Qt は使わないため、ビルドスクリプトからも呼べます。
+
+    Args:
+        source_dir: 画像のフォルダ
+        output_path: 書き出すバンドルファイルのパス
+        extensions: 含めるファイルの拡張子（小文字）
+
+    Returns:
+        int: バンドルに含めたリソースの数
+    """
+    extensions = tuple(extensions)
+    index: Dict[str, List[int]] = {}
+    chunks: List[bytes] = []
+    offset = 0
+    for root, dirs, files in os.walk(source_dir):
+        dirs.sort()
+        for name in sorted(files):
+            if not name.lower().endswith(extensions):
+                continue
+            path = os.path.join(root, name)
+            key = os.path.relpath(path, source_dir).replace(os.sep, '/')
+            with open(path, 'rb') as f:
+                data = f.read()
+            index[key] = [offset, len(data)]
+            chunks.append(data)
+            offset += len(data)
+
+    index_data = json.dumps(index, separators=(',', ':')).encode('utf-8')
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    with open(output_path, 'wb') as f:
+        f.write(_BUNDLE_MAGIC)
+        f.write(_INDEX_LENGTH.pack(len(index_data)))
+        f.write(index_data)
+        for chunk in chunks:
+            f.write(chunk)
+    logger.info('%d 件のリソースをバンドルにまとめました: %s（%d バイト）', len(index), output_path, offset)
+    return len(index)
+
+
+def pixmap(key: str, size: Optional[Tuple[int, int]] = None) -> Any:
+    """
+    resource_cache.pixmap() のショートカットです
+    """
+    return resource_cache.pixmap(key, size)
+
+
+def icon(key: str) -> Any:
+    """
+    resource_cache.icon() のショートカットです
+    """
+    return resource_cache.icon(key)
+
+
+def _format_of(key: str) -> Optional[str]:
+    # 拡張子から形式を渡すと、Qt が形式を推測するためにすべてのデコーダーを試さずに済む
+    extension = os.path.splitext(key)[1][1:].upper()
+    return extension or None
+
+
+def _pixmap_bytes(pixmap: Any) -> int:
+    return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+
+# reloader でこのモジュールがリロードされてもキャッシュと読み込んだバンドルを引き継ぐ
+_previous_cache = globals().get('resource_cache')
+resource_cache: ResourceCache = _previous_cache if _previous_cache is not None else ResourceCache()
@@ -0,0 +1,173 @@
+"""
+シーンのイベントの購読
+
+選択の変更・DAG の変更・シーンを開いた時などのイベントで UI を更新するためのモジュールです。
+大量のオブジェクトを選択すると Maya はイベントを数千回発生させるため、イベントごとに更新すると UI が止まってしまいます。
+Subscription はイベントの連続をまとめ、コールバックを 1 回だけ呼びます。
+
+ポリシー:
+    - DEBOUNCE: 最後のイベントから interval_ms の間イベントが無かった時に 1 回呼びます
+    - THROTTLE: 最初のイベントから interval_ms 後に 1 回呼びます（イベントが続いていても interval_ms ごとに呼ばれます）
+
+interval_ms が 0 の場合は、イベントループの次の周回（次のフレーム）で 1 回呼びます。
+
+イベントのコールバックは host の add_scene_callback() で登録します。
+通常は PySideTemplateWindow.subscribe() を使ってください。WorkspaceControl が閉じられた時と restart / close の時に
+コールバックが自動で解除されます。
+
+使用例:
+    self.subscribe(scene_events.SELECTION_CHANGED, self._refresh_selection)
+    self.subscribe([scene_events.DAG_CHANGED, scene_events.SCENE_OPENED], self._refresh, policy=scene_events.THROTTLE)
+"""
+
+import logging
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+try:
+    from PySide6.QtCore import QObject, QTimer  # type: ignore
+except ImportError:
+    from PySide2.QtCore import QObject, QTimer  # type: ignore
+
+from . import _qt, host, profiling
+from .host._base import DAG_CHANGED, SCENE_EVENTS, SCENE_OPENED, SELECTION_CHANGED
+
+# イベント名は scene_events.SELECTION_CHANGED のように参照できるように再エクスポートする
+__all__ = [
+    'DAG_CHANGED',
+    'SCENE_EVENTS',
+    'SCENE_OPENED',
+    'SELECTION_CHANGED',
+    'DEBOUNCE',
+    'THROTTLE',
+    'POLICIES',
+    'DEFAULT_INTERVAL_MS',
+    'Subscription',
+]
+
+logger = logging.getLogger(__name__)
+
+DEBOUNCE = 'debounce'
+THROTTLE = 'throttle'
+POLICIES = (DEBOUNCE, THROTTLE)
+
+# 既定のまとめる間隔（ミリ秒）
+DEFAULT_INTERVAL_MS = 50
+
+
+class Subscription:
+    """
+    シーンのイベントの購読
+
+    イベントごとに行う処理はカウンターと時刻の更新だけで、コールバックはタイマーから呼ばれます。
+    resume() でホストにコールバックを登録し、pause() で解除します。
+    """
+
+    def __init__(
+        self,
+        events: Union[str, Iterable[str]],
+        callback: Callable[[], Any],
+        policy: str = DEBOUNCE,
+        interval_ms: int = DEFAULT_INTERVAL_MS,
+        parent: Optional[QObject] = None,
+    ) -> None:
+        """
+        Args:
+            events: 購読するイベント（SCENE_EVENTS のいずれか、またはそのリスト）
+            callback: イベントの連続ごとに引数なしで呼ばれる関数
+            policy: DEBOUNCE または THROTTLE
+            interval_ms: まとめる間隔（ミリ秒）
+            parent: タイマーの親。親が破棄されると購読も無効になります
+
+        Raises:
+            ValueError: 未対応のイベントまたはポリシーが指定された場合
+        """
+        self.events = (events,) if isinstance(events, str) else tuple(events)
+        unknown = [event for event in self.events if event not in SCENE_EVENTS]
+        if unknown or not self.events:
+            raise ValueError(f'events には {list(SCENE_EVENTS)} を指定してください: {unknown or events!r}')
+        if policy not in POLICIES:
+            raise ValueError(f'policy には {list(POLICIES)} のいずれかを指定してください: {policy!r}')
+
+        self.callback = callback
+        self.policy = policy
+        self.interval_ms = max(int(interval_ms), 0)
+        self._callback_ids: List[Any] = []
+        self._pending = 0
+        self._last_event = 0.0
+        self._stats: Dict[str, int] = {'events': 0, 'calls': 0}
+
+        self._timer = QTimer(parent)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._on_timeout)
+
+    @property
+    def active(self) -> bool:
+        """
+        ホストにコールバックが登録されているか
+        """
+        return bool(self._callback_ids)
+
+    def resume(self) -> None:
+        """
+        ホストにコールバックを登録します（登録済みの場合は何もしません）
+        """
+        if self.active or _qt.is_valid(self._timer) is False:
+            return
+        backend = host.get_host()
+        self._callback_ids = [backend.add_scene_callback(event, self._on_event) for event in self.events]
+
+    def pause(self) -> None:
+        """
+        ホストのコールバックを解除し、まとめている途中のイベントを破棄します
+        """
+        backend = host.get_host()
+        while self._callback_ids:
+            callback_id = self._callback_ids.pop()
+            try:
+                backend.remove_scene_callback(callback_id)
+            except RuntimeError:
+                logger.debug('%s(): コールバック %s は既に解除されています', self.pause.__name__, callback_id)
+        self._pending = 0
+        if _qt.is_valid(self._timer):
+            self._timer.stop()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        受け取ったイベントの数と、コールバックを呼んだ回数を返します
+        """
+        return dict(self._stats)
+
+    def _on_event(self) -> None:
+        # 親のウィンドウが shutdown() されずに破棄された場合
+        if _qt.is_valid(self._timer) is False:
+            self.pause()
+            return
+        self._pending += 1
+        self._stats['events'] += 1
+        if self.policy == DEBOUNCE:
+            self._last_event = time.perf_counter()
+        # 連続の最初のイベントでだけタイマーを開始する（_pending はコールバックを呼ぶまで 0 に戻らない）
+        if self._pending == 1:
+            self._timer.start(self.interval_ms)
+
+    def _on_timeout(self) -> None:
+        # 別の単発タイマーは親に関係なく呼ばれるため、親が破棄された場合は何もしない
+        if self._pending == 0 or _qt.is_valid(self._timer) is False:
+            return
+        if self.policy == DEBOUNCE:
+            remaining_ms = self.interval_ms - (time.perf_counter() - self._last_event) * 1000
+            if remaining_ms >= 1:
+                # タイマーを自身の timeout の中で開始し直さず、別の単発タイマーで残りの時間を待つ
+                QTimer.singleShot(int(remaining_ms), self._on_timeout)
+                return
+
+        count = self._pending
+        self._pending = 0
+        self._stats['calls'] += 1
+        logger.debug('%s(): %s の %d 件のイベントをまとめて処理します', self._on_timeout.__name__, self.events, count)
+        with profiling.span('scene_events.callback'):
+            try:
+                self.callback()
+            except Exception:
+                logger.exception('シーンのイベントのコールバックでエラーが発生しました: %s', self.callback)
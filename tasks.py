@@ -0,0 +1,333 @@
+"""
+バックグラウンドタスクの実行モジュール
+
+ファイル走査やデータベース問い合わせなど時間のかかる処理を QThreadPool で実行し、
+Maya の UI スレッドを止めないようにします。
+
+- 進捗・結果・エラーは Qt のシグナルでメインスレッドに届きます
+- ウィンドウを閉じた時や restart した時は shutdown() で実行中のタスクにキャンセルを要求し、
+  SHUTDOWN_WAIT_MS まで終了を待ちます。終わらなかったタスクのスレッドプールはモジュールで保持するため、
+  ウィンドウの破棄で Maya のメインスレッドがタスクの終了を待つことはありません
+- キャンセルを確認しない（raise_if_cancelled() を呼ばない）タスクは最後まで実行され続け、
+  Maya の終了時にはその終了を待ちます。長い処理では定期的にキャンセルを確認してください
+- ワーカースレッドから maya.cmds を呼ぶ場合は run_in_main_thread() を使ってください
+  （maya.cmds はメインスレッド以外から呼んではいけません）
+
+使用例:
+    def scan(context: TaskContext, root: str) -> List[str]:
+        files = []
+        for i, path in enumerate(iter_files(root)):
+            context.raise_if_cancelled()
+            context.report_progress(i, path)
+            files.append(path)
+        return files
+
+    self.tasks.submit(scan, '/path/to/root', on_result=self._on_scanned)
+"""
+
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal  # type: ignore
+except ImportError:
+    from PySide2.QtCore import QObject, QRunnable, QThreadPool, Signal  # type: ignore
+
+from . import host
+
+logger = logging.getLogger(__name__)
+
+# shutdown() で実行中のタスクの終了を待つ最大時間（ミリ秒）
+SHUTDOWN_WAIT_MS = 100
+
+
+class TaskCancelled(Exception):
+    """
+    タスクがキャンセルされたことを表す例外
+
+    TaskContext.raise_if_cancelled() が送出します。タスク関数の外へ送出された場合も
+    エラーとしては扱われません。
+    """
+
+
+class TaskContext:
+    """
+    タスク関数に渡されるコンテキスト
+
+    キャンセルの確認と進捗の通知に使います。
+    """
+
+    def __init__(self, task_id: int, signals: '_TaskSignals') -> None:
+        self.task_id = task_id
+        self._signals = signals
+        self._cancelled = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    def raise_if_cancelled(self) -> None:
+        """
+        キャンセルが要求されていれば TaskCancelled を送出します
+        """
+        if self._cancelled.is_set():
+            raise TaskCancelled()
+
+    def report_progress(self, value: int, message: str = '') -> None:
+        """
+        進捗を通知します（どのスレッドから呼んでも構いません）
+        """
+        if self._cancelled.is_set() is False:
+            self._signals.progress.emit(self.task_id, value, message)
+
+
+class _TaskSignals(QObject):
+    """
+    ワーカースレッドからメインスレッドへ通知するためのシグナル
+
+    TaskRunner（メインスレッドの QObject）のメソッドに接続されるため、
+    ワーカースレッドで emit してもコールバックはメインスレッドで呼ばれます。
+    """
+
+    progress = Signal(int, int, str)
+    result = Signal(int, object)
+    error = Signal(int, object)
+    finished = Signal(int)
+
+
+class _TaskRunnable(QRunnable):
+    def __init__(self, func: Callable[..., Any], context: TaskContext, args: tuple, kwargs: Dict[str, Any]) -> None:
+        super().__init__()
+        self.setAutoDelete(False)
+        self._func = func
+        self._context = context
+        self._args = args
+        self._kwargs = kwargs
+
+    def run(self) -> None:
+        context = self._context
+        signals = context._signals
+        try:
+            context.raise_if_cancelled()
+            result = self._func(context, *self._args, **self._kwargs)
+        except TaskCancelled:
+            pass
+        except Exception as e:
+            if context.cancelled is False:
+                signals.error.emit(context.task_id, e)
+        else:
+            if context.cancelled is False:
+                signals.result.emit(context.task_id, result)
+        finally:
+            signals.finished.emit(context.task_id)
+
+
+class TaskHandle:
+    """
+    submit() が返すタスクのハンドル
+    """
+
+    def __init__(
+        self,
+        runnable: _TaskRunnable,
+        context: TaskContext,
+        on_result: Optional[Callable[[Any], None]],
+        on_progress: Optional[Callable[[int, str], None]],
+        on_error: Optional[Callable[[Exception], None]],
+        on_finished: Optional[Callable[[], None]],
+    ) -> None:
+        self.task_id = context.task_id
+        self.done = False
+        self._runnable = runnable
+        self._context = context
+        self._on_result = on_result
+        self._on_progress = on_progress
+        self._on_error = on_error
+        self._on_finished = on_finished
+
+    @property
+    def cancelled(self) -> bool:
+        return self._context.cancelled
+
+    def cancel(self) -> None:
+        """
+        タスクにキャンセルを要求します
+
+        開始前のタスクは実行されません。実行中のタスクは raise_if_cancelled() などで
+        キャンセルを確認した時点で終了します。キャンセル後に結果・エラー・進捗は通知されません。
+        """
+        self._context.cancel()
+
+
+class TaskRunner(QObject):
+    """
+    ウィンドウごとのバックグラウンドタスク実行器
+
+    グローバルの QThreadPool ではなく専用のスレッドプールを使うため、
+    あるウィンドウの cancel_all() が他のツールのタスクに影響することはありません。
+
+    スレッドプールとシグナルはウィンドウの子にしません。子にすると、ウィンドウの破棄時に ~QThreadPool が
+    実行中のタスクの終了までメインスレッドを止めるためです（shutdown() を参照）。
+    """
+
+    def __init__(self, parent: Optional[QObject] = None, max_threads: Optional[int] = None) -> None:
+        super().__init__(parent)
+        self._pool = QThreadPool()
+        if max_threads is not None:
+            self._pool.setMaxThreadCount(max_threads)
+        # 実行中のタスクの TaskContext からも参照されるため、TaskRunner が破棄されても終了まで残る
+        self._signals = _TaskSignals()
+        self._signals.progress.connect(self._dispatch_progress)
+        self._signals.result.connect(self._dispatch_result)
+        self._signals.error.connect(self._dispatch_error)
+        self._signals.finished.connect(self._dispatch_finished)
+        self._tasks: Dict[int, TaskHandle] = {}
+        self._next_id = 0
+
+    def submit(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        on_result: Optional[Callable[[Any], None]] = None,
+        on_progress: Optional[Callable[[int, str], None]] = None,
+        on_error: Optional[Callable[[Exception], None]] = None,
+        on_finished: Optional[Callable[[], None]] = None,
+        **kwargs: Any,
+    ) -> TaskHandle:
+        """
+        タスクをスレッドプールで実行します
+
+        func は第 1 引数に TaskContext を受け取ります。コールバックはすべてメインスレッドで呼ばれます。
+
+        Args:
+            func: ワーカースレッドで実行する関数
+            *args: func に渡す位置引数
+            on_result: 戻り値を受け取るコールバック
+            on_progress: 進捗 (value, message) を受け取るコールバック
+            on_error: 送出された例外を受け取るコールバック（省略時はログに出力します）
+            on_finished: 成功・失敗・キャンセルにかかわらず最後に呼ばれるコールバック
+            **kwargs: func に渡すキーワード引数
+
+        Returns:
+            TaskHandle: タスクのハンドル
+        """
+        self._next_id += 1
+        context = TaskContext(self._next_id, self._signals)
+        runnable = _TaskRunnable(func, context, args, kwargs)
+        handle = TaskHandle(runnable, context, on_result, on_progress, on_error, on_finished)
+
+        self._tasks[handle.task_id] = handle
+        self._pool.start(runnable)
+        return handle
+
+    def active_count(self) -> int:
+        """
+        終了していないタスクの数を返します
+        """
+        return len(self._tasks)
+
+    def cancel_all(self, wait_ms: int = 0) -> None:
+        """
+        すべてのタスクにキャンセルを要求します
+
+        Args:
+            wait_ms (int): 実行中のタスクの終了を待つ最大時間（ミリ秒）。0 の場合は待ちません
+        """
+        if not self._tasks:
+            return
+        logger.debug('%s(): %s 個のタスクをキャンセルします', self.cancel_all.__name__, len(self._tasks))
+        # 開始前のタスクも開始直後にキャンセルを確認して終了し、finished が通知される
+        for handle in self._tasks.values():
+            handle.cancel()
+        if wait_ms > 0:
+            self._pool.waitForDone(wait_ms)
+
+    def shutdown(self, wait_ms: int = SHUTDOWN_WAIT_MS) -> bool:
+        """
+        すべてのタスクにキャンセルを要求し、wait_ms まで終了を待ちます
+
+        ウィンドウの破棄の前に PySideTemplateWindow.shutdown() から呼ばれます。
+        終わらなかったタスクは、スレッドプールとともにタスクが終わるまでモジュールで保持します。
+
+        Args:
+            wait_ms (int): 実行中のタスクの終了を待つ最大時間（ミリ秒）
+
+        Returns:
+            bool: すべてのタスクが終了した場合 True
+        """
+        _release_drained_pools()
+        self.cancel_all()
+        if self._pool.waitForDone(wait_ms):
+            return True
+        logger.warning(
+            '%s(): %d 個のタスクが %d ms 以内にキャンセルを確認しませんでした。終了するまでバックグラウンドで実行されます',
+            self.shutdown.__name__,
+            self._pool.activeThreadCount(),
+            wait_ms,
+        )
+        # QRunnable は自動で削除しないため、スレッドプールと一緒に実行中のタスクも保持する
+        _draining_pools.append((self._pool, list(self._tasks.values())))
+        return False
+
+    def _dispatch_progress(self, task_id: int, value: int, message: str) -> None:
+        handle = self._tasks.get(task_id)
+        if handle is not None and handle._on_progress is not None and handle.cancelled is False:
+            handle._on_progress(value, message)
+
+    def _dispatch_result(self, task_id: int, result: Any) -> None:
+        handle = self._tasks.get(task_id)
+        if handle is not None and handle._on_result is not None and handle.cancelled is False:
+            handle._on_result(result)
+
+    def _dispatch_error(self, task_id: int, error: Exception) -> None:
+        handle = self._tasks.get(task_id)
+        if handle is None or handle.cancelled:
+            return
+        if handle._on_error is not None:
+            handle._on_error(error)
+        else:
+            logger.error('バックグラウンドタスクでエラーが発生しました', exc_info=error)
+
+    def _dispatch_finished(self, task_id: int) -> None:
+        handle = self._tasks.pop(task_id, None)
+        if handle is None:
+            return
+        handle.done = True
+        if handle._on_finished is not None:
+            handle._on_finished()
+
+
+def _release_drained_pools() -> None:
+    # タスクが終わったスレッドプールは破棄しても待たされない
+    _draining_pools[:] = [entry for entry in _draining_pools if not entry[0].waitForDone(0)]
+
+
+def run_in_main_thread(func: Callable[..., Any], *args: Any, wait: bool = False, **kwargs: Any) -> Any:
+    """
+    関数をメインスレッドで実行します
+
+    ワーカースレッドから maya.cmds を呼ぶ場合に使います。メインスレッドから呼んだ場合はその場で実行します。
+
+    Args:
+        func: メインスレッドで実行する関数
+        wait (bool): True の場合は実行完了まで待ち、戻り値を返します。
+                     False の場合はホストの execute_deferred()（Maya では maya.utils.executeDeferred()）で予約して None を返します
+
+    Returns:
+        Any: wait=True の場合は func の戻り値
+    """
+    if threading.current_thread() is threading.main_thread():
+        return func(*args, **kwargs)
+
+    if wait:
+        return host.get_host().execute_in_main_thread_with_result(func, *args, **kwargs)
+    host.get_host().execute_deferred(func, *args, **kwargs)
+    return None
+
+
+# shutdown() で終わらなかったタスクのスレッドプールとタスク（reloader でリロードされても引き継ぐ）
+_draining_pools: List[Tuple[QThreadPool, List[TaskHandle]]] = globals().get('_draining_pools', [])
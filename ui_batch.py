@@ -0,0 +1,230 @@
+"""
+UI の一括更新
+
+ウィジェットを大量に追加・削除したり、テキストやモデルをまとめて更新すると、変更ごとにレイアウトと再描画が
+発生します。WorkspaceControl にドッキングされたウィンドウでは Maya の UI 全体のレイアウトに波及するため特に遅くなります。
+
+UpdateBatch はブロックの間、対象のウィジェット以下について以下を止め、ブロックを抜ける時に 1 回だけ行います:
+    - 再描画（setUpdatesEnabled(False)）
+    - レイアウト（QLayout.setEnabled(False)。抜ける時にすべてのレイアウトを上から順に 1 回ずつ計算します）
+    - シグナル（block_signals が True の場合。レイアウトに配置されたウィジェットのシグナルをブロックします）
+
+シグナルをブロックするのは、対象のウィジェットと、そのレイアウト（QSplitter の場合は子）に配置された
+ウィジェットだけです。スクロールバーやヘッダーなど、ウィジェットの内部の子はブロックしないため、
+ブロック中にモデルを更新してもビューは追従します。
+
+ブロックの間にイベントループが回った回数（省略した再描画とレイアウトの回数の上限）などは stats() で取得できます。
+チャンクごとに processEvents() したり、タスクの結果を少しずつ反映するなど、イベントループをまたぐ更新ほど効果があります。
+
+使用例:
+    with self.batch_update() as batch:
+        for asset in assets:
+            layout.addWidget(AssetWidget(asset))
+    logger.debug('%s', batch.stats())
+"""
+
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from PySide6.QtCore import QAbstractEventDispatcher, QEvent, QObject  # type: ignore
+    from PySide6.QtWidgets import QLayout, QSplitter, QWidget  # type: ignore
+except ImportError:
+    from PySide2.QtCore import QAbstractEventDispatcher, QEvent, QObject  # type: ignore
+    from PySide2.QtWidgets import QLayout, QSplitter, QWidget  # type: ignore
+
+from . import _qt, profiling
+
+logger = logging.getLogger(__name__)
+
+# 一括更新中のウィジェットの id → ネストの深さ
+_active: Dict[int, int] = {}
+
+
+class _LayoutRequestCounter(QObject):
+    """レイアウトを止めているウィジェットに設置して、吸収したレイアウト要求を数えるイベントフィルター"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.count = 0
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if event.type() == QEvent.LayoutRequest:
+            self.count += 1
+        return False
+
+
+class UpdateBatch:
+    """
+    ウィジェット以下の再描画・レイアウト・シグナルを止めるコンテキストマネージャー
+
+    同じウィジェットの一括更新がネストした場合、内側のブロックは何もしません。
+    """
+
+    def __init__(self, widget: QWidget, block_signals: bool = True) -> None:
+        """
+        Args:
+            widget: 一括更新するウィジェット（通常はセントラルウィジェットやパネル）
+            block_signals: レイアウトに配置されたウィジェットのシグナルをブロックするか
+        """
+        self.widget = widget
+        self.block_signals = block_signals
+        self._outermost = False
+        self._updates_enabled = True
+        self._layouts: List[Tuple[QLayout, bool]] = []
+        self._blocked: List[Tuple[QWidget, bool]] = []
+        self._counter: Optional[_LayoutRequestCounter] = None
+        self._watched: List[QWidget] = []
+        self._dispatcher: Optional[QAbstractEventDispatcher] = None
+        self._start = 0.0
+        self._stats: Dict[str, float] = {
+            'frames': 0,
+            'layout_requests': 0,
+            'layouts': 0,
+            'blocked_widgets': 0,
+            'elapsed_ms': 0.0,
+        }
+
+    def stats(self) -> Dict[str, float]:
+        """
+        一括更新の結果を返します（ブロックを抜けた後に呼んでください）
+
+        - frames: 止めている間にイベントループがイベントを処理した回数。止めていなければ、
+          変更のあったフレームごとに再描画とレイアウトが行われます（省略できた回数の上限）
+        - layout_requests: 止めているレイアウトが受け取ったレイアウト要求の数
+        - layouts: 抜ける時に計算し直したレイアウトの数
+        - blocked_widgets: シグナルをブロックしたウィジェットの数
+        - elapsed_ms: ブロックの実行時間
+        """
+        return dict(self._stats)
+
+    def __enter__(self) -> 'UpdateBatch':
+        self._start = time.perf_counter()
+        key = id(self.widget)
+        depth = _active.get(key, 0)
+        _active[key] = depth + 1
+        if depth:
+            return self
+        self._outermost = True
+
+        widget = self.widget
+        self._updates_enabled = widget.updatesEnabled()
+        widget.setUpdatesEnabled(False)
+
+        self._counter = _LayoutRequestCounter()
+        for layout in _find_layouts(widget):
+            self._layouts.append((layout, layout.isEnabled()))
+            layout.setEnabled(False)
+            parent = layout.parentWidget()
+            if parent is not None and parent not in self._watched:
+                parent.installEventFilter(self._counter)
+                self._watched.append(parent)
+
+        if self.block_signals:
+            for child in _find_laid_out_widgets(widget):
+                self._blocked.append((child, child.blockSignals(True)))
+
+        self._dispatcher = QAbstractEventDispatcher.instance()
+        if self._dispatcher is not None:
+            self._dispatcher.awake.connect(self._on_frame)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        key = id(self.widget)
+        depth = _active.get(key, 1) - 1
+        if depth:
+            _active[key] = depth
+        else:
+            _active.pop(key, None)
+        if not self._outermost:
+            return
+        if self._dispatcher is not None:
+            self._dispatcher.awake.disconnect(self._on_frame)
+            self._dispatcher = None
+
+        with profiling.span('ui_batch.flush'):
+            for child, was_blocked in reversed(self._blocked):
+                if _qt.is_valid(child):
+                    child.blockSignals(was_blocked)
+            self._stats['blocked_widgets'] = len(self._blocked)
+            self._blocked = []
+
+            for parent in self._watched:
+                if _qt.is_valid(parent):
+                    parent.removeEventFilter(self._counter)
+            self._watched = []
+            self._stats['layout_requests'] = self._counter.count if self._counter is not None else 0
+            self._counter = None
+
+            # 上の階層から順に計算すると、子のレイアウトは親が決めたサイズで 1 回だけ計算される
+            layouts = [layout for layout, was_enabled in self._layouts if _qt.is_valid(layout) and was_enabled]
+            for layout, was_enabled in self._layouts:
+                if _qt.is_valid(layout):
+                    layout.setEnabled(was_enabled)
+            for layout in layouts:
+                layout.invalidate()
+            for layout in layouts:
+                layout.activate()
+            self._stats['layouts'] = len(layouts)
+            self._layouts = []
+
+            if _qt.is_valid(self.widget):
+                self.widget.updateGeometry()
+                # 止めている間の変更をまとめて 1 回で再描画する
+                self.widget.setUpdatesEnabled(self._updates_enabled)
+        self._stats['elapsed_ms'] = (time.perf_counter() - self._start) * 1000
+        logger.debug(
+            '%s(): %d フレーム分の再描画とレイアウトを 1 回にまとめました（%.1f ms）',
+            self.__exit__.__name__,
+            self._stats['frames'],
+            self._stats['elapsed_ms'],
+        )
+
+    def _on_frame(self) -> None:
+        self._stats['frames'] += 1
+
+
+def _find_layouts(widget: QWidget) -> List[QLayout]:
+    """
+    ウィジェット以下のすべてのレイアウトを上の階層から順に返します
+    """
+    return sorted(widget.findChildren(QLayout), key=_depth)
+
+
+def _depth(obj: QObject) -> int:
+    depth = 0
+    parent = obj.parent()
+    while parent is not None:
+        depth += 1
+        parent = parent.parent()
+    return depth
+
+
+def _find_laid_out_widgets(widget: QWidget) -> List[QWidget]:
+    """
+    ウィジェットと、そのレイアウト（QSplitter の場合は子）に配置されたウィジェットを再帰的に返します
+    """
+    result: List[QWidget] = []
+    stack = [widget]
+    while stack:
+        current = stack.pop()
+        result.append(current)
+        if isinstance(current, QSplitter):
+            stack.extend(current.widget(index) for index in range(current.count()))
+            continue
+        layout = current.layout()
+        if layout is not None:
+            stack.extend(_layout_widgets(layout))
+    return result
+
+
+def _layout_widgets(layout: QLayout) -> List[QWidget]:
+    widgets: List[QWidget] = []
+    for index in range(layout.count()):
+        item = layout.itemAt(index)
+        if item.widget() is not None:
+            widgets.append(item.widget())
+        elif item.layout() is not None:
+            widgets.extend(_layout_widgets(item.layout()))
+    return widgets
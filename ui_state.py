@@ -0,0 +1,400 @@
+"""
+ウィンドウの UI の状態の保存と復元
+
+restart() や Maya 起動時の restore ではウィンドウが作り直されるため、入力した値やスプリッター・列の幅が失われます。
+このモジュールは登録したウィジェットの状態をウィンドウ名ごとに保存し、ウィンドウを構築する時に適用します。
+
+- 変更のシグナルで行う処理はフラグと時刻の設定だけで、タイマーは止まっている時だけ開始します。状態の取得と書き込みは、
+  最後の変更から SAVE_DELAY_MS の間変更が無かった時に 1 回だけ行います
+- 状態はメモリ上（state_store）にも保持するため、restart() ではファイルを読みません。
+  ファイルは Maya の起動後に初めてウィンドウを構築する時に 1 回だけ読みます
+- ファイルは zlib で圧縮したコンパクトな JSON です。QHeaderView や QSplitter の状態は
+  Qt の saveState() のバイト列を base64 で保存します
+- 状態は bind() した時点で適用します。_init_content() の中で bind() すれば、最初のレイアウトの前に
+  適用されるため、レイアウトのやり直しは発生しません
+
+使用例:
+    def _init_content(self, layout):
+        splitter = QSplitter(self)
+        ...
+        self.ui_state.bind('splitter', splitter)
+        self.ui_state.bind('name', name_edit)
+"""
+
+import base64
+import functools
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+import zlib
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+try:
+    from PySide6.QtCore import QObject, QTimer  # type: ignore
+    from PySide6.QtWidgets import (  # type: ignore
+        QAbstractButton,
+        QComboBox,
+        QDoubleSpinBox,
+        QHeaderView,
+        QLineEdit,
+        QSlider,
+        QSpinBox,
+        QSplitter,
+        QTabWidget,
+    )
+except ImportError:
+    from PySide2.QtCore import QObject, QTimer  # type: ignore
+    from PySide2.QtWidgets import (  # type: ignore
+        QAbstractButton,
+        QComboBox,
+        QDoubleSpinBox,
+        QHeaderView,
+        QLineEdit,
+        QSlider,
+        QSpinBox,
+        QSplitter,
+        QTabWidget,
+    )
+
+from . import _qt, profiling
+
+logger = logging.getLogger(__name__)
+
+# 最後の変更から書き込むまでの時間（ミリ秒）
+SAVE_DELAY_MS = 1000
+# ファイルの形式のバージョン（互換性の無い変更をしたら上げる）
+FORMAT_VERSION = 1
+# 保存先のフォルダを指定する環境変数
+STATE_DIR_ENV = 'PYSIDE_TEMPLATE_STATE_DIR'
+
+
+class Adapter(NamedTuple):
+    """
+    ウィジェットの状態の取得・適用の方法
+
+    get() と set() は JSON にできる値を扱い、signals() は変更を通知するシグナルを返します。
+    """
+
+    get: Callable[[Any], Any]
+    set: Callable[[Any, Any], None]
+    signals: Callable[[Any], List[Any]]
+
+
+def _encode_bytes(data: Any) -> str:
+    return base64.b64encode(bytes(data)).decode('ascii')
+
+
+def _decode_bytes(text: str) -> bytes:
+    return base64.b64decode(text.encode('ascii'))
+
+
+# 先に一致したものが使われるため、サブクラスを先に並べる
+ADAPTERS: List[Tuple[type, Adapter]] = [
+    (
+        QHeaderView,
+        Adapter(
+            lambda w: _encode_bytes(w.saveState()),
+            lambda w, v: w.restoreState(_decode_bytes(v)),
+            lambda w: [w.sectionResized, w.sectionMoved, w.sortIndicatorChanged],
+        ),
+    ),
+    (
+        QSplitter,
+        Adapter(
+            lambda w: _encode_bytes(w.saveState()),
+            lambda w, v: w.restoreState(_decode_bytes(v)),
+            lambda w: [w.splitterMoved],
+        ),
+    ),
+    (QLineEdit, Adapter(lambda w: w.text(), lambda w, v: w.setText(v), lambda w: [w.textChanged])),
+    (QAbstractButton, Adapter(lambda w: w.isChecked(), lambda w, v: w.setChecked(v), lambda w: [w.toggled])),
+    (
+        QComboBox,
+        Adapter(lambda w: w.currentIndex(), lambda w, v: w.setCurrentIndex(v), lambda w: [w.currentIndexChanged]),
+    ),
+    (QSpinBox, Adapter(lambda w: w.value(), lambda w, v: w.setValue(v), lambda w: [w.valueChanged])),
+    (QDoubleSpinBox, Adapter(lambda w: w.value(), lambda w, v: w.setValue(v), lambda w: [w.valueChanged])),
+    (QSlider, Adapter(lambda w: w.value(), lambda w, v: w.setValue(v), lambda w: [w.valueChanged])),
+    (
+        QTabWidget,
+        Adapter(lambda w: w.currentIndex(), lambda w, v: w.setCurrentIndex(v), lambda w: [w.currentChanged]),
+    ),
+]
+
+
+def find_adapter(widget: Any) -> Optional[Adapter]:
+    """
+    ウィジェットに対応する Adapter を返します。対応していない場合は None
+    """
+    for widget_type, adapter in ADAPTERS:
+        if isinstance(widget, widget_type):
+            return adapter
+    return None
+
+
+class StateStore:
+    """
+    ウィンドウ名ごとの状態を保持し、ファイルに読み書きするストア
+
+    ファイルはウィンドウ名ごとに 1 つで、初めて load() された時にだけ読みます。
+    """
+
+    def __init__(self) -> None:
+        self.state_dir: Optional[str] = None
+        self._states: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._stats: Dict[str, int] = {'reads': 0, 'writes': 0, 'bytes_written': 0}
+
+    def directory(self) -> str:
+        """
+        保存先のフォルダを返します
+
+        state_dir、環境変数 PYSIDE_TEMPLATE_STATE_DIR、MAYA_APP_DIR/pyside_template_window、
+        一時フォルダの順に使います。
+        """
+        if self.state_dir:
+            return self.state_dir
+        if os.environ.get(STATE_DIR_ENV):
+            return os.environ[STATE_DIR_ENV]
+        if os.environ.get('MAYA_APP_DIR'):
+            return os.path.join(os.environ['MAYA_APP_DIR'], 'pyside_template_window')
+        return os.path.join(tempfile.gettempdir(), 'pyside_template_window')
+
+    def path_for(self, name: str) -> str:
+        return os.path.join(self.directory(), f'{name}.state')
+
+    def load(self, name: str) -> Dict[str, Any]:
+        """
+        ウィンドウ名の状態を返します（返した辞書を変更しないでください）
+
+        メモリ上に無い場合はファイルから読みます。ファイルが無い・壊れている場合は空の辞書を返します。
+        """
+        with self._lock:
+            state = self._states.get(name)
+        if state is not None:
+            return state
+
+        state = {}
+        path = self.path_for(name)
+        if os.path.exists(path):
+            self._stats['reads'] += 1
+            try:
+                with open(path, 'rb') as f:
+                    data = json.loads(zlib.decompress(f.read()).decode('utf-8'))
+                if data.get('v') == FORMAT_VERSION:
+                    state = data.get('s', {})
+                else:
+                    logger.info('%s の形式のバージョンが異なるため読み込みません', path)
+            except (OSError, ValueError, zlib.error) as e:
+                logger.warning('UI の状態を読み込めませんでした: %s: %s', path, e)
+        with self._lock:
+            return self._states.setdefault(name, state)
+
+    def update(self, name: str, values: Dict[str, Any], write: bool = True) -> None:
+        """
+        ウィンドウ名の状態に values を反映し、write が True の場合はファイルに書き込みます
+        """
+        with self._lock:
+            state = dict(self._states.get(name, {}))
+            state.update(values)
+            self._states[name] = state
+        if write:
+            self.write(name)
+
+    def write(self, name: str) -> None:
+        """
+        メモリ上の状態をファイルに書き込みます
+
+        一時ファイルに書いてから置き換えるため、書き込み中に Maya が終了してもファイルは壊れません。
+        """
+        with self._lock:
+            state = self._states.get(name)
+        if state is None:
+            return
+        data = zlib.compress(json.dumps({'v': FORMAT_VERSION, 's': state}, separators=(',', ':')).encode('utf-8'))
+        path = self.path_for(name)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temp_path = f'{path}.tmp'
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.warning('UI の状態を書き込めませんでした: %s: %s', path, e)
+            return
+        self._stats['writes'] += 1
+        self._stats['bytes_written'] += len(data)
+
+    def forget(self, name: Optional[str] = None) -> None:
+        """
+        メモリ上の状態を破棄します（次の load() でファイルから読み直します）
+
+        Args:
+            name: ウィンドウ名。None の場合はすべて
+        """
+        with self._lock:
+            if name is None:
+                self._states.clear()
+            else:
+                self._states.pop(name, None)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        ファイルを読んだ回数・書いた回数・書いたバイト数を返します
+        """
+        return dict(self._stats)
+
+
+class UIState:
+    """
+    ウィンドウのウィジェットの状態を保存・復元するクラス
+
+    PySideTemplateWindow.ui_state として使います。書き込み用のタイマーは初めて bind() された時に作ります。
+    """
+
+    def __init__(self, name: str, parent: QObject, store: Optional[StateStore] = None) -> None:
+        """
+        Args:
+            name: 保存に使う名前（ウィンドウ名）
+            parent: タイマーの親
+            store: 状態を保持するストア（None の場合は state_store）
+        """
+        self.name = name
+        self._parent = parent
+        self._store = store
+        self._bindings: Dict[str, Tuple[Any, Callable[[], Any]]] = {}
+        self._dirty: Dict[str, None] = {}
+        self._applying = False
+        self._last_change = 0.0
+        self._timer: Optional[QTimer] = None
+
+    @property
+    def store(self) -> StateStore:
+        return self._store if self._store is not None else state_store
+
+    def bind(
+        self,
+        key: str,
+        widget: Any,
+        getter: Optional[Callable[[], Any]] = None,
+        setter: Optional[Callable[[Any], None]] = None,
+        signals: Optional[List[Any]] = None,
+    ) -> None:
+        """
+        ウィジェットを登録し、保存されている状態があれば適用します
+
+        ADAPTERS に無いウィジェットは getter / setter / signals を指定してください。
+
+        Args:
+            key: ウィンドウ内で一意のキー
+            widget: 状態を保存するウィジェット
+            getter: JSON にできる値を返す関数
+            setter: getter が返した値を適用する関数
+            signals: 変更を通知するシグナル
+
+        Raises:
+            ValueError: 対応していないウィジェットで getter / setter / signals が指定されていない場合
+        """
+        adapter = find_adapter(widget)
+        if getter is None or setter is None or signals is None:
+            if adapter is None:
+                raise ValueError(f'{type(widget).__name__} には getter / setter / signals を指定してください: {key!r}')
+            getter = getter or functools.partial(adapter.get, widget)
+            setter = setter or functools.partial(adapter.set, widget)
+            signals = signals if signals is not None else adapter.signals(widget)
+
+        self._bindings[key] = (widget, getter)
+        value = self.store.load(self.name).get(key)
+        if value is not None:
+            self._applying = True
+            try:
+                setter(value)
+            except Exception:
+                logger.warning('UI の状態を適用できませんでした: %s.%s', self.name, key, exc_info=True)
+            finally:
+                self._applying = False
+
+        notify = functools.partial(self._on_changed, key)
+        for signal in signals:
+            signal.connect(notify)
+
+    def unbind(self, key: str) -> None:
+        """
+        ウィジェットの登録を解除します（保存されている状態は残ります）
+        """
+        self._bindings.pop(key, None)
+        self._dirty.pop(key, None)
+
+    def keys(self) -> List[str]:
+        return list(self._bindings)
+
+    def is_dirty(self) -> bool:
+        return bool(self._dirty)
+
+    def flush(self) -> None:
+        """
+        変更があれば、待たずに状態を取得して書き込みます
+
+        restart() / close() などでウィンドウを破棄する前に PySideTemplateWindow.shutdown() から呼ばれます。
+        """
+        if self._timer is not None and _qt.is_valid(self._timer):
+            self._timer.stop()
+        self._save()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        登録されているすべてのウィジェットの現在の状態を返します
+        """
+        return {key: getter() for key, (widget, getter) in self._bindings.items() if _qt.is_valid(widget) is not False}
+
+    def _on_changed(self, key: str, *args: Any) -> None:
+        if self._applying or key not in self._bindings:
+            return
+        waiting = bool(self._dirty)
+        self._dirty[key] = None
+        self._last_change = time.perf_counter()
+        if self._timer is None:
+            self._timer = QTimer(self._parent)
+            self._timer.setSingleShot(True)
+            self._timer.setInterval(SAVE_DELAY_MS)
+            self._timer.timeout.connect(self._on_timeout)
+        # PySide6 6.12（Python 3.11）では戻り値の無い Qt の呼び出しのたびに None の参照カウントが減るため、
+        # 変更のたびにタイマーを開始し直さず、書き込みを待っていない時だけ開始する
+        if not waiting:
+            self._timer.start()
+
+    def _on_timeout(self) -> None:
+        if not self._dirty:
+            return
+        # 変更が続いている間は、最後の変更から SAVE_DELAY_MS 経つまで別の単発タイマーで書き込みを先送りする
+        remaining_ms = SAVE_DELAY_MS - (time.perf_counter() - self._last_change) * 1000
+        if remaining_ms >= 1:
+            QTimer.singleShot(int(remaining_ms), self._on_timeout)
+            return
+        self._save()
+
+    def _save(self) -> None:
+        if not self._dirty:
+            return
+        keys = list(self._dirty)
+        self._dirty.clear()
+        with profiling.span('ui_state.save'):
+            values: Dict[str, Any] = {}
+            for key in keys:
+                binding = self._bindings.get(key)
+                if binding is None or _qt.is_valid(binding[0]) is False:
+                    continue
+                try:
+                    values[key] = binding[1]()
+                except Exception:
+                    logger.warning('UI の状態を取得できませんでした: %s.%s', self.name, key, exc_info=True)
+            self.store.update(self.name, values)
+        logger.debug('%s(): %s の %d 件の状態を保存しました', self._save.__name__, self.name, len(values))
+
+
+# reloader でこのモジュールがリロードされてもメモリ上の状態を引き継ぐ
+_previous_store = globals().get('state_store')
+state_store: StateStore = _previous_store if _previous_store is not None else StateStore()
@@ -3,22 +3,34 @@ Maya UI 操作のためのユーティリティ関数集
 
 このモジュールには、Maya のポインタ操作、型安全性、UI 関連の
 共通機能をまとめています。
-"""
 
-from typing import NewType, Optional, Type, TypeVar
+コントロール名から取得したポインタと wrapInstance() の結果はキャッシュされます。
+キャッシュは対象の QObject.destroyed シグナルで自動的に破棄されるため、
+削除済みのコントロールのポインタを返すことはありません。
+"""
 
-from maya import OpenMayaUI as omui
+import functools
+from typing import Dict, NewType, Optional, Tuple, Type, TypeVar
 
-try:
-    from shiboken6 import wrapInstance  # type: ignore
-except ImportError:
-    from shiboken2 import wrapInstance  # type: ignore
+from . import _qt, host, profiling
 
 # Maya 専用型の定義
 MayaPointer = NewType('MayaPointer', int)
 
 T = TypeVar('T')
 
+# コントロール名 → (ポインタ, destroyed を監視するための QObject ラッパー)
+_pointer_cache: Dict[str, Tuple[MayaPointer, object]] = {}
+# (ポインタ, ラップした型) → ラップ済みインスタンス
+_wrapper_cache: Dict[Tuple[MayaPointer, type], object] = {}
+_cache_stats: Dict[str, int] = {
+    'pointer_hits': 0,
+    'pointer_misses': 0,
+    'wrapper_hits': 0,
+    'wrapper_misses': 0,
+    'evictions': 0,
+}
+
 
 def get_maya_control_pointer(control_name: str) -> Optional[MayaPointer]:
     """型安全な Maya コントロールのポインタを取得する
@@ -26,16 +38,34 @@ def get_maya_control_pointer(control_name: str) -> Optional[MayaPointer]:
     指定されたコントロール名から Maya の UI ポインタを安全に取得します。
     無効なポインタの場合は None を返します。
 
+    取得したポインタはコントロールが破棄されるまでキャッシュされます。
+    見つからなかった結果はキャッシュしません。
+
     Args:
         control_name (str): Maya コントロール名
 
     Returns:
         Optional[MayaPointer]: 有効なポインタまたは None
     """
-    ptr = omui.MQtUtil.findControl(control_name)
-    if _is_valid_maya_pointer(ptr):
-        return MayaPointer(int(ptr))
-    return None
+    cached = _pointer_cache.get(control_name)
+    if cached is not None:
+        if _qt.is_valid(cached[1]):
+            _cache_stats['pointer_hits'] += 1
+            return cached[0]
+        # シグナルがブロックされていて destroyed を受け取れなかった場合の保険
+        _on_control_destroyed(control_name, cached[0])
+
+    _cache_stats['pointer_misses'] += 1
+    ptr = host.get_host().find_control(control_name)
+    if _is_valid_maya_pointer(ptr) is False:
+        return None
+
+    maya_ptr = MayaPointer(int(ptr))
+    QObject = _qt.import_qt_module('QtCore').QObject
+    watcher = _qt.wrap_instance(maya_ptr, QObject)
+    watcher.destroyed.connect(functools.partial(_on_control_destroyed, control_name, maya_ptr))
+    _pointer_cache[control_name] = (maya_ptr, watcher)
+    return maya_ptr
 
 
 def safe_wrap_instance(ptr: MayaPointer, widget_type: Type[T]) -> T:
@@ -58,11 +88,57 @@ def safe_wrap_instance(ptr: MayaPointer, widget_type: Type[T]) -> T:
     if isinstance(widget_type, type) is False:
         raise TypeError(f'widget_type はクラスである必要があります。{type(widget_type).__name__} が渡されました')
 
+    key = (ptr, widget_type)
+    cached = _wrapper_cache.get(key)
+    if cached is not None:
+        if _qt.is_valid(cached):
+            _cache_stats['wrapper_hits'] += 1
+            return cached  # type: ignore[return-value]
+        _evict_pointer(ptr)
+
+    _cache_stats['wrapper_misses'] += 1
     try:
-        return wrapInstance(ptr, widget_type)
+        wrapper = _qt.wrap_instance(ptr, widget_type)
     except Exception as e:
         raise RuntimeError(f'Maya ウィジェットのラップに失敗しました: {e}') from e
 
+    destroyed = getattr(wrapper, 'destroyed', None)
+    if destroyed is not None:
+        destroyed.connect(functools.partial(_on_wrapper_destroyed, ptr))
+    _wrapper_cache[key] = wrapper
+    return wrapper
+
+
+def get_control_cache_stats() -> Dict[str, int]:
+    """コントロールキャッシュの統計を取得する
+
+    Returns:
+        Dict[str, int]: ヒット数・ミス数・破棄数と、現在のキャッシュ件数
+    """
+    stats = dict(_cache_stats)
+    stats['pointer_entries'] = len(_pointer_cache)
+    stats['wrapper_entries'] = len(_wrapper_cache)
+    return stats
+
+
+def clear_control_cache(control_name: Optional[str] = None) -> None:
+    """コントロールキャッシュを破棄する
+
+    通常は destroyed シグナルで自動的に破棄されるため呼ぶ必要はありません。
+
+    Args:
+        control_name (Optional[str]): 破棄するコントロール名。None の場合はすべて破棄します
+    """
+    if control_name is None:
+        _cache_stats['evictions'] += len(_pointer_cache) + len(_wrapper_cache)
+        _pointer_cache.clear()
+        _wrapper_cache.clear()
+        return
+
+    cached = _pointer_cache.get(control_name)
+    if cached is not None:
+        _on_control_destroyed(control_name, cached[0])
+
 
 def attach_window_to_workspace_control(window_name: str, workspace_control_name: str) -> None:
     """ウィンドウを WorkspaceControl にアタッチする（名前版）
@@ -84,7 +160,8 @@ def attach_window_to_workspace_control(window_name: str, workspace_control_name:
     wsc_ptr_valid = wsc_ptr is not None
 
     if window_ptr_valid and wsc_ptr_valid:
-        _add_widget_to_workspace_control(window_ptr, wsc_ptr)
+        with profiling.span('utils.add_widget_to_workspace_control'):
+            _add_widget_to_workspace_control(window_ptr, wsc_ptr)
     else:
         if window_ptr_valid is False:
             raise RuntimeError(f'{window_name} のポインタの取得に失敗しました')
@@ -106,7 +183,7 @@ def _add_widget_to_workspace_control(window_ptr: MayaPointer, workspace_ptr: May
         RuntimeError: レイアウト追加に失敗した場合
     """
     try:
-        omui.MQtUtil.addWidgetToMayaLayout(window_ptr, workspace_ptr)
+        host.get_host().add_widget_to_maya_layout(window_ptr, workspace_ptr)
     except Exception as e:
         raise RuntimeError(f'WorkspaceControl への追加に失敗: {e}') from e
 
@@ -132,3 +209,26 @@ def _is_valid_maya_pointer(ptr: object) -> bool:
         return int_ptr > 0
     except (ValueError, TypeError):
         return False
+
+
+def _on_control_destroyed(control_name: str, ptr: MayaPointer, *args) -> None:
+    """コントロールの破棄時にキャッシュから取り除く
+
+    同名のコントロールが再作成されている場合は、新しいポインタのキャッシュを残します。
+    """
+    cached = _pointer_cache.get(control_name)
+    if cached is not None and cached[0] == ptr:
+        del _pointer_cache[control_name]
+        _cache_stats['evictions'] += 1
+    _evict_pointer(ptr)
+
+
+def _on_wrapper_destroyed(ptr: MayaPointer, *args) -> None:
+    _evict_pointer(ptr)
+
+
+def _evict_pointer(ptr: MayaPointer) -> None:
+    """指定したポインタのラップ済みインスタンスをキャッシュから取り除く"""
+    for key in [key for key in _wrapper_cache if key[0] == ptr]:
+        del _wrapper_cache[key]
+        _cache_stats['evictions'] += 1
@@ -1,19 +1,54 @@
+import functools
 import inspect
 import logging
-from typing import ClassVar, Optional
-
-from maya import cmds
+import re
+import sys
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 try:
+    from PySide6.QtCore import Qt  # type: ignore
     from PySide6.QtGui import QAction  # type: ignore
-    from PySide6.QtWidgets import QMainWindow, QPushButton, QWidget  # type: ignore
+    from PySide6.QtWidgets import (  # type: ignore
+        QMainWindow,
+        QPushButton,
+        QVBoxLayout,
+        QWidget,
+    )
 except ImportError:
+    from PySide2.QtCore import Qt  # type: ignore
     from PySide2.QtWidgets import QAction  # type: ignore
-    from PySide2.QtWidgets import QMainWindow, QPushButton, QWidget  # type: ignore
+    from PySide2.QtWidgets import (  # type: ignore
+        QMainWindow,
+        QPushButton,
+        QVBoxLayout,
+        QWidget,
+    )
 
-from . import utils
+from . import profiling, scene_events, utils, window_config
 from ._metadata import __version__
 from .app import restart, restore
+from .registry import window_registry
+from .workspace_control import command_counter, get_workspace_control
+
+# restore の uiScript からも import されるため、asyncio を読み込む async_tasks などの機能は使う時に import する
+if TYPE_CHECKING:
+    from .async_tasks import AsyncRunner
+    from .data_panel import DataPanel
+    from .tasks import TaskContext, TaskRunner
+    from .ui_batch import UpdateBatch
+    from .ui_state import UIState
 
 logger = logging.getLogger(__name__)
 
@@ -28,17 +63,26 @@ class PySideTemplateWindow(QMainWindow):
         このクラスは MayaQWidgetDockableMixin を使用せず、Qt の仮想メソッドのオーバーライドを利用して
         同等の機能を実現しています。setVisible() をオーバーライドすることで、wrapInstance() でラップした
         QMainWindow オブジェクトに対しても show() の動作を制御できるようにしています。
+
+    UI の構築は 2 段階で行います:
+        1. _init_ui(): __init__ 内で呼ばれ、メニューバーや空のセントラルウィジェットなど軽量な部分を構築します
+        2. _init_content(): 初めて実際に表示された時（showEvent）に呼ばれ、重いウィジェットを構築します
+        背面のタブにドッキングされたまま一度も表示されないウィンドウは 2 段階目のコストを払いません。
+
+    インスタンス ID を指定すると、同じツールのウィンドウを複数同時に開けます（アセットやショットごとなど）。
+    ウィンドウ名と WorkspaceControl 名はインスタンス ID から names_for() で導出されます。
     """
 
-    NAME: ClassVar[str] = 'PySideTemplate'
-    WORKSPACE_CONTROL_NAME: ClassVar[str] = f'{NAME}WorkspaceControl'
+    # 名前と遅延 restore の設定は、restore が window を読み込まずに参照できるよう window_config にあります
+    NAME: ClassVar[str] = window_config.NAME
+    WORKSPACE_CONTROL_NAME: ClassVar[str] = window_config.WORKSPACE_CONTROL_NAME
     _TITLE: ClassVar[str] = f'PySide Template v{__version__}'
-    _instance: ClassVar[Optional['PySideTemplateWindow']] = None
 
-    def __init__(self, parent: Optional[QWidget] = None, *args, **kwargs) -> None:
+    def __init__(self, parent: Optional[QWidget] = None, *args, instance_id: Optional[str] = None, **kwargs) -> None:
         """
         Args:
             parent: 親ウィジェット（通常は None で問題ありません）
+            instance_id: インスタンス ID（None の場合は既定のインスタンス）
 
         Note:
             一般的な PySide ウィンドウでは Maya のメインウィンドウを親に設定しますが、
@@ -46,8 +90,9 @@ class PySideTemplateWindow(QMainWindow):
             WorkspaceControl が適切に親子関係を管理するため、Maya 終了時にウィンドウも
             正しく閉じられ、restore 機能も正常に動作します。
 
-            インスタンスは _instance クラス変数で保持され GC から保護されます。
-            以下のタイミングで GC の影響を受ける可能性があります：
+            インスタンスは registry.window_registry に強参照で保持され GC から保護されます。
+            C++ オブジェクトが破棄される（WorkspaceControl が削除される）と destroyed シグナルで解放されます。
+            レジストリで保護しない場合、以下のタイミングで GC の影響を受けます：
             1. restore 時: omui.MQtUtil.addWidgetToMayaLayout() は C++ 側でレイアウトに
                追加するのみで Python インスタンスへの参照を保持しないため GC されます
             2. restart 時: Qt のシグナル接続が self への参照を保持しない場合に GC されます
@@ -56,9 +101,132 @@ class PySideTemplateWindow(QMainWindow):
                する場合は window インスタンスへの参照が存在せず restart 直後に GC されます
         """
         super().__init__(parent=parent, *args, **kwargs)
-        PySideTemplateWindow._instance = self
-        self.setObjectName(PySideTemplateWindow.NAME)
+        self.instance_id = instance_id
+        self.name, self.workspace_control_name = self.names_for(instance_id)
+        window_registry.register(instance_id, self)
+        # 接続先は self を参照しない partial にして、接続がインスタンスを延命させないようにする
+        self.destroyed.connect(functools.partial(_release_instance, instance_id, id(self)))
+        self.setObjectName(self.name)
+        # tasks / async_tasks / ui_state は初めて参照された時に作ります
+        self._tasks: Optional['TaskRunner'] = None
+        self._async_tasks: Optional['AsyncRunner'] = None
+        self._ui_state: Optional['UIState'] = None
+        self._content_layout: Optional[QVBoxLayout] = None
+        self._content_built = False
+        self._data_panel: Optional['DataPanel'] = None
+        self._subscriptions: List[scene_events.Subscription] = []
+        self._log_dock: Optional[QWidget] = None
+        self._ui_timings: Dict[str, float] = {}
+
+        start = time.perf_counter()
         self._init_ui()
+        self._ui_timings['shell_ms'] = (time.perf_counter() - start) * 1000
+
+    @classmethod
+    def names_for(cls, instance_id: Optional[str]) -> Tuple[str, str]:
+        """
+        インスタンス ID からウィンドウ名と WorkspaceControl 名を導出します
+
+        Args:
+            instance_id (Optional[str]): インスタンス ID（None の場合は既定のインスタンス）
+
+        Returns:
+            Tuple[str, str]: (ウィンドウ名, WorkspaceControl 名)
+
+        Raises:
+            ValueError: インスタンス ID が Maya のコントロール名に使えない文字を含む場合
+        """
+        return window_config.names_for(instance_id, cls.NAME)
+
+    @property
+    def title(self) -> str:
+        """
+        WorkspaceControl に表示するタイトル
+        """
+        if self.instance_id is None:
+            return PySideTemplateWindow._TITLE
+        return f'{PySideTemplateWindow._TITLE} - {self.instance_id}'
+
+    @property
+    def ui_timings(self) -> Dict[str, float]:
+        """
+        UI 構築の各段階にかかった時間（ミリ秒）を返します
+
+        'shell_ms' は _init_ui()、'content_ms' は _init_content() の時間です。
+        'content_ms' が無い場合、コンテンツはまだ構築されていません。
+        """
+        return dict(self._ui_timings)
+
+    @property
+    def tasks(self) -> 'TaskRunner':
+        """
+        バックグラウンドタスクの実行器
+
+        時間のかかる処理は self.tasks.submit() でバックグラウンドスレッドに逃がしてください。
+        """
+        if self._tasks is None:
+            from .tasks import TaskRunner
+
+            self._tasks = TaskRunner(self)
+        return self._tasks
+
+    @property
+    def async_tasks(self) -> 'AsyncRunner':
+        """
+        コルーチンの実行器
+
+        I/O を待つ処理は async def で書いて self.async_tasks.run() または slot() で実行できます。
+        """
+        if self._async_tasks is None:
+            from .async_tasks import AsyncRunner
+
+            self._async_tasks = AsyncRunner()
+            # WorkspaceControl の削除などで C++ オブジェクトが破棄された場合もコルーチンをキャンセルする
+            self.destroyed.connect(self._async_tasks.cancel_all)
+        return self._async_tasks
+
+    @property
+    def ui_state(self) -> 'UIState':
+        """
+        UI の状態の保存
+
+        ウィジェットの状態は self.ui_state.bind() で登録すると restart や restore の後に復元されます。
+        """
+        if self._ui_state is None:
+            from .ui_state import UIState
+
+            self._ui_state = UIState(self.name, self)
+        return self._ui_state
+
+    @property
+    def data_panel(self) -> 'DataPanel':
+        """
+        大量のデータを表示するパネル
+
+        テーブルビューは QObject の数が多く起動時間に影響するため、初めて参照された時に構築します。
+        フィルター・ソートは self.tasks で実行されるため、restart や close でキャンセルされます。
+        """
+        if self._data_panel is None:
+            from .data_panel import Column, DataPanel
+
+            self._ensure_content()
+            self._data_panel = DataPanel(
+                [
+                    Column('Name', lambda path: path.rsplit('|', 1)[-1]),
+                    Column('Path', str),
+                    Column('Depth', lambda path: path.count('|')),
+                ],
+                parent=self,
+                tasks=self.tasks,
+            )
+            self._content_layout.addWidget(self._data_panel)
+            header = self._data_panel.view.horizontalHeader()
+            self.ui_state.bind('data_panel.columns', header)
+            self.ui_state.bind('data_panel.filter', self._data_panel.filter_edit)
+            # 復元したソートの表示に合わせてソートする
+            if header.sortIndicatorSection() >= 0:
+                self._data_panel.sort_by(header.sortIndicatorSection(), header.sortIndicatorOrder())
+        return self._data_panel
 
     def show(self) -> None:
         """
@@ -71,29 +239,34 @@ class PySideTemplateWindow(QMainWindow):
             - 初回作成時: start() → _create() → show()
             - 再表示時: start() → QMainWindow.show() → setVisible() → show()
             - 再起動時: restart() → _create() → show()
-            - 復元時: restore() → omui.MQtUtil.addWidgetToMayaLayout() → show()
-        """
-        wsc_name = PySideTemplateWindow.WORKSPACE_CONTROL_NAME
-        wsc_exists = cmds.workspaceControl(wsc_name, q=True, exists=True)
-        if wsc_exists:
-            # 再表示時と復元時に通る
-            # wsc もウィンドウも存在するが非表示になっている場合
-            logger.debug(f'{self.show.__name__}(): WorkspaceControl が存在 → 再表示')
-
-            # override した show() 内で self.setVisible() や super().setVisible() を呼ぶと
-            # 無限ループするため、QWidget.setVisible()を直接呼び出す
-            QWidget.setVisible(self, True)
-            cmds.workspaceControl(wsc_name, e=True, restore=True)
-        else:
-            logger.debug(f'{self.show.__name__}(): WorkspaceControl が存在しない → 新規作成')
-            self._create_workspace_control()
-            utils.attach_window_to_workspace_control(
-                PySideTemplateWindow.NAME, PySideTemplateWindow.WORKSPACE_CONTROL_NAME
-            )
+            - 復元時: restore() → restore_scheduler → omui.MQtUtil.addWidgetToMayaLayout() → show()
+
+            WorkspaceControl へのコマンドは batch() でまとめ、メソッドを抜ける時に 1 回だけ発行します。
+            新規作成時は作成時に label を設定済みのため、label の編集は発行されません。
+        """
+        wsc = get_workspace_control(self.workspace_control_name)
+        with profiling.span('window.show'), command_counter.track('show'), wsc.batch():
+            if wsc.exists():
+                # 再表示時と復元時に通る
+                # wsc もウィンドウも存在するが非表示になっている場合
+                logger.debug('%s(): WorkspaceControl が存在 → 再表示', self.show.__name__)
+
+                # override した show() 内で self.setVisible() や super().setVisible() を呼ぶと
+                # 無限ループするため、QWidget.setVisible()を直接呼び出す
+                QWidget.setVisible(self, True)
+                wsc.edit(restore=True)
+            else:
+                logger.debug('%s(): WorkspaceControl が存在しない → 新規作成', self.show.__name__)
+                self._create_workspace_control()
+                utils.attach_window_to_workspace_control(self.name, self.workspace_control_name)
 
-        # すべてのケースで最新のタイトルを設定
-        # WorkspaceControl の label を設定すれば十分で、setWindowTitle() は不要
-        cmds.workspaceControl(wsc_name, e=True, label=PySideTemplateWindow._TITLE)
+            # すべてのケースで最新のタイトルを設定（既に同じ label の場合は発行されない）
+            # WorkspaceControl の label を設定すれば十分で、setWindowTitle() は不要
+            wsc.edit(label=self.title, closeCommand=self._close_command())
+
+        # 閉じられた時に解除したシーンのイベントのコールバックを登録し直す
+        for subscription in self._subscriptions:
+            subscription.resume()
 
     def setVisible(self, visible: bool) -> None:
         """
@@ -115,46 +288,288 @@ class PySideTemplateWindow(QMainWindow):
             再表示処理を行います。
         """
         if visible:
-            logger.debug(f'{self.setVisible.__name__}(True): show() を呼びます')
+            logger.debug('%s(True): show() を呼びます', self.setVisible.__name__)
             self.show()
         else:
-            logger.debug(f'{self.setVisible.__name__}(False): ウィンドウを非表示にします')
+            logger.debug('%s(False): ウィンドウを非表示にします', self.setVisible.__name__)
             QWidget.setVisible(self, False)
 
+    def shutdown(self) -> None:
+        """
+        実行中の処理を停止します
+
+        WorkspaceControl が閉じられた時と、restart() / close() で WorkspaceControl を削除する前に呼ばれます。
+        バックグラウンドタスクなどウィンドウが持つ処理を止める場合はこのメソッドに追加してください。
+        """
+        logger.debug('%s(): %s の処理を停止します', self.shutdown.__name__, self.name)
+        # タスクの終了は一定時間だけ待ち、ウィンドウの破棄で Maya のメインスレッドを止めないようにする
+        if self._tasks is not None:
+            self._tasks.shutdown()
+        if self._async_tasks is not None:
+            self._async_tasks.cancel_all()
+        # 書き込みを待っている UI の状態をウィンドウが破棄される前に保存する
+        if self._ui_state is not None:
+            self._ui_state.flush()
+        # 次に show() されるまでシーンのイベントを受け取らない
+        for subscription in self._subscriptions:
+            subscription.pause()
+
+    def subscribe(
+        self,
+        events: Union[str, Iterable[str]],
+        callback: Callable[[], Any],
+        policy: str = scene_events.DEBOUNCE,
+        interval_ms: int = scene_events.DEFAULT_INTERVAL_MS,
+    ) -> scene_events.Subscription:
+        """
+        シーンのイベントを購読します
+
+        イベントの連続はまとめられ、callback は policy と interval_ms に従って 1 回だけ呼ばれます。
+        WorkspaceControl が閉じられた時と restart() / close() の時にコールバックは解除され、
+        再び show() された時に登録し直されます。
+
+        Args:
+            events: scene_events.SELECTION_CHANGED / DAG_CHANGED / SCENE_OPENED、またはそのリスト
+            callback: 引数なしで呼ばれる関数
+            policy: scene_events.DEBOUNCE または scene_events.THROTTLE
+            interval_ms: まとめる間隔（ミリ秒）。0 の場合はイベントループの次の周回で呼ばれます
+
+        Returns:
+            scene_events.Subscription: unsubscribe() に渡す購読
+        """
+        subscription = scene_events.Subscription(events, callback, policy, interval_ms, self)
+        self._subscriptions.append(subscription)
+        subscription.resume()
+        return subscription
+
+    def unsubscribe(self, subscription: scene_events.Subscription) -> None:
+        """
+        シーンのイベントの購読をやめます
+        """
+        subscription.pause()
+        if subscription in self._subscriptions:
+            self._subscriptions.remove(subscription)
+
+    def batch_update(self, widget: Optional[QWidget] = None, block_signals: bool = True) -> 'UpdateBatch':
+        """
+        ウィジェット以下を一括更新するコンテキストマネージャーを返します
+
+        ブロックの間は再描画・レイアウト・シグナルを止め、抜ける時にレイアウトと再描画を 1 回だけ行います。
+        ウィジェットを大量に追加・削除する場合や、テキストやモデルをまとめて更新する場合に使ってください。
+
+        Args:
+            widget: 一括更新するウィジェット（None の場合はセントラルウィジェット）
+            block_signals: レイアウトに配置されたウィジェットのシグナルをブロックするか
+
+        Returns:
+            UpdateBatch: ブロックを抜けた後に stats() で省略した再描画とレイアウトの回数を取得できます
+
+        使用例:
+            with self.batch_update() as batch:
+                for asset in assets:
+                    layout.addWidget(AssetWidget(asset))
+        """
+        from .ui_batch import UpdateBatch
+
+        return UpdateBatch(widget if widget is not None else self.centralWidget(), block_signals)
+
+    def showEvent(self, event) -> None:
+        """
+        初めて実際に表示された時にコンテンツを構築します
+
+        setVisible(True) → show() → QWidget.setVisible() の経路で表示されると呼ばれます。
+        背面のタブにドッキングされている場合は、タブが選択されるまで呼ばれません。
+        """
+        self._ensure_content()
+        super().showEvent(event)
+
+    def build_content(self) -> None:
+        """
+        表示を待たずにコンテンツを構築します
+
+        app.warm_pool が非表示のままウィンドウを事前構築する時に使います。構築済みの場合は何もしません。
+        """
+        self._ensure_content()
+
+    def _ensure_content(self) -> None:
+        """
+        コンテンツが未構築であれば _init_content() を呼びます
+        """
+        if self._content_built:
+            return
+        self._content_built = True
+
+        start = time.perf_counter()
+        with profiling.span('window.init_content'):
+            self._init_content(self._content_layout)
+        self._ui_timings['content_ms'] = (time.perf_counter() - start) * 1000
+        logger.debug(
+            '%s(): コンテンツを構築しました（shell %.1f ms / content %.1f ms）',
+            self._ensure_content.__name__,
+            self._ui_timings['shell_ms'],
+            self._ui_timings['content_ms'],
+        )
+
     def _create_workspace_control(self) -> None:
         """
         WorkspaceControl を作成します
 
         Maya の restore 機能に対応した WorkspaceControl を作成します
         """
-        wsc_name = PySideTemplateWindow.WORKSPACE_CONTROL_NAME
-        restore_script = inspect.getsource(restore)
+        with profiling.span('window.create_workspace_control'):
+            wsc = get_workspace_control(self.workspace_control_name)
+            restore_script = inspect.getsource(restore)
+            if self.instance_id is not None:
+                # uiScript として実行された時に、このインスタンスを restore するように書き換える
+                restore_script = _RESTORE_INSTANCE_ID_PATTERN.sub(
+                    f'INSTANCE_ID: Optional[str] = {self.instance_id!r}', restore_script, count=1
+                )
 
-        # restore_script を発火させないように uiScript は空文字列を渡す
-        cmds.workspaceControl(wsc_name, label=PySideTemplateWindow._TITLE, uiScript='')
-        # restore_script を発火させないように e=True で設定する
-        cmds.workspaceControl(wsc_name, e=True, uiScript=restore_script)
+            # restore_script を発火させないように uiScript は空文字列を渡す
+            wsc.create(label=self.title, uiScript='', closeCommand=self._close_command())
+            # restore_script を発火させないように e=True で設定する
+            # show() の batch() 内で呼ばれた場合は、show() の他の編集とまとめて発行される
+            wsc.edit(uiScript=restore_script)
+
+    def _close_command(self) -> str:
+        """
+        WorkspaceControl が閉じられた時に shutdown() を呼ぶスクリプトを返します
+        """
+        return f'import {__package__}.app.main as _main; _main.on_workspace_control_closed({self.instance_id!r})'
 
     def _init_ui(self) -> None:
         """
-        UI の初期化を行います。
+        UI の初期化（1 段階目）を行います。
 
-        UI をカスタマイズする場合はこのメソッドを編集してください。
+        __init__ 内で呼ばれます。メニューバーや空のセントラルウィジェットなど、
+        すぐに必要で軽量な部分のみを構築してください。
+        重いウィジェットは _init_content() で構築します。
         """
         # メニュー
         menu_bar = self.menuBar()
         dev_menu = menu_bar.addMenu('Dev')
         restart_action = QAction('Restart', self)
-        restart_action.triggered.connect(lambda *args: restart.restart_pyside_template_window())
+        instance_id = self.instance_id
+        restart_action.triggered.connect(lambda *args: restart.restart_pyside_template_window(instance_id))
         dev_menu.addAction(restart_action)
+        dev_menu.addSeparator()
+        profile_action = QAction('Profile Next Start/Restart', self)
+        profile_action.setCheckable(True)
+        profile_action.setChecked(profiling.is_profiler_armed())
+        profile_action.toggled.connect(lambda checked: profiling.arm_profiler(checked))
+        # 計測は 1 回で自動的に解除されるため、メニューを開くたびに合わせる
+        dev_menu.aboutToShow.connect(lambda: profile_action.setChecked(profiling.is_profiler_armed()))
+        dev_menu.addAction(profile_action)
+        record_action = QAction('Record Timings', self)
+        record_action.setCheckable(True)
+        record_action.setChecked(profiling.is_enabled())
+        record_action.toggled.connect(lambda checked: profiling.set_enabled(checked))
+        dev_menu.addAction(record_action)
+        leak_action = QAction('Track Leaks on Restart', self)
+        leak_action.setCheckable(True)
+        leak_action.setChecked(_is_leak_tracking_enabled())
+        leak_action.toggled.connect(_set_leak_tracking_enabled)
+        dev_menu.addAction(leak_action)
+        export_action = QAction('Export Timings', self)
+        export_action.triggered.connect(lambda *args: profiling.export_json())
+        dev_menu.addAction(export_action)
+        log_action = QAction('Log Panel', self)
+        log_action.setCheckable(True)
+        log_action.toggled.connect(self._set_log_panel_visible)
+        # ドックの☓で閉じられた場合に合わせる
+        dev_menu.aboutToShow.connect(
+            lambda: log_action.setChecked(self._log_dock is not None and self._log_dock.isVisible())
+        )
+        dev_menu.addAction(log_action)
+
+        # 空のセントラルウィジェット（中身は _init_content() で追加する）
+        central_widget = QWidget(self)
+        self._content_layout = QVBoxLayout(central_widget)
+        self._content_layout.setContentsMargins(0, 0, 0, 0)
+        self.setCentralWidget(central_widget)
 
+    def _init_content(self, layout: QVBoxLayout) -> None:
+        """
+        UI の初期化（2 段階目）を行います。
+
+        ウィンドウが初めて実際に表示された時に一度だけ呼ばれます。
+        UI をカスタマイズする場合は、重いウィジェットをこのメソッドで layout に追加してください。
+
+        Args:
+            layout (QVBoxLayout): セントラルウィジェットのレイアウト
+        """
         # ボタン
         push_button = QPushButton('PUSH ME', self)
-        push_button.clicked.connect(lambda *args: self._show_demo_message())
-        self.setCentralWidget(push_button)
+        push_button.clicked.connect(lambda *args: self._start_demo_task())
+        layout.addWidget(push_button)
+
+    def _set_log_panel_visible(self, visible: bool) -> None:
+        """
+        ログパネルを表示・非表示にします
+
+        ドックは初めて表示する時に構築します。setup_logging(log_panel=True) されていない場合は、
+        現在のログレベルのままログパネルのハンドラーを追加します。
+        """
+        if self._log_dock is None:
+            if not visible:
+                return
+            from . import log_handler
+            from .log_panel import LogDock
+
+            if log_handler.get_handler() is None:
+                log_handler.install(logging.getLogger(__package__))
+            self._log_dock = LogDock(self)
+            self.addDockWidget(Qt.BottomDockWidgetArea, self._log_dock)
+        self._log_dock.setVisible(visible)
 
-    def _show_demo_message(self) -> None:
+    def _start_demo_task(self) -> None:
         """
-        ダミーのメッセージを出力します
+        ダミーのタスクをバックグラウンドで実行します
+        """
+        self.tasks.submit(_demo_task, on_result=self._show_demo_rows)
+
+    def _show_demo_rows(self, rows: List[str]) -> None:
         """
-        logger.info('Hello, World!')
+        ダミーのデータをパネルに表示します
+        """
+        logger.info('%d 件のダミーデータを表示します', len(rows))
+        self.data_panel.set_items(rows)
+
+
+def _demo_task(context: 'TaskContext', count: int = 100000) -> List[str]:
+    """
+    ダミーの重い処理です（ワーカースレッドで実行されます）
+    """
+    rows: List[str] = []
+    for i in range(10):
+        context.raise_if_cancelled()
+        context.report_progress(i * 10)
+        rows.extend(f'|group{j // 1000}|pCube{j}' for j in range(i * count // 10, (i + 1) * count // 10))
+    return rows
+
+
+# app/restore.py の INSTANCE_ID を定義している行
+_RESTORE_INSTANCE_ID_PATTERN = re.compile(r'^INSTANCE_ID: Optional\[str\] = None$', re.MULTILINE)
+
+
+def _release_instance(instance_id: Optional[str], window_id: int, *args) -> None:
+    """
+    ウィンドウの C++ オブジェクトが破棄された時にレジストリの強参照を解放します
+
+    同じインスタンス ID で新しいウィンドウが登録済みの場合は解放しません。
+    """
+    window = window_registry.get(instance_id)
+    if window is not None and id(window) == window_id:
+        window_registry.release(instance_id)
+
+
+def _is_leak_tracking_enabled() -> bool:
+    # leak_tracker は有効にする時に初めて import するため、import されていなければ無効
+    leak_tracker = sys.modules.get(f'{__package__}.leak_tracker')
+    return leak_tracker is not None and leak_tracker.is_enabled()
+
+
+def _set_leak_tracking_enabled(enabled: bool) -> None:
+    from . import leak_tracker
+
+    leak_tracker.set_enabled(enabled)
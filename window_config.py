@@ -0,0 +1,42 @@
+"""
+ウィンドウの名前と restore の設定
+
+Maya 起動時に WorkspaceControl の uiScript から呼ばれる app.main.restore() は、このモジュールの定数だけで
+WorkspaceControl 名と遅延 restore の有無を決めます。遅延 restore ではプレースホルダーを追加するだけなので、
+window モジュール（と Qt のウィジェット）はウィンドウを構築する時まで読み込まれません。
+
+Qt を import しないため、ツールの名前や restore の動作を変える場合はこのモジュールを編集してください。
+PySideTemplateWindow.NAME と WORKSPACE_CONTROL_NAME はここの値を参照します。
+"""
+
+import re
+from typing import Optional, Tuple
+
+# ウィンドウ名（インスタンス ID を指定した場合は NAME_<インスタンス ID>）
+NAME = 'PySideTemplate'
+WORKSPACE_CONTROL_NAME = f'{NAME}WorkspaceControl'
+# True の場合、Maya 起動時の restore ではプレースホルダーのみを追加し、ウィンドウは表示後に構築します
+DEFERRED_RESTORE = True
+
+_INSTANCE_ID_PATTERN = re.compile(r'[A-Za-z0-9_]+')
+
+
+def names_for(instance_id: Optional[str], name: str = NAME) -> Tuple[str, str]:
+    """
+    インスタンス ID からウィンドウ名と WorkspaceControl 名を導出します
+
+    Args:
+        instance_id (Optional[str]): インスタンス ID（None の場合は既定のインスタンス）
+        name (str): ウィンドウ名
+
+    Returns:
+        Tuple[str, str]: (ウィンドウ名, WorkspaceControl 名)
+
+    Raises:
+        ValueError: インスタンス ID が Maya のコントロール名に使えない文字を含む場合
+    """
+    if instance_id is not None:
+        if _INSTANCE_ID_PATTERN.fullmatch(instance_id) is None:
+            raise ValueError(f'インスタンス ID には英数字とアンダースコアのみ使用できます: {instance_id!r}')
+        name = f'{name}_{instance_id}'
+    return name, f'{name}WorkspaceControl'
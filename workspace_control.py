@@ -0,0 +1,203 @@
+"""
+WorkspaceControl 操作のためのコマンドまとめ発行モジュール
+
+cmds.workspaceControl の呼び出しはそれぞれ Maya のコマンドエンジンを経由するため、
+show() のように何度も呼ばれる処理では呼び出し回数がそのままコストになります。
+
+このモジュールでは以下の方法でコマンド数を減らします:
+    - 存在確認は cmds ではなく utils.get_maya_control_pointer() のキャッシュで行う
+    - 前回設定した label などの状態を覚えておき、変化のない編集は発行しない
+    - batch() 内で積まれた編集フラグを 1 回の e=True コマンドにまとめて発行する
+
+CommandCounter により、start/restart/show などの経路ごとに実際に発行されたコマンド数を確認できます。
+"""
+
+import contextlib
+import logging
+from typing import Any, Dict, Iterator, List, Optional
+
+from . import host, utils
+from .utils import MayaPointer
+
+logger = logging.getLogger(__name__)
+
+
+class CommandCounter:
+    """
+    経路ごとに発行された Maya コマンドの数を数えるカウンター
+
+    track() はネストでき、内側で発行されたコマンドは外側の経路にも数えられます。
+    例: start() の中で呼ばれる show() のコマンドは 'show' と 'start' の両方に数えられます。
+    """
+
+    def __init__(self) -> None:
+        self._active: List[str] = []
+        self._current: Dict[str, int] = {}
+        self._last: Dict[str, int] = {}
+        self._total: Dict[str, int] = {}
+        self._calls: Dict[str, int] = {}
+
+    @contextlib.contextmanager
+    def track(self, path: str) -> Iterator[None]:
+        """
+        ブロック内で発行されたコマンドを path として数えます
+
+        Args:
+            path (str): 経路名（'start', 'show' など）
+        """
+        self._active.append(path)
+        self._current[path] = self._current.get(path, 0)
+        depth = self._active.count(path)
+        try:
+            yield
+        finally:
+            self._active.pop()
+            # 同じ経路が再入している場合は最も外側で確定させる
+            if depth == 1:
+                issued = self._current.pop(path)
+                self._last[path] = issued
+                self._total[path] = self._total.get(path, 0) + issued
+                self._calls[path] = self._calls.get(path, 0) + 1
+                logger.debug('%s: WorkspaceControl 関連のコマンドを %s 回発行しました', path, issued)
+
+    def record(self) -> None:
+        """
+        コマンドを 1 回発行したことを記録します
+        """
+        for path in set(self._active):
+            self._current[path] += 1
+
+    def last(self, path: str) -> Optional[int]:
+        """
+        path の直近の呼び出しで発行されたコマンド数を返します
+        """
+        return self._last.get(path)
+
+    def report(self) -> Dict[str, Dict[str, int]]:
+        """
+        経路ごとの直近・累計のコマンド数と呼び出し回数を返します
+        """
+        return {
+            path: {'last': self._last[path], 'total': self._total[path], 'calls': self._calls[path]}
+            for path in self._last
+        }
+
+    def reset(self) -> None:
+        self._last.clear()
+        self._total.clear()
+        self._calls.clear()
+
+
+command_counter = CommandCounter()
+
+
+class WorkspaceControlCommands:
+    """
+    1 つの WorkspaceControl に対するコマンドをまとめて発行するクラス
+
+    直近に発行・取得した状態を WorkspaceControl のポインタと紐付けて保持します。
+    WorkspaceControl が作り直された場合（ポインタが変わった場合）は状態を破棄します。
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._ptr: Optional[MayaPointer] = None
+        self._state: Dict[str, Any] = {}
+        self._pending: Dict[str, Any] = {}
+        self._batch_depth = 0
+
+    def exists(self) -> bool:
+        """
+        WorkspaceControl が存在するかを返します
+
+        cmds.workspaceControl(q=True, exists=True) の代わりにポインタのキャッシュを使うため、
+        コマンドは発行しません。
+        """
+        ptr = utils.get_maya_control_pointer(self.name)
+        if ptr != self._ptr:
+            self._ptr = ptr
+            self._state.clear()
+        return ptr is not None
+
+    def create(self, **flags: Any) -> None:
+        """
+        WorkspaceControl を作成します
+
+        作成時に渡したフラグは既知の状態として記録されます。
+        """
+        self._run(host.get_host().workspace_control, self.name, **flags)
+        self._ptr = utils.get_maya_control_pointer(self.name)
+        self._state = dict(flags)
+
+    def edit(self, **flags: Any) -> None:
+        """
+        編集フラグを積みます
+
+        既知の状態と同じ値のフラグは発行しません。
+        batch() の外で呼んだ場合はただちに発行します。
+        """
+        for flag, value in flags.items():
+            if flag in self._state and self._state[flag] == value and flag not in _ACTION_FLAGS:
+                continue
+            self._pending[flag] = value
+        if self._batch_depth == 0:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        積まれている編集フラグを 1 回のコマンドで発行します
+        """
+        if not self._pending:
+            return
+        flags, self._pending = self._pending, {}
+        self._run(host.get_host().workspace_control, self.name, e=True, **flags)
+        self._state.update((flag, value) for flag, value in flags.items() if flag not in _ACTION_FLAGS)
+
+    def delete(self) -> None:
+        """
+        WorkspaceControl を削除します
+        """
+        self._pending.clear()
+        self._state.clear()
+        self._ptr = None
+        self._run(host.get_host().delete_ui, self.name, control=True)
+
+    @contextlib.contextmanager
+    def batch(self) -> Iterator['WorkspaceControlCommands']:
+        """
+        ブロック内の edit() をまとめ、ブロックを抜ける時に 1 回だけ発行します
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.flush()
+
+    @staticmethod
+    def _run(command: Any, *args: Any, **kwargs: Any) -> Any:
+        command_counter.record()
+        return command(*args, **kwargs)
+
+
+# 状態ではなく動作を表すフラグ（同じ値でも毎回発行する必要がある）
+_ACTION_FLAGS = frozenset(['restore', 'r'])
+
+_controls: Dict[str, WorkspaceControlCommands] = {}
+
+
+def get_workspace_control(name: str) -> WorkspaceControlCommands:
+    """
+    WorkspaceControl 名に対応する WorkspaceControlCommands を取得します
+
+    Args:
+        name (str): WorkspaceControl の名前
+
+    Returns:
+        WorkspaceControlCommands: 名前ごとに共有されるインスタンス
+    """
+    control = _controls.get(name)
+    if control is None:
+        control = _controls[name] = WorkspaceControlCommands(name)
+    return control